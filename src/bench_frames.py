@@ -0,0 +1,83 @@
+"""Temps de frame de la scène de jeu pendant que l'IA réfléchit.
+
+La recherche tourne dans un thread (BackgroundTurn) : elle partage le GIL
+avec la boucle d'affichage. Ce script joue la boucle de main.py (update,
+draw, flip, tick) sur la vraie scène, d'abord au repos puis pendant des
+tours de l'IA, et compare les temps de frame à fps_limit.
+
+Exemple : python src/bench_frames.py --ai mcts --budget 500 --workers 1
+Sans pause (pour comparer) : ... --yield-ms 0
+"""
+import argparse
+import os
+import statistics
+import time
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mesure des FPS de la scène de jeu pendant la réflexion de l'IA.")
+    parser.add_argument("--ai", default=None, help="Mode d'IA (défaut : celui de config.json)")
+    parser.add_argument("--budget", type=int, default=None, help="Budget de réflexion en ms (défaut : config.json)")
+    parser.add_argument("--workers", type=int, default=None, help="Processus MCTS (défaut : config.json)")
+    parser.add_argument("--fps", type=int, default=None, help="Limite de FPS (défaut : config.json)")
+    parser.add_argument("--yield-ms", type=int, default=None, help="Pause du MCTS dans le thread (défaut : celle de la scène)")
+    parser.add_argument("--turns", type=int, default=5, help="Tours de l'IA mesurés")
+    parser.add_argument("--window", action="store_true", help="Ouvre une vraie fenêtre (défaut : sans affichage)")
+    return parser.parse_args()
+
+def summary(label, frames, fps_limit):
+    if not frames:
+        print(f"{label:<14}aucune frame : le tour est décidé avant la première")
+        return
+    times = sorted(t * 1000 for t in frames)
+    fps = 1000 / statistics.mean(times)
+    print(f"{label:<14}{len(times):>7}{statistics.median(times):>10.1f}{times[int(len(times) * 0.95)]:>8.1f}"
+          f"{times[-1]:>8.1f}{fps:>8.0f}  ({fps / fps_limit:.0%} de {fps_limit})")
+
+def main():
+    args = parse_args()
+    if not args.window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    import main as game_main
+    from engine.ai import create_ai
+    from engine.background import BackgroundTurn
+    from engine.parallel import shutdown_pools
+
+    game = game_main.Game()
+    overrides = {"ai_mode": args.ai, "ai_budget_ms": args.budget, "ai_workers": args.workers}
+    game.config.update({key: value for key, value in overrides.items() if value is not None})
+    if args.fps: game.fps_limit = args.fps
+    scene = game.states["game"]
+    scene.reset_game()
+    game.change_state("game")
+    if args.yield_ms is not None:
+        config = game.config
+        scene.ai = create_ai(config["ai_mode"], config["ai_budget_ms"], rng=scene.match.streams.get("ai:1"),
+                             workers=config["ai_workers"], yield_ms=args.yield_ms)
+
+    def frame():
+        started = time.perf_counter()
+        scene.update()
+        scene.draw()
+        pygame.display.flip()
+        game.clock.tick(game.fps_limit)
+        return time.perf_counter() - started
+
+    idle = [frame() for _ in range(120)]
+    thinking = []
+    for _ in range(args.turns):
+        # Réflexion seule : les actions ne sont pas rejouées sur la partie affichée
+        turn = BackgroundTurn(scene.ai, scene.match)
+        while turn.thread.is_alive():
+            thinking.append(frame())
+
+    print(f"IA {type(scene.ai).__name__}, budget {game.config['ai_budget_ms']} ms, limite {game.fps_limit} FPS")
+    print(f"{'':<14}{'Frames':>7}{'Médiane':>10}{'p95':>8}{'Max':>8}{'FPS':>8}")
+    summary("Au repos", idle, game.fps_limit)
+    summary("IA réfléchit", thinking, game.fps_limit)
+    shutdown_pools()
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from enum import Enum, auto
+from enum import Enum, IntFlag, auto
 
 class CardType(Enum):
     UNIT = "Unit"
@@ -23,16 +23,47 @@ class Rarity(Enum):
     MYTHICAL = 5
 
 
-class Keyword(Enum):
-    TAUNT = "Provocation"
-    CHARGE = "Charge"
-    DIVINE_SHIELD = "Bouclier Divin"
-    STEALTH = "Furtivité"
-    POISONOUS = "Toxique"
-    LIFESTEAL = "Vol de vie"
-    HEAL="Soins"
-    FORGE = "Forge" 
-    SACRIFICE = "Sacrifice"
-    BATTLECRY = "Cri de guerre"
-    DEATHRATTLE = "Râle d'agonie"
-    
+class Keyword(IntFlag):
+    """Compétences d'une unité, stockées en masque de bits (Keyword(0) = aucune)"""
+    TAUNT = auto()
+    CHARGE = auto()
+    DIVINE_SHIELD = auto()
+    STEALTH = auto()
+    POISONOUS = auto()
+    LIFESTEAL = auto()
+    HEAL = auto()
+    FORGE = auto()
+    SACRIFICE = auto()
+    BATTLECRY = auto()
+    DEATHRATTLE = auto()
+
+    @property
+    def label(self):
+        """Nom affiché (et utilisé dans cards.json)"""
+        return KEYWORD_LABELS.get(self, self.name)
+
+    @classmethod
+    def from_label(cls, label):
+        for k, text in KEYWORD_LABELS.items():
+            if text == label:
+                return k
+        return None
+
+    @classmethod
+    def split(cls, flags):
+        """Les compétences d'un masque, une par une, dans l'ordre de déclaration"""
+        return [k for k in cls if k & flags]
+
+KEYWORD_LABELS = {
+    Keyword.TAUNT: "Provocation",
+    Keyword.CHARGE: "Charge",
+    Keyword.DIVINE_SHIELD: "Bouclier Divin",
+    Keyword.STEALTH: "Furtivité",
+    Keyword.POISONOUS: "Toxique",
+    Keyword.LIFESTEAL: "Vol de vie",
+    Keyword.HEAL: "Soins",
+    Keyword.FORGE: "Forge",
+    Keyword.SACRIFICE: "Sacrifice",
+    Keyword.BATTLECRY: "Cri de guerre",
+    Keyword.DEATHRATTLE: "Râle d'agonie",
+}
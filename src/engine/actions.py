@@ -0,0 +1,29 @@
+from collections import namedtuple
+from enum import Enum
+
+# Slot spécial : la cible est le héros et non une unité du plateau
+HERO = -1
+
+class ActionType(Enum):
+    PLAY_UNIT = 0
+    PLAY_RITUAL = 1
+    ATTACK = 2
+    END_TURN = 3
+
+# Une action du camp actif. Tout est exprimé en index (main, plateau, camp)
+# pour qu'une action reste valable sur une copie de la partie.
+#   index       : index dans la main (PLAY_*) ou sur le plateau (ATTACK)
+#   target_side : 0 = joueur, 1 = adversaire
+#   target_slot : index sur le plateau du camp ciblé, ou HERO
+Action = namedtuple('Action', ['type', 'index', 'target_side', 'target_slot'], defaults=(-1, -1, HERO))
+
+def play_unit(index):
+    return Action(ActionType.PLAY_UNIT, index)
+
+def play_ritual(index, target_side, target_slot=HERO):
+    return Action(ActionType.PLAY_RITUAL, index, target_side, target_slot)
+
+def attack(index, target_side, target_slot=HERO):
+    return Action(ActionType.ATTACK, index, target_side, target_slot)
+
+END_TURN = Action(ActionType.END_TURN)
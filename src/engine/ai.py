@@ -0,0 +1,100 @@
+import os
+import random
+from models.card_types import UnitCard, SpellCard
+from engine.actions import ActionType, HERO, play_unit, play_ritual, attack
+from engine.effects import TARGET_NONE, TARGET_UNIT
+from engine.evaluation import default_evaluator
+from engine.lethal import LethalSolver, play_lethal
+from engine.mcts import MCTSAI
+from engine.parallel import RootParallelMCTS
+
+# Modes proposés dans les options (clé 'ai_mode' de config.json)
+AI_MODES = ("greedy", "eval", "mcts")
+
+class GreedyAI:
+    """L'IA historique : joue tout ce qu'elle peut payer, puis attaque au hasard.
+
+    Les rituels nuisibles vont au visage, les bénéfiques sur une unité prête.
+    """
+    def __init__(self, rng=None):
+        self.rng = rng or random
+        self.lethal = LethalSolver()
+
+    def play_turn(self, match):
+        if play_lethal(match, self.lethal): return
+        me = match.current
+        enemy_side = 1 - match.active
+        enemy = match.players[enemy_side]
+
+        # 1. Cartes (de la fin de la main vers le début pour garder les index valides)
+        for i in range(len(me.hand) - 1, -1, -1):
+            if match.game_over: return
+            card = me.hand[i]
+            if isinstance(card, UnitCard):
+                match.apply(play_unit(i))
+            elif isinstance(card, SpellCard) and card.effect and card.effect.hostile:
+                # Rituel nuisible : au visage (ou sans cible pour un effet de zone)
+                if card.effect.target != TARGET_UNIT:
+                    match.apply(play_ritual(i, enemy_side, HERO))
+            elif isinstance(card, SpellCard) and card.effect:
+                # Rituel bénéfique : sur une de nos unités prêtes à attaquer (zone : si on a un plateau)
+                if card.effect.target == TARGET_NONE:
+                    if me.board: match.apply(play_ritual(i, match.active, HERO))
+                    continue
+                ready = [unit for unit in me.board if unit.can_attack]
+                if ready:
+                    match.apply(play_ritual(i, match.active, me.board.index(self.rng.choice(ready))))
+
+        # 2. Attaques
+        for unit in list(me.board):
+            if match.game_over: return
+            if unit not in me.board or not unit.can_attack: continue
+
+            taunt_targets = list(enemy.taunt_units)
+            other_targets = [] if taunt_targets else [u for u in enemy.board if u not in enemy.stealth_units]
+
+            if taunt_targets: target = self.rng.choice(taunt_targets)
+            elif other_targets:
+                target = enemy if self.rng.random() < 0.5 else self.rng.choice(other_targets)
+            else: target = enemy
+
+            slot = HERO if target is enemy else enemy.board.index(target)
+            match.apply(attack(me.board.index(unit), enemy_side, slot))
+
+class EvalAI:
+    """Joue, tant qu'elle améliore le score, l'action dont la position obtenue est la mieux évaluée"""
+    def __init__(self, evaluator=None):
+        self.evaluator = evaluator or default_evaluator()
+        self.lethal = LethalSolver()
+
+    def play_turn(self, match):
+        if play_lethal(match, self.lethal): return
+        side = match.active
+        current = self.evaluator.score(match, side)
+        while not match.game_over and match.active == side:
+            actions = [action for action in match.legal_actions() if action.type != ActionType.END_TURN]
+            children = []
+            for action in actions:
+                child = match.fork()
+                if child.apply(action): children.append((action, child))
+            if not children: return
+            # Toutes les positions candidates évaluées d'un coup
+            scores = self.evaluator.score_many([child for _, child in children], side)
+            best = max(range(len(scores)), key=scores.__getitem__)
+            if scores[best] <= current: return
+            match.apply(children[best][0])
+            current = scores[best]
+
+def create_ai(mode="greedy", budget_ms=500, rng=None, workers=1, yield_ms=0):
+    """Fabrique l'IA adverse correspondant au mode choisi (workers=0 : un par coeur).
+
+    yield_ms : pour un MCTS dans le processus, pause régulière (voir MCTSAI)
+    """
+    if mode == "mcts":
+        workers = workers or os.cpu_count() or 1
+        if workers > 1:
+            return RootParallelMCTS(budget_ms=budget_ms, workers=workers, rng=rng)
+        return MCTSAI(budget_ms=budget_ms, rng=rng, yield_ms=yield_ms)
+    if mode == "eval":
+        return EvalAI()
+    return GreedyAI(rng)
@@ -0,0 +1,43 @@
+import queue
+import threading
+from engine.actions import ActionType, END_TURN
+from engine.events import EventType
+
+class BackgroundTurn:
+    """Tour de l'IA calculé dans un thread, sur une copie de la partie.
+
+    Les actions choisies sont mises en file au fur et à mesure : la scène
+    les rejoue une par une sur la vraie partie, au rythme qu'elle veut,
+    sans jamais attendre la réflexion. END_TURN termine la file.
+    """
+    def __init__(self, ai, match):
+        self.actions = queue.Queue()
+        self.error = None
+        state = match.clone()
+        state.subscribe(self.on_event)
+        self.thread = threading.Thread(target=self.run, args=(ai, state), daemon=True)
+        self.thread.start()
+
+    def on_event(self, event):
+        if event.type == EventType.ACTION and event.value.type != ActionType.END_TURN:
+            self.actions.put(event.value)
+
+    def run(self, ai, state):
+        try:
+            ai.play_turn(state)
+        except Exception as e:
+            self.error = e
+            print(f"Erreur IA : {e}")
+        finally:
+            self.actions.put(END_TURN)
+
+    def next_action(self):
+        """Prochaine action décidée, ou None si l'IA réfléchit encore"""
+        try:
+            return self.actions.get_nowait()
+        except queue.Empty:
+            return None
+
+    @property
+    def thinking(self):
+        return self.actions.empty()
@@ -0,0 +1,147 @@
+"""Effets des rituels, décrits dans cards.json et compilés au chargement.
+
+Une carte déclare une liste d'effets élémentaires :
+
+    "effects": [{"type": "damage", "value": 1, "area": "enemy_units"},
+                {"type": "buff_attack", "value": 1, "area": "ally_units"}]
+
+("area" vaut "target" par défaut : la cible choisie par le joueur). Les
+anciennes clés "effect_type" / "effect_value" restent comprises.
+
+Chaque type d'effet est enregistré ici avec ses deux fonctions (sur une
+unité, sur un héros). La liste est compilée une fois en Effect : tuple de
+(fonction unité, fonction héros, valeur, zone), avec le genre de cible
+vérifié d'avance. Lancer un rituel ne fait plus aucune comparaison de
+chaînes ni test d'attribut.
+"""
+from engine.actions import HERO
+from engine.events import EventType
+
+# Genre de cible que le joueur doit choisir
+TARGET_NONE = 0   # Pas de cible (effets de zone uniquement)
+TARGET_UNIT = 1   # Une unité, de n'importe quel camp
+TARGET_ANY = 2    # Une unité ou un héros
+
+# --- Types d'effets : nom -> (sur une unité, sur un héros ou None, nuisible ?) ---
+EFFECT_TYPES = {}
+
+def register_effect(name, hostile, on_hero=None):
+    """Décorateur : la fonction décorée applique l'effet à une unité"""
+    def decorator(on_unit):
+        EFFECT_TYPES[name] = (on_unit, on_hero, hostile)
+        return on_unit
+    return decorator
+
+def damage_hero(match, player, value, source):
+    match.damage_hero(player, value, source)
+
+@register_effect("damage", hostile=True, on_hero=damage_hero)
+def damage_unit(match, unit, value, source):
+    # Passe par la partie : les morts sont traitées par lots (Match.resolve)
+    match.damage_unit(unit, value, source)
+
+def heal_hero(match, player, value, source):
+    healed = min(value, player.max_health - player.health)
+    if healed <= 0: return
+    player.health += healed
+    match.emit(EventType.HEAL, player, healed, source=source)
+
+@register_effect("heal", hostile=False, on_hero=heal_hero)
+def heal_unit(match, unit, value, source):
+    healed = min(value, unit.max_health - unit.current_health)
+    if healed <= 0 or unit.is_dead: return
+    unit.current_health += healed
+    match.emit(EventType.HEAL, unit, healed, source=source)
+
+@register_effect("buff_attack", hostile=False)
+def buff_attack(match, unit, value, source):
+    unit.current_attack += value
+    match.emit(EventType.BUFF, unit, value, source=source)
+
+@register_effect("buff_health", hostile=False)
+def buff_health(match, unit, value, source):
+    unit.max_health += value
+    unit.current_health += value
+    match.emit(EventType.BUFF, unit, value, source=source)
+
+# --- Zones : nom -> (fonction (match, camp du lanceur) -> (unités, héros), touche des héros ?) ---
+def enemy_units(match, side): return list(match.players[1 - side].board), ()
+def ally_units(match, side): return list(match.players[side].board), ()
+def all_units(match, side): return match.players[0].board + match.players[1].board, ()
+def enemy_hero(match, side): return (), (match.players[1 - side],)
+def ally_hero(match, side): return (), (match.players[side],)
+def all_enemies(match, side): return list(match.players[1 - side].board), (match.players[1 - side],)
+
+AREAS = {
+    "enemy_units": (enemy_units, False),
+    "ally_units": (ally_units, False),
+    "all_units": (all_units, False),
+    "enemy_hero": (enemy_hero, True),
+    "ally_hero": (ally_hero, True),
+    "all_enemies": (all_enemies, True),
+}
+
+# Anciennes cartes : effect_type -> type d'effet
+LEGACY_TYPES = {"damage_target": "damage", "buff_target": "buff_attack"}
+
+class Effect:
+    """Effet compilé d'un rituel : les étapes s'enchaînent dans l'ordre"""
+    __slots__ = ('steps', 'target', 'hostile')
+
+    def __init__(self, steps, target, hostile):
+        self.steps = steps
+        self.target = target
+        self.hostile = hostile
+
+    def accepts(self, slot):
+        """La cible (slot, HERO pour un héros) convient-elle à cet effet ?"""
+        if self.target == TARGET_NONE: return True
+        return slot != HERO or self.target == TARGET_ANY
+
+    def apply(self, match, side, target_side, target_slot, source):
+        """Applique l'effet lancé par le camp `side` (cible déjà validée)"""
+        for on_unit, on_hero, value, area in self.steps:
+            if area is None:
+                owner = match.players[target_side]
+                if target_slot == HERO: on_hero(match, owner, value, source)
+                else: on_unit(match, owner.board[target_slot], value, source)
+            else:
+                units, heroes = area(match, side)
+                for unit in units: on_unit(match, unit, value, source)
+                for hero in heroes: on_hero(match, hero, value, source)
+
+def compile_effect(data):
+    """Compile les effets d'une carte (dict de cards.json), None si elle n'en a pas"""
+    specs = data.get("effects")
+    if specs is None:
+        legacy = LEGACY_TYPES.get(data.get("effect_type"))
+        specs = [{"type": legacy, "value": data.get("effect_value", 0)}] if legacy else []
+
+    steps = []
+    target = TARGET_NONE
+    hostile = False       # Nuisible pour la cible choisie
+    area_hostile = False  # Nuisible pour le camp adverse (effets de zone)
+    for spec in specs:
+        effect_type = EFFECT_TYPES.get(spec.get("type"))
+        area_name = spec.get("area", "target")
+        if effect_type is None or (area_name != "target" and area_name not in AREAS):
+            print(f"Attention : effet inconnu ignoré sur {data.get('id')} : {spec}")
+            continue
+        on_unit, on_hero, is_hostile = effect_type
+        value = spec.get("value", 0)
+        if area_name == "target":
+            # La cible choisie doit convenir à toutes les étapes qui la visent
+            kind = TARGET_ANY if on_hero else TARGET_UNIT
+            target = kind if target == TARGET_NONE else min(target, kind)
+            hostile = hostile or is_hostile
+            steps.append((on_unit, on_hero, value, None))
+        else:
+            area, has_heroes = AREAS[area_name]
+            if has_heroes and on_hero is None:
+                print(f"Attention : {spec.get('type')} ne s'applique pas aux héros ({data.get('id')})")
+                continue
+            area_hostile = area_hostile or (is_hostile and not area_name.startswith("ally"))
+            steps.append((on_unit, on_hero, value, area))
+    if not steps: return None
+    # Sans cible, on juge l'effet à ce qu'il fait au camp adverse
+    return Effect(tuple(steps), target, hostile if target != TARGET_NONE else area_hostile)
@@ -0,0 +1,118 @@
+"""Évaluation d'une position : vecteur de caractéristiques et poids réglés hors ligne.
+
+Chaque caractéristique est une différence "moi - adversaire" (PV du héros,
+attaque et PV du plateau, compétences, main, courbe de mana) : le score
+d'un camp est le complément de celui de l'autre. Le score vaut
+sigmoïde(poids . caractéristiques), une probabilité de victoire.
+
+Les poids viennent de eval_weights.json (à la racine, produit par
+src/tune_eval.py) ; sans ce fichier, ceux de l'ancienne évaluation MCTS.
+Avec NumPy, score_many() évalue toutes les positions en un seul produit
+matriciel ; sans NumPy (dépendance optionnelle, absente de
+requirements.txt : cas par défaut), la même chose en Python pur.
+"""
+import json
+import math
+import os
+from constants.enums import Keyword
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+WEIGHTS_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'eval_weights.json')
+
+# Compétences comptées, en int (les opérations d'IntFlag sont lentes)
+KEYWORD_BITS = [int(keyword) for keyword in Keyword]
+
+FEATURES = (
+    ("health", "board_attack", "board_health", "units")
+    + tuple(f"kw_{keyword.name.lower()}" for keyword in Keyword)
+    + ("hand", "hand_playable", "hand_mana", "max_mana")
+)
+
+# L'ancienne évaluation : PV + attaque + PV / 2 des unités + main / 2, sur 10
+DEFAULT_WEIGHTS = {"health": 0.1, "board_attack": 0.1, "board_health": 0.05, "hand": 0.05}
+
+def player_features(player):
+    """Caractéristiques d'un seul joueur, dans l'ordre de FEATURES"""
+    attack = health = 0
+    keywords = [0] * len(KEYWORD_BITS)
+    for unit in player.board:
+        attack += unit.current_attack
+        health += unit.current_health
+        mask = int(unit.keywords)
+        if mask:
+            for i, bit in enumerate(KEYWORD_BITS):
+                if mask & bit: keywords[i] += 1
+    # Courbe de mana : ce qui sera jouable au prochain tour, et le coût total
+    next_mana = min(10, player.max_mana + 1)
+    playable = mana = 0
+    for card in player.hand:
+        mana += card.mana_cost
+        if card.mana_cost <= next_mana: playable += 1
+    return [player.health, attack, health, len(player.board)] + keywords + [len(player.hand), playable, mana, player.max_mana]
+
+def extract(state, side):
+    """Vecteur de caractéristiques de la position, du point de vue de `side`"""
+    me = player_features(state.players[side])
+    foe = player_features(state.players[1 - side])
+    return [a - b for a, b in zip(me, foe)]
+
+def sigmoid(x):
+    if x < -60: return 0.0
+    return 1.0 / (1.0 + math.exp(-x))
+
+class Evaluator:
+    """Score des positions dans [0, 1] (probabilité de victoire estimée)"""
+    def __init__(self, weights=None):
+        weights = DEFAULT_WEIGHTS if weights is None else weights
+        # Poids inconnus ignorés, caractéristiques sans poids à 0
+        self.weights = [float(weights.get(name, 0.0)) for name in FEATURES]
+        self.vector = np.array(self.weights) if np is not None else None
+
+    @classmethod
+    def load(cls, path=WEIGHTS_FILE):
+        """Évaluateur aux poids du fichier, ou aux poids par défaut s'il est absent"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f)["weights"])
+        except FileNotFoundError:
+            return cls()
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Attention : poids d'évaluation illisibles ({e}), poids par défaut")
+            return cls()
+
+    def save(self, path=WEIGHTS_FILE, info=None):
+        data = {"weights": dict(zip(FEATURES, self.weights))}
+        if info: data["info"] = info
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+
+    def linear(self, features):
+        return sum(w * x for w, x in zip(self.weights, features))
+
+    def score(self, state, side):
+        if state.game_over:
+            return 1.0 if state.winner == side else 0.0
+        return sigmoid(self.linear(extract(state, side)))
+
+    def score_many(self, states, side):
+        """Scores de plusieurs positions en un seul appel (liste de floats)"""
+        rows = [extract(state, side) for state in states]
+        if np is not None and rows:
+            scores = (1.0 / (1.0 + np.exp(-np.clip(np.array(rows, dtype=float) @ self.vector, -60, 60)))).tolist()
+        else:
+            scores = [sigmoid(self.linear(row)) for row in rows]
+        for i, state in enumerate(states):
+            if state.game_over: scores[i] = 1.0 if state.winner == side else 0.0
+        return scores
+
+_default = None
+
+def default_evaluator():
+    """Évaluateur partagé, chargé une fois par processus"""
+    global _default
+    if _default is None: _default = Evaluator.load()
+    return _default
@@ -0,0 +1,28 @@
+from enum import Enum, auto
+
+class EventType(Enum):
+    ACTION = auto()           # Une action vient d'être appliquée (value = Action)
+    UNIT_PLAYED = auto()
+    RITUAL_CAST = auto()
+    DAMAGE = auto()
+    HEAL = auto()
+    BUFF = auto()             # Bonus de stats (value = montant)
+    SHIELD_BLOCKED = auto()   # Bouclier Divin consommé
+    STEALTH_BLOCKED = auto()  # Cible furtive refusée
+    TAUNT_BLOCKED = auto()    # Une Provocation protège la cible
+    UNIT_DIED = auto()
+    TURN_STARTED = auto()
+    GAME_OVER = auto()        # value = index du camp gagnant
+
+class MatchEvent:
+    """Ce qui vient de se passer dans la partie, pour les abonnés (visuels, stats...)"""
+    __slots__ = ('type', 'target', 'value', 'source')
+
+    def __init__(self, event_type, target=None, value=0, source=None):
+        self.type = event_type
+        self.target = target
+        self.value = value
+        self.source = source
+
+    def __repr__(self):
+        return f"<{self.type.name} {self.target!r} {self.value!r}>"
@@ -0,0 +1,389 @@
+"""Journal binaire des parties : une suite d'actions, rejouable à l'identique.
+
+Une partie se rejoue entièrement à partir de sa graine (decks) et de ses
+actions : le journal ne stocke que cela, dans un format compact.
+
+    en-tête   : b'SHJ1', nombre d'ids de cartes, puis chaque id (longueur + utf-8)
+    partie    : [début][action]...[fin]
+
+Chaque enregistrement commence par un octet :
+    bits 0-1  type d'action (ActionType)
+    bit 2     camp ciblé
+    bit 3     cible = héros
+    bits 4-5  nature : 0 action, 1 début de partie, 2 fin de partie, 3 instantané
+
+Les entiers qui suivent sont des varints (7 bits par octet) :
+    début        graine
+    fin          vainqueur + 1 (0 = nulle), nombre de tours
+    action       index, n° de la carte jouée / attaquante dans l'en-tête,
+                 slot ciblé (rituel / attaque hors héros)
+    fin de tour  rien
+    instantané   taille, puis l'état complet (voir write_state), pris en
+                 début de tour : ReplayCursor s'en sert pour sauter
+                 directement à un tour sans tout rejouer
+
+Une partie de 20 tours tient en quelques centaines d'octets (quelques Ko
+avec un instantané par tour).
+"""
+from constants.enums import Keyword
+from engine.actions import Action, ActionType, HERO
+from engine.events import EventType
+from engine.match import Match
+
+MAGIC = b'SHJ1'
+
+RECORD_ACTION = 0
+RECORD_START = 1
+RECORD_END = 2
+RECORD_SNAPSHOT = 3
+
+def write_varint(buffer, value):
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80: return value, pos
+        shift += 7
+
+# Entiers signés (PV négatifs...) : zigzag, 0 -1 1 -2 2 -> 0 1 2 3 4
+def write_signed(buffer, value):
+    write_varint(buffer, value << 1 if value >= 0 else (-value << 1) - 1)
+
+def read_signed(data, pos):
+    value, pos = read_varint(data, pos)
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+
+def write_cards(buffer, cards, card_numbers):
+    write_varint(buffer, len(cards))
+    for card in cards:
+        write_varint(buffer, card_numbers[card.id])
+
+def read_cards(data, pos, templates):
+    count, pos = read_varint(data, pos)
+    cards = []
+    for _ in range(count):
+        n, pos = read_varint(data, pos)
+        cards.append(templates[n])
+    return cards, pos
+
+def write_state(buffer, match, card_numbers):
+    """État complet de la partie (hors hasard des IA, qui n'est pas rejoué)"""
+    write_varint(buffer, match.active)
+    write_varint(buffer, match.turn_count)
+    write_varint(buffer, 0 if match.winner is None else match.winner + 1)
+    write_varint(buffer, match.game_over)
+    for p in match.players:
+        for value in (p.health, p.max_health, p.mana, p.max_mana):
+            write_signed(buffer, value)
+        write_cards(buffer, p.deck, card_numbers)
+        write_cards(buffer, p.hand, card_numbers)
+        write_cards(buffer, p.graveyard, card_numbers)
+        write_varint(buffer, len(p.board))
+        for unit in p.board:
+            write_varint(buffer, card_numbers[unit.id])
+            for value in (unit.current_attack, unit.current_health, unit.max_health, unit.attacks_left):
+                write_signed(buffer, value)
+            write_varint(buffer, int(unit.keywords))
+            write_varint(buffer, unit.can_attack)
+
+def read_state(match, data, pos, templates):
+    """Recharge dans `match` un état écrit par write_state"""
+    match.active, pos = read_varint(data, pos)
+    match.turn_count, pos = read_varint(data, pos)
+    winner, pos = read_varint(data, pos)
+    match.winner = winner - 1 if winner else None
+    game_over, pos = read_varint(data, pos)
+    match.game_over = bool(game_over)
+    for p in match.players:
+        p.health, pos = read_signed(data, pos)
+        p.max_health, pos = read_signed(data, pos)
+        p.mana, pos = read_signed(data, pos)
+        p.max_mana, pos = read_signed(data, pos)
+        p.deck, pos = read_cards(data, pos, templates)
+        hand, pos = read_cards(data, pos, templates)
+        p.hand = [template.create() for template in hand]
+        graveyard, pos = read_cards(data, pos, templates)
+        p.graveyard = [template.create() for template in graveyard]
+        p.board = []
+        p.rebuild_indexes()
+        count, pos = read_varint(data, pos)
+        for _ in range(count):
+            n, pos = read_varint(data, pos)
+            unit = templates[n].create()
+            unit.current_attack, pos = read_signed(data, pos)
+            unit.current_health, pos = read_signed(data, pos)
+            unit.max_health, pos = read_signed(data, pos)
+            unit.attacks_left, pos = read_signed(data, pos)
+            keywords, pos = read_varint(data, pos)
+            unit.keywords = Keyword(keywords)
+            can_attack, pos = read_varint(data, pos)
+            unit.can_attack = bool(can_attack)
+            p.add_to_board(unit)
+    match.touch()
+    return pos
+
+class JournalWriter:
+    """Écrit les parties au fil de l'eau dans un flux binaire (fichier, BytesIO...).
+
+    start(match) juste après la création de la partie, finish(match) à la
+    fin : entre les deux, chaque action réussie est journalisée via les
+    événements du moteur. Avec snapshot_every=N, un instantané de l'état
+    est ajouté tous les N tours.
+
+    Par défaut, les enregistrements restent en mémoire jusqu'à la fin de la
+    partie (lots de simulate.py). Avec flush_every=N, le tampon part dans le
+    flux dès qu'il dépasse N octets et à chaque début de tour : un fichier
+    reste lisible si le jeu plante en pleine partie (1 : après chaque
+    enregistrement).
+    """
+    def __init__(self, stream, card_ids, header=True, snapshot_every=0, flush_every=0):
+        self.stream = stream
+        self.snapshot_every = snapshot_every
+        self.flush_every = flush_every
+        self.card_numbers = {card_id: n for n, card_id in enumerate(card_ids)}
+        self.buffer = bytearray()
+        self.match = None
+        if header:
+            self.buffer += MAGIC
+            write_varint(self.buffer, len(card_ids))
+            for card_id in card_ids:
+                encoded = card_id.encode('utf-8')
+                write_varint(self.buffer, len(encoded))
+                self.buffer += encoded
+            self.flush()
+
+    def start(self, match):
+        self.match = match
+        self.buffer.append(RECORD_START << 4)
+        write_varint(self.buffer, match.seed)
+        match.subscribe(self.on_event)
+
+    def on_event(self, event):
+        if event.type == EventType.ACTION:
+            self.write_action(event.value, event.source)
+        elif event.type == EventType.TURN_STARTED:
+            if self.snapshot_every and event.value % self.snapshot_every == 0:
+                self.write_snapshot(self.match)
+            if self.flush_every: self.flush()
+            return
+        else:
+            return
+        if self.flush_every and len(self.buffer) >= self.flush_every: self.flush()
+
+    def write_snapshot(self, match):
+        state = bytearray()
+        write_state(state, match, self.card_numbers)
+        self.buffer.append(RECORD_SNAPSHOT << 4)
+        write_varint(self.buffer, len(state))
+        self.buffer += state
+
+    def write_action(self, action, player):
+        buffer = self.buffer
+        if action.type == ActionType.END_TURN:
+            buffer.append(action.type.value)
+            return
+
+        hero = action.target_slot == HERO
+        buffer.append(action.type.value | (action.target_side & 1) << 2 | hero << 3)
+        write_varint(buffer, action.index)
+        # L'événement part juste après que la carte a quitté la main
+        if action.type == ActionType.PLAY_UNIT: card = player.board[-1]
+        elif action.type == ActionType.PLAY_RITUAL: card = player.graveyard[-1]
+        else: card = player.board[action.index]
+        write_varint(buffer, self.card_numbers[card.id])
+        if action.type != ActionType.PLAY_UNIT and not hero:
+            write_varint(buffer, action.target_slot)
+
+    def finish(self, match):
+        match.unsubscribe(self.on_event)
+        self.match = None
+        self.buffer.append(RECORD_END << 4)
+        write_varint(self.buffer, 0 if match.winner is None else match.winner + 1)
+        write_varint(self.buffer, match.turn_count)
+        self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.stream.write(self.buffer)
+            self.buffer = bytearray()
+            if self.flush_every: self.stream.flush()
+
+    def close(self):
+        if self.match is not None: self.match.unsubscribe(self.on_event)
+        self.flush()
+        self.stream.close()
+
+def open_journal(path, card_ids, snapshot_every=0, flush_every=1):
+    """Journal dans un fichier, écrit enregistrement par enregistrement (lisible après un plantage)"""
+    return JournalWriter(open(path, 'wb'), card_ids, snapshot_every=snapshot_every, flush_every=flush_every)
+
+class MatchRecord:
+    """Une partie lue dans le journal : graine, [(Action, id de carte)], résultat.
+
+    snapshots : [(nombre d'actions déjà jouées, état encodé)]
+    complete : False pour la dernière partie d'un journal interrompu
+    """
+    __slots__ = ('seed', 'actions', 'snapshots', 'winner', 'turns', 'complete')
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.actions = []
+        self.snapshots = []
+        self.winner = None
+        self.turns = 0
+        self.complete = False
+
+class JournalReader:
+    """Lit un journal complet ; itérer donne les MatchRecord dans l'ordre"""
+    def __init__(self, data):
+        if isinstance(data, str):
+            with open(data, 'rb') as f:
+                data = f.read()
+        if data[:4] != MAGIC:
+            raise ValueError("Ce fichier n'est pas un journal de parties")
+        self.data = data
+        count, pos = read_varint(data, 4)
+        self.card_ids = []
+        for _ in range(count):
+            size, pos = read_varint(data, pos)
+            self.card_ids.append(bytes(data[pos:pos + size]).decode('utf-8'))
+            pos += size
+        self.start = pos
+
+    def check_pool(self, card_pool):
+        """Les decks se rejouent par tirage dans le pool : il doit être identique, dans le même ordre"""
+        if [card.id for card in card_pool] != self.card_ids:
+            raise ValueError("Le journal a été écrit avec une autre collection de cartes")
+
+    def __iter__(self):
+        data = self.data
+        card_ids = self.card_ids
+        pos = self.start
+        record = None
+        try:
+            while pos < len(data):
+                head = data[pos]
+                pos += 1
+                kind = head >> 4
+                if kind == RECORD_START:
+                    seed, pos = read_varint(data, pos)
+                    record = MatchRecord(seed)
+                elif kind == RECORD_END:
+                    winner, pos = read_varint(data, pos)
+                    record.winner = winner - 1 if winner else None
+                    record.turns, pos = read_varint(data, pos)
+                    record.complete = True
+                    yield record
+                    record = None
+                elif kind == RECORD_SNAPSHOT:
+                    size, pos = read_varint(data, pos)
+                    if pos + size > len(data): break
+                    record.snapshots.append((len(record.actions), data[pos:pos + size]))
+                    pos += size
+                else:
+                    action_type = ActionType(head & 3)
+                    if action_type == ActionType.END_TURN:
+                        record.actions.append((Action(action_type), None))
+                        continue
+                    index, pos = read_varint(data, pos)
+                    card, pos = read_varint(data, pos)
+                    side = head >> 2 & 1
+                    slot = HERO
+                    if action_type != ActionType.PLAY_UNIT and not head & 8:
+                        slot, pos = read_varint(data, pos)
+                    if action_type == ActionType.PLAY_UNIT: side = -1
+                    record.actions.append((Action(action_type, index, side, slot), card_ids[card]))
+        except IndexError:
+            pass  # Dernier enregistrement tronqué : le jeu a été coupé pendant l'écriture
+        if record is not None:
+            # Partie interrompue (plantage, fermeture du jeu) : rejouable jusqu'à sa dernière action
+            record.turns = sum(action.type == ActionType.END_TURN for action, _ in record.actions)
+            yield record
+
+def apply_recorded(match, action, card_id):
+    """Rejoue une action du journal ; lève ValueError en cas de divergence"""
+    if card_id is not None:
+        me = match.current
+        card = me.board[action.index] if action.type == ActionType.ATTACK else me.hand[action.index]
+        if card.id != card_id:
+            raise ValueError(f"Journal désynchronisé : {card_id} attendu, {card.id} trouvé")
+    if not match.apply(action):
+        raise ValueError(f"Action impossible lors du rejeu : {action}")
+
+def replay_match(record, card_pool, verbose=False, listener=None):
+    """Reconstruit la partie d'un MatchRecord"""
+    match = Match(card_pool, ai_sides=(True, True), verbose=verbose, seed=record.seed)
+    if listener: match.subscribe(listener)
+    for action, card_id in record.actions:
+        apply_recorded(match, action, card_id)
+    return match
+
+class ReplayCursor:
+    """Navigation libre dans une partie du journal.
+
+    seek(position) place la partie après `position` actions : elle repart
+    du point de reprise le plus proche en amont (instantané du fichier,
+    ou copie gardée en mémoire à chaque début de tour déjà traversé) et ne
+    rejoue que la fin. Revenir en arrière coûte donc au plus un tour.
+    """
+    def __init__(self, record, card_pool):
+        self.record = record
+        self.card_pool = card_pool
+        self.templates = [card.template for card in card_pool]
+        self.snapshots = dict(record.snapshots)
+        self.cache = {}
+        # Position du début de chaque tour (tour n -> nombre d'actions avant lui)
+        self.turn_starts = [0] + [i + 1 for i, (action, _) in enumerate(record.actions)
+                                  if action.type == ActionType.END_TURN]
+        self.match = self.new_match()
+        self.position = 0
+        self.cache[0] = self.match.clone()
+
+    def __len__(self):
+        return len(self.record.actions)
+
+    def new_match(self):
+        return Match(self.card_pool, ai_sides=(True, True), verbose=False, seed=self.record.seed)
+
+    def restore(self, position):
+        """Partie au point de reprise `position` (copie, le cache reste intact)"""
+        cached = self.cache.get(position)
+        if cached is not None: return cached.clone()
+        match = self.new_match()
+        read_state(match, self.snapshots[position], 0, self.templates)
+        return match
+
+    def seek(self, position):
+        position = max(0, min(position, len(self.record.actions)))
+        base = max(p for p in (*self.cache, *self.snapshots) if p <= position)
+        # On repart du point de reprise s'il faut reculer ou s'il est plus proche
+        if position < self.position or base > self.position:
+            self.match = self.restore(base)
+            self.position = base
+        actions = self.record.actions
+        while self.position < position:
+            action, card_id = actions[self.position]
+            apply_recorded(self.match, action, card_id)
+            self.position += 1
+            if action.type == ActionType.END_TURN and self.position not in self.cache:
+                self.cache[self.position] = self.match.clone()
+        return self.match
+
+    def step(self, delta=1):
+        return self.seek(self.position + delta)
+
+    def seek_turn(self, turn):
+        """Début du tour `turn` (0 = première action de la partie)"""
+        return self.seek(self.turn_starts[max(0, min(turn, len(self.turn_starts) - 1))])
+
+    @property
+    def turn(self):
+        return self.match.turn_count
@@ -0,0 +1,285 @@
+"""Recherche exacte de létal : une suite d'actions qui tue le héros adverse ce tour-ci.
+
+Parcours en profondeur sur des forks de la partie (engine.match.fork),
+en ne gardant que les actions qui peuvent servir à tuer :
+
+  - rituels nuisibles (au visage, ou sur une Provocation pour l'ouvrir),
+    effets de zone, bonus d'attaque sur une unité prête ;
+  - unités à Charge ou à Cri de guerre ;
+  - attaques dans les Provocations.
+
+Les attaques au visage ne changent rien d'autre : elles ne sont jamais
+explorées, mais comptées à chaque noeud (sans Provocation, somme des
+attaques >= PV adverses = létal).
+
+Toutes les Provocations doivent tomber avant d'attaquer le visage : on
+les traite une par une, la plus résistante d'abord, au lieu d'essayer
+tous les ordres. Seule exception, quand un Râle d'agonie ou un Sacrifice est
+en jeu (l'ordre des morts compte alors) : toutes les Provocations sont
+essayées.
+
+Élagage : une borne haute des dégâts encore possibles (attaques prêtes +
+sac à dos des cartes payables, moins ce que coûtent les Provocations :
+les plus petits attaquants qu'il faudra leur sacrifier, ou leurs PV) ;
+si elle n'atteint pas les PV adverses, la branche est abandonnée.
+Mémoïsation : les positions déjà explorées sans succès sont retenues
+par leur hash Zobrist (atteintes par un autre ordre d'actions, elles ne
+sont pas refaites).
+"""
+from constants.enums import Keyword
+from engine import effects
+from engine.actions import Action, ActionType, HERO
+from engine.effects import TARGET_NONE, TARGET_ANY
+from engine.zobrist import Zobrist
+
+# Masques en int (les opérations d'IntFlag coûtent cher à chaque noeud)
+CHARGE = int(Keyword.CHARGE)
+DIVINE_SHIELD = int(Keyword.DIVINE_SHIELD)
+DEATHRATTLE = int(Keyword.DEATHRATTLE)
+SACRIFICE = int(Keyword.SACRIFICE)
+POISONOUS = int(Keyword.POISONOUS)
+USEFUL_UNITS = int(Keyword.CHARGE | Keyword.BATTLECRY)
+# Compétences qui rendent l'ordre des morts important
+DEATH_KEYWORDS = DEATHRATTLE | SACRIFICE
+
+class LethalSolver:
+    """Chercheur de létal réutilisable (clés Zobrist et bornes des cartes gardées en cache)"""
+    def __init__(self, max_nodes=2000):
+        self.max_nodes = max_nodes
+        self.zobrist = Zobrist()
+        self.card_bounds = {}
+        self.nodes = 0
+
+    def find(self, match):
+        """Actions (à appliquer dans l'ordre) qui gagnent la partie ce tour, ou None.
+
+        None aussi si la recherche dépasse max_nodes positions : le résultat
+        est alors inconnu, pas négatif.
+        """
+        if match.game_over: return None
+        root = match.fork()
+        root.enable_hashing(self.zobrist)
+        self.side = match.active
+        self.failed = set()
+        self.nodes = 0
+        try:
+            return self.search(root)
+        except _BudgetExceeded:
+            return None
+
+    def search(self, state):
+        self.nodes += 1
+        if self.nodes > self.max_nodes: raise _BudgetExceeded()
+        me = state.current
+        foe = state.players[1 - self.side]
+
+        attackers = [(unit.current_attack, i) for i, unit in enumerate(me.board)
+                     if unit.can_attack and unit.current_attack > 0]
+        ready = sum(attack for attack, _ in attackers)
+        if not foe.taunt_units and ready >= foe.health:
+            return self.face_attacks(attackers, foe.health)
+        if ready + self.potential(state, attackers, foe) < foe.health: return None
+        if state.hash in self.failed: return None
+
+        for action in self.candidates(state):
+            child = state.fork()
+            if not child.apply(action): continue
+            if child.game_over:
+                if child.winner == self.side: return [action]
+                continue
+            rest = self.search(child)
+            if rest is not None: return [action] + rest
+        self.failed.add(state.hash)
+        return None
+
+    def face_attacks(self, attackers, health):
+        """Les plus grosses attaques au visage, juste assez pour tuer"""
+        result = []
+        for attack, i in sorted(attackers, reverse=True):
+            if health <= 0: break
+            result.append(Action(ActionType.ATTACK, i, 1 - self.side, HERO))
+            health -= attack
+        return result
+
+    # --- Borne haute ---
+    def potential(self, state, attackers, foe):
+        """Dégâts qu'on peut encore ajouter aux attaques prêtes (jamais sous-estimés)"""
+        me = state.current
+        playable = [card.template for card in me.hand if card.mana_cost <= me.mana]
+        chargers = [template.base_attack for template in playable if CHARGE & int(template.keywords)]
+        units = min(7, len(attackers) + len(chargers))
+        bonus = 0
+        removal = 0   # Dégâts possibles sur les unités adverses hors attaques (optimiste)
+        # Morts alliées (attaque dans une Provocation) : Râle d'agonie, Sacrifice
+        for unit in me.board:
+            keywords = int(unit.keywords)
+            if keywords & DEATHRATTLE and unit.template.deathrattle:
+                bonus += effect_bound(unit.template.deathrattle, units)
+                removal += unit_damage(unit.template.deathrattle)
+            if keywords & SACRIFICE: bonus += units
+
+        face = [self.card_bound(template, units) for template in playable]
+        best = knapsack(me.mana, playable, face)
+        if not foe.taunt_units: return bonus + best
+
+        # Les Provocations coûtent de l'attaque ; deux bornes, on garde la plus
+        # basse (sauf si les cartes seules suffisent : rien à ouvrir)
+        alone = bonus + best - sum(attack for attack, _ in attackers)
+        damage = [unit_damage(template.effect or template.battlecry) for template in playable]
+        ready = [unit for unit in me.board if unit.can_attack]
+        by_count = bonus + best - self.taunt_count_cost(me, foe, ready, chargers, removal + sum(damage))
+        if any(POISONOUS & int(unit.keywords) for unit in ready): return max(alone, by_count)
+        # Sans Toxique, il faut ôter tous leurs PV : une carte ciblée va soit au
+        # visage, soit à une Provocation (et le mana est partagé)
+        taunts = len(foe.taunt_units)
+        health = sum(unit.current_health for unit in foe.taunt_units)
+        mixed = knapsack(me.mana, playable, [self.card_bound(template, units, taunts) for template in playable])
+        return max(alone, min(by_count, bonus + removal * taunts + mixed - health))
+
+    def taunt_count_cost(self, me, foe, ready, chargers, removal):
+        """Attaque perdue au minimum en nombre d'attaquants pour ouvrir les Provocations.
+
+        Chaque Provocation que les cartes ne peuvent pas tuer prend au moins
+        un attaquant (deux avec Bouclier Divin sans aucun dégât de carte), et
+        chacun n'attaque qu'une fois : au mieux, les plus petits. Sans aucun
+        dégât de carte ni Toxique, la perte vaut même max(PV, attaque) pour
+        chacune : somme minimale en associant attaquants et Provocations
+        triés dans le même ordre (le plus petit au plus petit).
+        """
+        healths = []
+        shields = 0
+        for unit in foe.taunt_units:
+            if removal >= unit.current_health: continue
+            healths.append(unit.current_health)
+            if not removal and DIVINE_SHIELD & int(unit.keywords): shields += 1
+        if not healths: return 0
+        # Une unité à Charge ne peut venir que sur une place libre (ou libérée par une mort)
+        chargers = sorted(chargers)[:7 - len(me.board) + len(ready)]
+        pool = sorted([unit.current_attack for unit in ready] + chargers)
+        needed = len(healths) + shields
+        if needed > len(pool): return 10**6
+        cost = sum(pool[:needed])
+        if not removal and not any(POISONOUS & int(unit.keywords) for unit in ready):
+            healths.sort()
+            cost = max(cost, sum(max(health, attack) for health, attack in zip(healths, pool)))
+        return cost
+
+    def card_bound(self, template, units, taunts=0):
+        """Borne d'une carte au visage (taunts = 0) ou au visage + sur `taunts` Provocations"""
+        key = (template.id, units, taunts)
+        bound = self.card_bounds.get(key)
+        if bound is None:
+            if template.effect is not None:
+                bound = effect_bound(template.effect, units, taunts)
+            else:
+                bound = template.base_attack if CHARGE & int(template.keywords) else 0
+                if template.battlecry: bound += effect_bound(template.battlecry, units, taunts)
+            self.card_bounds[key] = bound
+        return bound
+
+    # --- Actions utiles ---
+    def candidates(self, state):
+        """Actions qui peuvent rapprocher du létal (sans les attaques au visage)"""
+        side = self.side
+        me = state.current
+        foe = state.players[1 - side]
+        # La plus grosse Provocation d'abord : c'est elle qui contraint le plus
+        taunt_slots = sorted((slot for slot, unit in enumerate(foe.board) if unit in foe.taunt_units),
+                             key=lambda slot: -foe.board[slot].current_health)
+        if taunt_slots and not self.death_order_matters(me, foe):
+            taunt_slots = taunt_slots[:1]
+        ready_slots = [slot for slot, unit in enumerate(me.board) if unit.can_attack]
+
+        # Deux exemplaires d'une même carte donnent la même suite : un seul essai
+        seen = set()
+        for i, card in enumerate(me.hand):
+            template = card.template
+            if card.mana_cost > me.mana or template in seen: continue
+            seen.add(template)
+            effect = template.effect
+            if effect is not None:
+                if effect.target == TARGET_NONE:
+                    if effect.hostile or self.card_bound(template, len(ready_slots)):
+                        yield Action(ActionType.PLAY_RITUAL, i)
+                elif effect.hostile:
+                    if effect.target == TARGET_ANY: yield Action(ActionType.PLAY_RITUAL, i, 1 - side, HERO)
+                    for slot in taunt_slots: yield Action(ActionType.PLAY_RITUAL, i, 1 - side, slot)
+                elif self.card_bound(template, 1):
+                    for slot in ready_slots: yield Action(ActionType.PLAY_RITUAL, i, side, slot)
+            elif len(me.board) < 7 and USEFUL_UNITS & int(template.keywords):
+                yield Action(ActionType.PLAY_UNIT, i)
+
+        # Attaques dans les Provocations (attaquants / cibles identiques : un seul essai)
+        attackers = {}
+        for slot in ready_slots:
+            unit = me.board[slot]
+            attackers.setdefault((unit.template, unit.current_attack, unit.current_health, unit.keywords), slot)
+        targets = {}
+        for slot in taunt_slots:
+            unit = foe.board[slot]
+            targets.setdefault((unit.template, unit.current_attack, unit.current_health, unit.keywords), slot)
+        for target in targets.values():
+            # Le plus petit attaquant qui tue d'abord, puis les plus gros, puis ceux qui ne tuent pas
+            health = foe.board[target].current_health
+            order = sorted(attackers.values(), key=lambda slot: fit(me.board[slot].current_attack, health))
+            for attacker in order:
+                yield Action(ActionType.ATTACK, attacker, 1 - side, target)
+
+    def death_order_matters(self, me, foe):
+        """Un Râle d'agonie ou un Sacrifice peut-il se déclencher ?"""
+        for player in (me, foe):
+            for unit in player.board:
+                if DEATH_KEYWORDS & int(unit.keywords): return True
+        return any(DEATH_KEYWORDS & int(card.template.keywords) for card in me.hand)
+
+def knapsack(mana, templates, gains):
+    """Meilleure somme de gains pour un mana donné (chaque carte une fois)"""
+    best = [0] * (mana + 1)
+    for template, gain in zip(templates, gains):
+        if gain <= 0: continue
+        cost = template.mana_cost
+        for m in range(mana, cost - 1, -1):
+            if best[m - cost] + gain > best[m]: best[m] = best[m - cost] + gain
+    return best[mana]
+
+def fit(attack, health):
+    """Clé de tri des attaquants d'une cible : tuer avec le moins de gâchis"""
+    return (0, attack) if attack >= health else (1, -attack)
+
+def unit_damage(effect):
+    """Dégâts qu'un effet peut infliger à une unité adverse (None : aucun)"""
+    if effect is None: return 0
+    total = 0
+    for on_unit, on_hero, value, area in effect.steps:
+        if on_unit is effects.damage_unit and area in (None, effects.enemy_units, effects.all_units, effects.all_enemies):
+            total += value
+    return total
+
+def effect_bound(effect, units, taunts=0):
+    """Dégâts au héros adverse qu'un effet peut ajouter, avec `units` attaquants possibles.
+
+    Avec `taunts` > 0, compte aussi les dégâts sur autant de Provocations
+    (une cible unique va au héros ou à une unité, pas aux deux).
+    """
+    bound = 0
+    for on_unit, on_hero, value, area in effect.steps:
+        if on_unit is effects.damage_unit:
+            if area is None:
+                if effect.target == TARGET_ANY or taunts: bound += value
+            else:
+                if area in (effects.enemy_hero, effects.all_enemies): bound += value
+                if area in (effects.enemy_units, effects.all_units, effects.all_enemies): bound += value * taunts
+        elif on_unit is effects.buff_attack:
+            bound += value * (units if area in (effects.ally_units, effects.all_units) else 1)
+    return bound
+
+class _BudgetExceeded(Exception):
+    pass
+
+def play_lethal(match, solver=None):
+    """Joue le létal du camp actif s'il y en a un ; True si la partie est gagnée"""
+    sequence = (solver or LethalSolver()).find(match)
+    if not sequence: return False
+    for action in sequence:
+        if not match.apply(action): return False
+    return match.game_over
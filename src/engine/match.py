@@ -0,0 +1,485 @@
+from collections import deque
+from models.player import Player
+from models.card_types import UnitCard
+from constants.enums import Keyword
+from engine.actions import Action, ActionType, HERO
+from engine.events import EventType, MatchEvent
+from engine.effects import TARGET_NONE, TARGET_ANY
+from engine.triggers import Trigger, TRIGGERS, TRIGGER_MASKS
+from engine.rng import RandomStreams, new_seed
+from engine.zobrist import ZONE_TURN, ZONE_PLAYER, ZONE_HAND, ZONE_BOARD
+
+# Compétences qui agissent quand l'unité est jouée (voir touched_by)
+PLAY_KEYWORDS = TRIGGER_MASKS[Trigger.ON_PLAY]
+
+class Match:
+    """État complet d'une partie et règles du jeu, sans aucune dépendance à pygame.
+
+    La scène (ou une simulation) applique des actions et s'abonne aux
+    événements pour produire ses visuels.
+
+    Tout le hasard de la partie vient de `seed` (voir engine.rng) : même
+    graine, mêmes decks, et mêmes choix pour une IA qui tire dans
+    streams.get('ai:<camp>'). `decks` impose les decks (listes de templates,
+    une par camp) au lieu de les tirer dans `card_pool`.
+    """
+    def __init__(self, card_pool, names=("Joueur", "Adversaire"), ai_sides=(False, True), verbose=True, seed=None, decks=(None, None)):
+        self.seed = new_seed() if seed is None else seed
+        self.streams = RandomStreams(self.seed)
+        if verbose: print(f"Nouvelle partie (graine {self.seed})")
+        self.players = [
+            Player(names[0], card_pool, is_ai=ai_sides[0], verbose=verbose, rng=self.streams.get("deck:0"), deck=decks[0]),
+            Player(names[1], card_pool, is_ai=ai_sides[1], verbose=verbose, rng=self.streams.get("deck:1"), deck=decks[1])
+        ]
+        self.listeners = []
+        # Déclencheurs en attente et morts pas encore retirées (voir resolve)
+        self.pending = deque()
+        self.deaths = 0
+
+        self.active = 0
+        self.turn_count = 0
+        self.game_over = False
+        self.winner = None
+        self.zobrist = None
+        self.hash = 0
+        # Incrémenté à chaque changement d'état : invalide le cache des coups légaux
+        self.version = 0
+        self._legal_version = -1
+        self._legal = ()
+        self._legal_targets = {}
+
+        for p in self.players:
+            p.draw_card(3)
+        self.player.max_mana = 1
+        self.player.mana = 1
+
+    def clone(self):
+        """Copie indépendante de la partie, sans abonnés (recherche de l'IA)"""
+        other = Match.__new__(Match)
+        other.seed = self.seed
+        other.streams = self.streams
+        other.players = [p.clone() for p in self.players]
+        other.listeners = []
+        other.pending = deque()
+        other.deaths = 0
+        other.active = self.active
+        other.turn_count = self.turn_count
+        other.game_over = self.game_over
+        other.winner = self.winner
+        other.zobrist = self.zobrist
+        other.hash = self.hash
+        # Même état : le cache des coups légaux reste valable
+        other.version = self.version
+        other._legal_version = self._legal_version
+        other._legal = self._legal
+        other._legal_targets = self._legal_targets
+        return other
+
+    def fork(self):
+        """Branche légère de la partie (aperçus, simulations, coups à valider).
+
+        Rien n'est copié tout de suite : la branche partage deck, main,
+        plateau et cimetière avec cette partie et ne copie que ce qu'une
+        action touche, au moment de l'appliquer. La partie d'origine n'est
+        jamais modifiée par la branche. Abandonner la branche ne coûte rien,
+        commit() la fait adopter ; dans les deux cas, elle n'est valable que
+        tant que la partie d'origine ne joue pas d'autre action.
+        """
+        other = Match.__new__(Match)
+        other.__dict__.update(self.__dict__)
+        other.players = [p.fork() for p in self.players]
+        other.listeners = []
+        other.pending = deque()
+        return other
+
+    def commit(self, fork):
+        """Adopte l'état d'une branche issue de fork() (sans rejouer ses événements)"""
+        for mine, theirs in zip(self.players, fork.players):
+            verbose, shared = mine.verbose, mine.shared
+            mine.__dict__.update(theirs.__dict__)
+            mine.verbose = verbose
+            # Zones copiées par la branche : elles nous appartiennent désormais
+            mine.shared = shared & theirs.shared
+        self.active = fork.active
+        self.turn_count = fork.turn_count
+        self.game_over = fork.game_over
+        self.winner = fork.winner
+        self.hash = fork.hash
+        self.touch()
+
+    def preview(self, action):
+        """Branche où `action` a été jouée, None si elle est impossible"""
+        fork = self.fork()
+        return fork if fork.apply(action) else None
+
+    def attack_outcome(self, index, side, slot=HERO):
+        """PV (attaquant, cible) après une attaque, sans toucher à la partie. None si impossible"""
+        action = Action(ActionType.ATTACK, index, side, slot)
+        fork = self.fork()
+        # Copie tout de suite les zones touchées pour garder la main sur les unités copiées
+        fork.own_touched(fork.touched_by(action))
+        me = fork.current
+        if not (0 <= index < len(me.board)): return None
+        attacker = me.board[index]
+        target = fork.resolve_target(side, slot)
+        if target is None or not fork.apply(action): return None
+        return attacker.current_health, target.health if slot == HERO else target.current_health
+
+    def own_touched(self, touched):
+        """Copie à l'écriture des zones partagées qu'une action va modifier"""
+        for zone in touched:
+            kind = zone[0]
+            if kind == ZONE_TURN: continue
+            p = self.players[zone[1]]
+            shared = p.shared
+            if not shared: continue
+            if kind == ZONE_PLAYER:
+                if 'deck' in shared: p.own('deck')
+            elif kind == ZONE_HAND:
+                if 'hand' in shared: p.own('hand')
+            else:
+                if 'board' in shared: p.own('board')
+                if 'graveyard' in shared: p.own('graveyard')
+
+    # --- Hachage Zobrist (optionnel, pour la recherche de l'IA) ---
+    def enable_hashing(self, zobrist, known_hash=None):
+        """Active le hash incrémental : self.hash suit chaque action appliquée"""
+        self.zobrist = zobrist
+        self.hash = zobrist.full_hash(self) if known_hash is None else known_hash
+
+    def disable_hashing(self):
+        self.zobrist = None
+
+    def touched_by(self, action):
+        """Les zones qu'une action peut modifier, pour ne rehacher qu'elles"""
+        me = self.active
+        if action.type == ActionType.END_TURN:
+            # Pioche et réveil des unités du camp qui reprend la main
+            incoming = 1 - me
+            return ((ZONE_TURN,), (ZONE_PLAYER, incoming), (ZONE_HAND, incoming), (ZONE_BOARD, incoming))
+        if action.type == ActionType.PLAY_UNIT:
+            hand = self.current.hand
+            if not (0 <= action.index < len(hand) and PLAY_KEYWORDS & int(hand[action.index].template.keywords)):
+                return ((ZONE_PLAYER, me), (ZONE_HAND, me), (ZONE_BOARD, me))
+            # Un Cri de guerre peut toucher les deux camps
+            return ((ZONE_PLAYER, 0), (ZONE_PLAYER, 1), (ZONE_HAND, me), (ZONE_BOARD, 0), (ZONE_BOARD, 1))
+        # Les morts décalent les slots : les deux plateaux sont rehachés
+        touched = ((ZONE_PLAYER, 0), (ZONE_PLAYER, 1), (ZONE_BOARD, 0), (ZONE_BOARD, 1))
+        if action.type == ActionType.PLAY_RITUAL:
+            touched += ((ZONE_HAND, me),)
+        return touched
+
+    # --- Accès aux camps ---
+    @property
+    def player(self):
+        return self.players[0]
+
+    @property
+    def opponent(self):
+        return self.players[1]
+
+    @property
+    def current(self):
+        return self.players[self.active]
+
+    @property
+    def waiting(self):
+        return self.players[1 - self.active]
+
+    def side_of(self, player):
+        return 0 if player is self.players[0] else 1
+
+    def resolve_target(self, side, slot):
+        """(camp, slot) -> Player ou unité, None si le slot n'existe pas"""
+        if side not in (0, 1): return None
+        owner = self.players[side]
+        if slot == HERO: return owner
+        if 0 <= slot < len(owner.board): return owner.board[slot]
+        return None
+
+    def target_ref(self, target):
+        """Inverse de resolve_target : Player ou unité -> (camp, slot)"""
+        for side, p in enumerate(self.players):
+            if target is p: return side, HERO
+            for slot, unit in enumerate(p.board):
+                if unit is target: return side, slot
+        return None
+
+    # --- Abonnements ---
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def emit(self, event_type, target=None, value=0, source=None):
+        if not self.listeners: return
+        event = MatchEvent(event_type, target, value, source)
+        for listener in self.listeners:
+            listener(event)
+
+    # --- Actions ---
+    def touch(self):
+        """Signale un changement d'état fait hors de apply() (rechargement, déterminisation...)"""
+        self.version += 1
+
+    def legal_actions(self):
+        """Toutes les actions légales du camp actif, fin de tour comprise.
+
+        Le résultat (un tuple) est recalculé seulement quand la version de
+        l'état change : on peut l'interroger à chaque image sans coût.
+        """
+        if self._legal_version != self.version:
+            self._legal = tuple(self.generate_legal_actions())
+            targets = {}
+            for action in self._legal:
+                targets.setdefault((action.type, action.index), []).append((action.target_side, action.target_slot))
+            self._legal_targets = targets
+            self._legal_version = self.version
+        return self._legal
+
+    def legal_targets(self, action_type, index):
+        """Cibles (camp, slot) légales pour jouer / faire attaquer la carte `index`"""
+        self.legal_actions()
+        return self._legal_targets.get((action_type, index), ())
+
+    def can_play(self, index):
+        """La carte `index` de la main du camp actif peut-elle être jouée maintenant ?"""
+        self.legal_actions()
+        targets = self._legal_targets
+        return (ActionType.PLAY_UNIT, index) in targets or (ActionType.PLAY_RITUAL, index) in targets
+
+    def generate_legal_actions(self):
+        """Énumère les actions légales (sans cache, voir legal_actions)"""
+        if self.game_over: return []
+        me = self.current
+        foe_side = 1 - self.active
+        foe = self.players[foe_side]
+        result = []
+
+        board_full = len(me.board) >= 7
+        for i, card in enumerate(me.hand):
+            if card.mana_cost > me.mana: continue
+            if isinstance(card, UnitCard):
+                if not board_full: result.append(Action(ActionType.PLAY_UNIT, i))
+            elif card.effect is not None:
+                effect = card.effect
+                if effect.target == TARGET_NONE:
+                    result.append(Action(ActionType.PLAY_RITUAL, i))
+                    continue
+                for side, p in enumerate(self.players):
+                    if effect.target == TARGET_ANY:
+                        result.append(Action(ActionType.PLAY_RITUAL, i, side, HERO))
+                    for slot in range(len(p.board)):
+                        result.append(Action(ActionType.PLAY_RITUAL, i, side, slot))
+
+        targets = [HERO] if foe.hero_can_be_attacked() else []
+        targets += [slot for slot, unit in enumerate(foe.board) if foe.can_be_attacked(unit)]
+        for i, unit in enumerate(me.board):
+            if unit.can_attack:
+                for slot in targets:
+                    result.append(Action(ActionType.ATTACK, i, foe_side, slot))
+
+        result.append(Action(ActionType.END_TURN))
+        return result
+
+    def apply(self, action):
+        """Point d'entrée unique : applique une Action du camp actif, renvoie True si elle a eu lieu"""
+        if self.game_over: return False
+        zobrist = self.zobrist
+        touched = None
+        if self.players[0].shared or self.players[1].shared:
+            touched = self.touched_by(action)
+            self.own_touched(touched)
+        if zobrist is not None:
+            touched = touched or self.touched_by(action)
+            before = zobrist.parts(self, touched)
+
+        if action.type == ActionType.PLAY_UNIT:
+            done = self._play_unit(action.index)
+        elif action.type == ActionType.PLAY_RITUAL:
+            done = self._play_ritual(action.index, action.target_side, action.target_slot)
+        elif action.type == ActionType.ATTACK:
+            done = self._attack(action.index, action.target_side, action.target_slot)
+        else:
+            done = self._end_turn()
+
+        if done:
+            self.version += 1
+            if zobrist is not None:
+                self.hash ^= before ^ zobrist.parts(self, touched)
+        return done
+
+    def play_unit(self, index):
+        return self.apply(Action(ActionType.PLAY_UNIT, index))
+
+    def play_ritual(self, index, side, slot=HERO):
+        return self.apply(Action(ActionType.PLAY_RITUAL, index, side, slot))
+
+    def attack(self, index, side, slot=HERO):
+        return self.apply(Action(ActionType.ATTACK, index, side, slot))
+
+    def end_turn(self):
+        return self.apply(Action(ActionType.END_TURN))
+
+    def _play_unit(self, index):
+        me = self.current
+        if not me.play_unit(index): return False
+        unit = me.board[-1]
+        self.emit(EventType.ACTION, value=Action(ActionType.PLAY_UNIT, index), source=me)
+        self.emit(EventType.UNIT_PLAYED, unit, source=me)
+        self.fire(Trigger.ON_PLAY, unit, self.active)
+        if self.pending: self.resolve()
+        return True
+
+    def _play_ritual(self, index, side, slot=HERO):
+        """Rituel du camp actif : l'effet compilé de la carte fait le travail"""
+        me = self.current
+        if not (0 <= index < len(me.hand)): return False
+        card = me.hand[index]
+        effect = card.template.effect
+        if effect is None: return False
+        if effect.target == TARGET_NONE:
+            # Effet de zone : la cible éventuelle de l'action est ignorée
+            target = None
+        else:
+            target = self.resolve_target(side, slot)
+            if target is None: return False
+            if not effect.accepts(slot):
+                me.log("Impossible : Ce rituel cible uniquement les unités !")
+                return False
+        if not me.play_ritual(index, getattr(target, 'name', None)): return False
+        self.emit(EventType.ACTION, value=Action(ActionType.PLAY_RITUAL, index, side, slot), source=me)
+        self.emit(EventType.RITUAL_CAST, target, card.effect_value, source=card)
+        effect.apply(self, self.active, side, slot, card)
+        self.resolve()
+        return True
+
+    def _attack(self, index, side, slot=HERO):
+        """Attaque d'une unité du camp actif, avec les règles Furtivité / Provocation"""
+        me = self.current
+        if side == self.active or not (0 <= index < len(me.board)): return False
+        attacker = me.board[index]
+        target = self.resolve_target(side, slot)
+        if target is None or not attacker.can_attack: return False
+
+        defender = self.players[side]
+        if slot == HERO:
+            legal = defender.hero_can_be_attacked()
+        else:
+            if target in defender.stealth_units:
+                self.emit(EventType.STEALTH_BLOCKED, target, source=attacker)
+                return False
+            legal = defender.can_be_attacked(target)
+        if not legal:
+            self.emit(EventType.TAUNT_BLOCKED, target, source=attacker)
+            return False
+
+        self.emit(EventType.ACTION, value=Action(ActionType.ATTACK, index, side, slot), source=me)
+        self.resolve_combat(attacker, target, me, defender)
+        return True
+
+    def resolve_combat(self, attacker, target, owner, defender):
+        owner_side = self.active
+        damage_to_target = attacker.current_attack
+        damage_to_attacker = 0
+
+        if isinstance(target, UnitCard):
+            damage_to_attacker = target.current_attack
+
+            if Keyword.POISONOUS in attacker.keywords: damage_to_target = 999
+            if Keyword.POISONOUS in target.keywords: damage_to_attacker = 999
+
+            if Keyword.DIVINE_SHIELD in target.keywords:
+                damage_to_target = 0
+                defender.remove_keyword(target, Keyword.DIVINE_SHIELD)
+                self.emit(EventType.SHIELD_BLOCKED, target, source=attacker)
+
+            if damage_to_target > 0:
+                self.damage_unit(target, damage_to_target, attacker)
+
+            if Keyword.DIVINE_SHIELD in attacker.keywords:
+                damage_to_attacker = 0
+                owner.remove_keyword(attacker, Keyword.DIVINE_SHIELD)
+                self.emit(EventType.SHIELD_BLOCKED, attacker, source=target)
+
+            if damage_to_attacker > 0:
+                self.damage_unit(attacker, damage_to_attacker, target)
+                self.fire(Trigger.ON_DAMAGE, target, 1 - owner_side, min(damage_to_attacker, target.current_attack))
+
+        elif isinstance(target, Player):
+            self.damage_hero(target, damage_to_target, attacker)
+
+        if damage_to_target > 0:
+            self.fire(Trigger.ON_DAMAGE, attacker, owner_side, min(damage_to_target, attacker.current_attack))
+
+        # Attaquer révèle l'unité
+        if attacker in owner.stealth_units: owner.remove_keyword(attacker, Keyword.STEALTH)
+
+        attacker.attacks_left -= 1
+        attacker.can_attack = attacker.attacks_left > 0
+        self.resolve()
+
+    # --- Dégâts, déclencheurs et morts ---
+    def damage_unit(self, unit, amount, source=None):
+        """Blesse une unité ; si elle meurt, elle reste en jeu jusqu'à la phase des morts"""
+        if unit.is_dead: return
+        unit.take_damage(amount)
+        self.emit(EventType.DAMAGE, unit, amount, source=source)
+        if unit.is_dead: self.deaths += 1
+
+    def damage_hero(self, player, amount, source=None):
+        player.health -= amount
+        self.emit(EventType.DAMAGE, player, amount, source=source)
+
+    def fire(self, when, unit, side, value=0):
+        """Met en file les déclencheurs `when` d'une unité (rien si elle n'a pas la compétence)"""
+        keywords = TRIGGER_MASKS[when] & int(unit.keywords)
+        if not keywords: return
+        handlers = TRIGGERS[when]
+        for keyword in Keyword.split(keywords):
+            self.pending.append((handlers[keyword], unit, side, value))
+
+    def resolve(self):
+        """Déroule la file des déclencheurs et les morts, par lots, jusqu'au calme"""
+        pending = self.pending
+        while pending or self.deaths:
+            while pending:
+                handler, unit, side, value = pending.popleft()
+                handler(self, unit, side, value)
+            if self.deaths: self.remove_dead()
+        self.check_game_over()
+
+    def remove_dead(self):
+        """Phase des morts : retire d'un coup toutes les unités mortes, camp actif d'abord"""
+        self.deaths = 0
+        for side in (self.active, 1 - self.active):
+            p = self.players[side]
+            for unit in p.remove_dead_units():
+                self.emit(EventType.UNIT_DIED, unit, source=p)
+                self.fire(Trigger.ON_DEATH, unit, side)
+
+    def check_game_over(self):
+        if self.game_over: return
+        if self.opponent.health <= 0: self.finish(0)
+        elif self.player.health <= 0: self.finish(1)
+
+    def finish(self, winner):
+        self.game_over = True
+        self.winner = winner
+        self.emit(EventType.GAME_OVER, self.players[winner], winner)
+
+    def _end_turn(self):
+        """Passe la main à l'autre camp (pioche, mana, réveil des unités)"""
+        self.emit(EventType.ACTION, value=Action(ActionType.END_TURN), source=self.current)
+        self.active = 1 - self.active
+        self.turn_count += 1
+        incoming = self.current
+        incoming.start_turn()
+        if incoming.turn_start_units:
+            for unit in list(incoming.turn_start_units):
+                self.fire(Trigger.TURN_START, unit, self.active)
+            self.resolve()
+        self.emit(EventType.TURN_STARTED, self.current, self.turn_count)
+        return True
@@ -0,0 +1,217 @@
+import math
+import random
+import time
+from models.card_types import UnitCard
+from engine.actions import ActionType, HERO
+from engine.effects import TARGET_NONE, TARGET_ANY
+from engine.evaluation import default_evaluator
+from engine.lethal import LethalSolver, play_lethal
+from engine.zobrist import Zobrist, TranspositionTable
+
+class MCTSNode:
+    """Une position du tour de l'IA. Partagée entre chemins grâce à la table de transposition"""
+    __slots__ = ('edges', 'untried', 'visits', 'value', 'terminal')
+
+    def __init__(self, terminal=False):
+        self.edges = []     # [(action, noeud enfant)]
+        self.untried = None # Rempli à la première visite (actions légales)
+        self.visits = 0
+        self.value = 0.0
+        self.terminal = terminal
+
+    def best_edge(self, exploration):
+        log_n = math.log(self.visits)
+        best, best_score = None, -1.0
+        for edge in self.edges:
+            child = edge[1]
+            score = child.value / child.visits + exploration * math.sqrt(log_n / child.visits)
+            if score > best_score:
+                best, best_score = edge, score
+        return best
+
+    def most_visited(self):
+        return max(self.edges, key=lambda edge: edge[1].visits) if self.edges else None
+
+class MCTSAI:
+    """IA par recherche Monte Carlo (UCT) sur les actions du tour courant.
+
+    La main et le deck adverses sont inconnus : à chaque itération ils sont
+    redistribués au hasard (déterminisation), ainsi que l'ordre de notre
+    propre deck. Les feuilles sont évaluées après quelques tours de jeu
+    rapide (playout).
+
+    Les positions sont hachées (Zobrist, vue du camp qui cherche) : un ordre
+    d'attaques différent qui mène à la même position retombe sur le même
+    noeud via la table de transposition, au lieu de dupliquer le sous-arbre.
+
+    yield_ms : dans un thread à côté de l'affichage, relâche le GIL toutes
+    les yield_ms de recherche (0 : jamais, pour les processus dédiés).
+    """
+    def __init__(self, budget_ms=500, exploration=1.0, playout_turns=2, rng=None, tt_size_log2=16, evaluator=None, yield_ms=0):
+        self.budget_ms = budget_ms
+        self.yield_ms = yield_ms
+        self.exploration = exploration
+        self.playout_turns = playout_turns
+        self.rng = rng or random.Random()
+        self.tt = TranspositionTable(tt_size_log2)
+        self.zobrist = {}
+        self.lethal = LethalSolver()
+        self.evaluator = evaluator or default_evaluator()
+        self.last_iterations = 0
+
+    # --- Boucle du tour ---
+    def play_turn(self, match):
+        """Joue le tour du camp actif dans le budget de temps, sans finir le tour"""
+        side = match.active
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        root = None
+        self.last_iterations = 0
+        if play_lethal(match, self.lethal): return
+        self.tt.new_search()
+        while not match.game_over and match.active == side:
+            # Chaque décision prend la moitié du temps restant ; l'arbre est réutilisé
+            now = time.perf_counter()
+            slice_end = now + max(0.0, deadline - now) / 2
+            root = self.search(match, slice_end, root)
+            best = root.most_visited()
+            if best is None or best[0].type == ActionType.END_TURN: return
+            match.apply(best[0])
+            root = best[1]
+
+    def search(self, match, deadline, root=None):
+        root = root or MCTSNode()
+        side = match.active
+        zobrist = self.zobrist.get(side)
+        if zobrist is None:
+            zobrist = self.zobrist[side] = Zobrist(observer=side)
+        tt = self.tt
+        # Vu de `side`, la déterminisation ne change pas le hash : calculé une fois
+        root_hash = zobrist.full_hash(match)
+
+        pause = self.yield_ms / 1000
+        next_pause = time.perf_counter() + pause
+        # Au moins une itération, même budget épuisé
+        while True:
+            state = self.determinize(match, side)
+            state.enable_hashing(zobrist, root_hash)
+            node = root
+            path = [root]
+
+            # 1. Sélection / 2. Expansion (la fin de tour est une feuille de l'arbre)
+            while not node.terminal and not state.game_over:
+                if node.untried is None:
+                    node.untried = self.candidate_actions(state)
+                    self.rng.shuffle(node.untried)
+                if node.untried:
+                    action = node.untried.pop()
+                    state.apply(action)
+                    is_end = action.type == ActionType.END_TURN
+                    child = None if is_end else tt.probe(state.hash)
+                    expanded = child is None
+                    if expanded:
+                        child = MCTSNode(terminal=is_end)
+                        if not is_end: tt.store(state.hash, child, -len(path))
+                    node.edges.append((action, child))
+                    path.append(child)
+                    node = child
+                    # Transposition : le noeud a déjà des stats, on continue à descendre
+                    if expanded: break
+                    continue
+                if not node.edges: break
+                action, node = node.best_edge(self.exploration)
+                state.apply(action)
+                path.append(node)
+
+            # 3. Playout (hors de l'arbre : plus besoin du hash) / 4. Rétropropagation
+            state.disable_hashing()
+            reward = self.playout(state, side)
+            for visited in path:
+                visited.visits += 1
+                visited.value += reward
+            self.last_iterations += 1
+            now = time.perf_counter()
+            if now >= deadline: return root
+            if pause and now >= next_pause:
+                # Sans cela, le thread d'affichage attend le GIL jusqu'à 5 ms à chaque frame
+                time.sleep(0)
+                next_pause = now + pause
+
+    # --- Information cachée ---
+    def determinize(self, match, side):
+        """Copie de la partie où les cartes inconnues de `side` sont redistribuées"""
+        state = match.clone()
+        rng = self.rng
+        foe = state.players[1 - side]
+        hidden = [card.template for card in foe.hand] + foe.deck
+        rng.shuffle(hidden)
+        hand_size = len(foe.hand)
+        foe.hand = [template.create() for template in hidden[:hand_size]]
+        foe.deck = hidden[hand_size:]
+        rng.shuffle(state.players[side].deck)
+        state.touch()
+        return state
+
+    def candidate_actions(self, state):
+        """Actions légales, sans les rituels absurdes (dégâts sur soi, buff adverse)"""
+        if state.game_over: return []
+        me_side = state.active
+        actions = []
+        for action in state.legal_actions():
+            if action.type == ActionType.PLAY_RITUAL:
+                effect = state.current.hand[action.index].effect
+                if effect.target != TARGET_NONE and effect.hostile != (action.target_side != me_side): continue
+            actions.append(action)
+        return actions
+
+    # --- Playout ---
+    def playout(self, state, side):
+        """Termine le tour, joue quelques tours rapides et évalue la position pour `side`"""
+        if not state.game_over and state.active == side:
+            self.fast_turn(state)
+            state.end_turn()
+        for _ in range(self.playout_turns - 1):
+            if state.game_over: break
+            self.fast_turn(state)
+            state.end_turn()
+        return self.evaluate(state, side)
+
+    def fast_turn(self, state):
+        """Politique de playout : tout ce qui est payable, puis attaques légales au hasard"""
+        rng = self.rng
+        me = state.current
+        my_side = state.active
+        foe_side = 1 - my_side
+        foe = state.players[foe_side]
+
+        for i in range(len(me.hand) - 1, -1, -1):
+            if state.game_over: return
+            card = me.hand[i]
+            if card.mana_cost > me.mana: continue
+            if isinstance(card, UnitCard):
+                state.play_unit(i)
+            elif card.effect is None: continue
+            elif card.effect.target == TARGET_NONE:
+                state.play_ritual(i, foe_side, HERO)
+            elif card.effect.hostile:
+                if card.effect.target == TARGET_ANY: state.play_ritual(i, foe_side, HERO)
+                elif foe.board: state.play_ritual(i, foe_side, rng.randrange(len(foe.board)))
+            elif me.board:
+                state.play_ritual(i, my_side, rng.randrange(len(me.board)))
+
+        i = 0
+        while i < len(me.board) and not state.game_over:
+            if not me.board[i].can_attack:
+                i += 1
+                continue
+            if foe.taunt_units:
+                slot = foe.board.index(rng.choice(list(foe.taunt_units)))
+            else:
+                slots = [s for s, u in enumerate(foe.board) if u not in foe.stealth_units]
+                slot = HERO if not slots or rng.random() < 0.5 else rng.choice(slots)
+            before = len(me.board)
+            # Si l'attaquant est mort, le suivant a pris sa place
+            if not state.attack(i, foe_side, slot) or len(me.board) == before: i += 1
+
+    def evaluate(self, state, side):
+        """Score dans [0, 1] du point de vue de `side` (engine.evaluation)"""
+        return self.evaluator.score(state, side)
@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from engine.actions import ActionType
+from engine.lethal import LethalSolver, play_lethal
+from engine.mcts import MCTSAI
+
+# Pools partagés (un par nombre de workers), créés à la première recherche
+_pools = {}
+
+def _init_worker():
+    # Priorité basse : sur un coeur partagé, l'affichage du jeu passe avant la recherche
+    if hasattr(os, 'nice'): os.nice(10)
+
+def get_pool(workers):
+    pool = _pools.get(workers)
+    if pool is None:
+        # 'spawn' : les workers ne doivent rien hériter de pygame / SDL
+        pool = _pools[workers] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"),
+                                                     initializer=_init_worker)
+    return pool
+
+def shutdown_pools():
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+def _search_root(match, budget_ms, seed, options):
+    """Exécuté dans un worker : une recherche complète, renvoie les stats de la racine"""
+    ai = MCTSAI(budget_ms=budget_ms, rng=random.Random(seed), **options)
+    root = ai.search(match, time.perf_counter() + budget_ms / 1000)
+    return [(action, child.visits, child.value) for action, child in root.edges], ai.last_iterations
+
+class RootParallelMCTS:
+    """MCTS parallélisé à la racine.
+
+    Chaque worker cherche sur sa propre copie de la position, avec sa graine
+    et donc ses propres déterminisations. Les visites et valeurs des actions
+    de la racine sont ensuite additionnées : à budget égal, N workers
+    donnent environ N fois plus d'itérations pour la même décision.
+    """
+    def __init__(self, budget_ms=500, workers=None, rng=None, **mcts_options):
+        self.budget_ms = budget_ms
+        self.workers = workers or os.cpu_count() or 1
+        self.rng = rng or random.Random()
+        self.mcts_options = mcts_options
+        self.lethal = LethalSolver()
+        self.last_iterations = 0
+        self._turn = None
+        self._deadline = 0.0
+
+    def decision_budget_ms(self, match):
+        """Moitié du temps restant sur le tour (le tour change -> nouveau budget)"""
+        now = time.perf_counter()
+        if self._turn != match.turn_count:
+            self._turn = match.turn_count
+            self._deadline = now + self.budget_ms / 1000
+            self.last_iterations = 0
+        return max(10.0, (self._deadline - now) * 1000 / 2)
+
+    def submit(self, match):
+        """Lance une décision sur tous les workers sans bloquer.
+
+        Renvoie un Future dont le résultat est l'Action retenue (END_TURN
+        pour finir le tour).
+        """
+        state = match.clone()
+        budget = self.decision_budget_ms(match)
+        pool = get_pool(self.workers)
+        result = Future()
+        merged = {}
+        lock = threading.Lock()
+        remaining = [self.workers]
+
+        def on_done(future):
+            with lock:
+                if future.exception() is None:
+                    edges, iterations = future.result()
+                    self.last_iterations += iterations
+                    for action, visits, value in edges:
+                        stats = merged.setdefault(action, [0, 0.0])
+                        stats[0] += visits
+                        stats[1] += value
+                remaining[0] -= 1
+                if remaining[0] > 0: return
+            if merged:
+                result.set_result(max(merged, key=lambda a: merged[a][0]))
+            else:
+                result.set_exception(RuntimeError("Aucun worker n'a rendu de résultat"))
+
+        for _ in range(self.workers):
+            seed = self.rng.getrandbits(32)
+            pool.submit(_search_root, state, budget, seed, self.mcts_options).add_done_callback(on_done)
+        return result
+
+    def play_turn(self, match):
+        """Version bloquante (simulations sans affichage)"""
+        side = match.active
+        if play_lethal(match, self.lethal): return
+        while not match.game_over and match.active == side:
+            action = self.submit(match).result()
+            if action.type == ActionType.END_TURN: return
+            match.apply(action)
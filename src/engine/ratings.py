@@ -0,0 +1,52 @@
+"""Classements Elo et Glicko, mis à jour partie par partie (score : 1 victoire, 1/2 nulle, 0 défaite)."""
+import math
+
+class Elo:
+    def __init__(self, k=24, initial=1500):
+        self.k = k
+        self.initial = initial
+        self.ratings = {}
+
+    def rating(self, name):
+        return self.ratings.get(name, self.initial)
+
+    def expected(self, a, b):
+        """Score attendu de `a` contre `b`"""
+        return 1.0 / (1.0 + 10 ** ((self.rating(b) - self.rating(a)) / 400))
+
+    def update(self, a, b, score):
+        delta = self.k * (score - self.expected(a, b))
+        self.ratings[a] = self.rating(a) + delta
+        self.ratings[b] = self.rating(b) - delta
+
+class Glicko:
+    """Glicko-1, chaque partie étant sa propre période (écart minimal `min_rd` pour rester mobile)"""
+    Q = math.log(10) / 400
+
+    def __init__(self, initial=1500, rd=350, min_rd=30):
+        self.initial = initial
+        self.initial_rd = rd
+        self.min_rd = min_rd
+        self.ratings = {}  # nom -> (classement, écart)
+
+    def rating(self, name):
+        return self.ratings.get(name, (self.initial, self.initial_rd))
+
+    @classmethod
+    def g(cls, rd):
+        return 1.0 / math.sqrt(1 + 3 * (cls.Q * rd / math.pi) ** 2)
+
+    def updated(self, player, opponent, score):
+        """Nouveau (classement, écart) de `player` après une partie contre `opponent`"""
+        r, rd = player
+        r_op, rd_op = opponent
+        g = self.g(rd_op)
+        expected = 1.0 / (1.0 + 10 ** (-g * (r - r_op) / 400))
+        d2 = 1.0 / (self.Q ** 2 * g ** 2 * expected * (1 - expected))
+        denominator = 1.0 / rd ** 2 + 1.0 / d2
+        return r + self.Q / denominator * g * (score - expected), max(self.min_rd, math.sqrt(1.0 / denominator))
+
+    def update(self, a, b, score):
+        ra, rb = self.rating(a), self.rating(b)
+        self.ratings[a] = self.updated(ra, rb, score)
+        self.ratings[b] = self.updated(rb, ra, 1 - score)
@@ -0,0 +1,33 @@
+import hashlib
+import random
+
+def new_seed():
+    """Graine fraîche (32 bits, facile à recopier depuis un log)"""
+    return random.SystemRandom().getrandbits(32)
+
+def derive_seed(seed, *path):
+    """Graine fille déterministe : derive_seed(maître, n° de partie), derive_seed(partie, 'ai:1')...
+
+    Passer par blake2b donne des graines indépendantes : deux flux dérivés
+    de la même graine maître ne se recouvrent pas, quel que soit le
+    processus qui les calcule.
+    """
+    digest = hashlib.blake2b(repr((seed,) + path).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+class RandomStreams:
+    """Les flux aléatoires d'une partie, tous dérivés de sa graine.
+
+    Un flux par usage ('deck:0', 'deck:1', 'ai:0', 'ai:1'...) : consommer
+    plus ou moins de hasard dans l'un (une IA qui réfléchit plus longtemps)
+    ne décale pas les autres.
+    """
+    def __init__(self, seed):
+        self.seed = seed
+        self.streams = {}
+
+    def get(self, name):
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = random.Random(derive_seed(self.seed, name))
+        return stream
@@ -0,0 +1,102 @@
+from engine.ai import GreedyAI
+from engine.events import EventType
+from engine.match import Match
+
+class SelfPlayStats:
+    """Agrégat de parties IA contre IA, fusionnable entre processus"""
+    def __init__(self, card_ids=()):
+        self.games = 0
+        self.wins = [0, 0]
+        self.draws = 0
+        self.total_turns = 0
+        self.longest = (0, None) # (tours, graine) de la partie la plus longue, pour la rejouer
+        # id -> [parties jouées, victoires quand jouée, nombre de poses, parties en deck, victoires en deck]
+        self.cards = {card_id: [0, 0, 0, 0, 0] for card_id in card_ids}
+
+    def card_entry(self, card_id):
+        entry = self.cards.get(card_id)
+        if entry is None:
+            entry = self.cards[card_id] = [0, 0, 0, 0, 0]
+        return entry
+
+    def record(self, match, played, in_deck):
+        """played / in_deck : pour chaque camp, {card_id: nombre de poses} et l'ensemble des ids du deck"""
+        self.games += 1
+        self.total_turns += match.turn_count
+        if match.turn_count > self.longest[0]: self.longest = (match.turn_count, match.seed)
+        if match.winner is None: self.draws += 1
+        else: self.wins[match.winner] += 1
+
+        for side in (0, 1):
+            won = 1 if match.winner == side else 0
+            for card_id in in_deck[side]:
+                entry = self.card_entry(card_id)
+                entry[3] += 1
+                entry[4] += won
+            for card_id, count in played[side].items():
+                entry = self.card_entry(card_id)
+                entry[0] += 1
+                entry[1] += won
+                entry[2] += count
+
+    def merge(self, other):
+        self.games += other.games
+        self.wins[0] += other.wins[0]
+        self.wins[1] += other.wins[1]
+        self.draws += other.draws
+        self.total_turns += other.total_turns
+        if other.longest[0] > self.longest[0]: self.longest = other.longest
+        for card_id, values in other.cards.items():
+            entry = self.card_entry(card_id)
+            for i, v in enumerate(values):
+                entry[i] += v
+
+    def win_rate(self, side):
+        return self.wins[side] / self.games if self.games else 0.0
+
+    def average_length(self):
+        return self.total_turns / self.games if self.games else 0.0
+
+    def card_report(self):
+        """Liste (id, poses, winrate jouée, winrate en deck sans être jouée, écart) triée par écart"""
+        rows = []
+        for card_id, (games, wins, plays, deck_games, deck_wins) in self.cards.items():
+            wr_played = wins / games if games else 0.0
+            idle_games = deck_games - games
+            wr_idle = (deck_wins - wins) / idle_games if idle_games > 0 else 0.0
+            delta = wr_played - wr_idle if games and idle_games > 0 else 0.0
+            rows.append((card_id, plays, wr_played, wr_idle, delta))
+        rows.sort(key=lambda row: row[4], reverse=True)
+        return rows
+
+def play_match(card_pool, ais=None, max_turns=200, seed=None, verbose=False, journal=None, decks=(None, None)):
+    """Joue une partie complète IA contre IA, renvoie (match, poses par camp, ids en deck par camp).
+
+    Avec les IA par défaut, la partie ne dépend que de `seed` : la même
+    graine la rejoue à l'identique. `journal` : JournalWriter qui enregistre la partie.
+    `decks` : decks imposés (voir Match), dans ce cas la partie n'est pas rejouable depuis le journal.
+    """
+    match = Match(card_pool, ai_sides=(True, True), verbose=verbose, seed=seed, decks=decks)
+    if journal: journal.start(match)
+    ais = ais or (GreedyAI(match.streams.get("ai:0")), GreedyAI(match.streams.get("ai:1")))
+
+    in_deck = [{card.id for card in p.deck + p.hand} for p in match.players]
+    played = [{}, {}]
+
+    def on_event(event):
+        if event.type == EventType.UNIT_PLAYED:
+            card_id = event.target.id
+        elif event.type == EventType.RITUAL_CAST:
+            card_id = event.source.id
+        else:
+            return
+        counts = played[match.active]
+        counts[card_id] = counts.get(card_id, 0) + 1
+
+    match.subscribe(on_event)
+    while not match.game_over and match.turn_count < max_turns:
+        ais[match.active].play_turn(match)
+        match.end_turn()
+    match.unsubscribe(on_event)
+    if journal: journal.finish(match)
+    return match, played, in_deck
@@ -0,0 +1,85 @@
+"""Déclencheurs des compétences d'unité (Cri de guerre, Râle d'agonie, Vol de vie...).
+
+Chaque compétence s'abonne à un moment de la partie :
+
+    ON_PLAY     l'unité arrive en jeu
+    ON_DAMAGE   l'unité inflige des dégâts en combat (value = dégâts)
+    ON_DEATH    l'unité vient de mourir
+    TURN_START  début du tour de son propriétaire
+
+La partie ne regarde que les unités qui portent une de ces compétences :
+masque de bits pour une unité donnée (jouée, blessée, morte), et index
+du joueur (Player.turn_start_units) pour le début de tour. Les
+déclencheurs passent par une file (Match.pending) et les morts sont
+traitées par lots (Match.resolve).
+"""
+from enum import Enum, auto
+from constants.enums import Keyword
+from engine.actions import HERO
+from engine.effects import TARGET_NONE, compile_effect, heal_hero, buff_attack
+
+class Trigger(Enum):
+    ON_PLAY = auto()
+    ON_DAMAGE = auto()
+    ON_DEATH = auto()
+    TURN_START = auto()
+
+# Abonnés par moment : Trigger -> {compétence: fonction(match, unité, camp, valeur)}
+TRIGGERS = {when: {} for when in Trigger}
+# Trigger -> masque des compétences abonnées, en int (test O(1) sur une unité :
+# les opérations d'IntFlag sont bien plus lentes que celles d'un int)
+TRIGGER_MASKS = {when: 0 for when in Trigger}
+
+def register_trigger(keyword, when):
+    """Décorateur : abonne la fonction décorée au moment `when` pour `keyword`"""
+    def decorator(handler):
+        TRIGGERS[when][keyword] = handler
+        TRIGGER_MASKS[when] |= int(keyword)
+        return handler
+    return decorator
+
+# --- Effets fixes des compétences sans paramètre ---
+HEAL_EFFECT = compile_effect({"id": "Soins", "effects": [{"type": "heal", "value": 2, "area": "ally_units"}]})
+SACRIFICE_EFFECT = compile_effect({"id": "Sacrifice", "effects": [
+    {"type": "buff_attack", "value": 1, "area": "ally_units"},
+    {"type": "buff_health", "value": 1, "area": "ally_units"}]})
+
+@register_trigger(Keyword.BATTLECRY, Trigger.ON_PLAY)
+def battlecry(match, unit, side, value):
+    """Cri de guerre : l'effet "cri_de_guerre" de la carte"""
+    if unit.template.battlecry: unit.template.battlecry.apply(match, side, side, HERO, unit)
+
+@register_trigger(Keyword.DEATHRATTLE, Trigger.ON_DEATH)
+def deathrattle(match, unit, side, value):
+    """Râle d'agonie : l'effet "rale_agonie" de la carte"""
+    if unit.template.deathrattle: unit.template.deathrattle.apply(match, side, side, HERO, unit)
+
+@register_trigger(Keyword.SACRIFICE, Trigger.ON_DEATH)
+def sacrifice(match, unit, side, value):
+    """Sacrifice : à sa mort, les unités alliées gagnent +1/+1"""
+    SACRIFICE_EFFECT.apply(match, side, side, HERO, unit)
+
+@register_trigger(Keyword.LIFESTEAL, Trigger.ON_DAMAGE)
+def lifesteal(match, unit, side, value):
+    """Vol de vie : les dégâts infligés soignent le héros"""
+    heal_hero(match, match.players[side], value, unit)
+
+@register_trigger(Keyword.HEAL, Trigger.TURN_START)
+def heal(match, unit, side, value):
+    """Soins : en début de tour, rend 2 PV aux unités alliées"""
+    HEAL_EFFECT.apply(match, side, side, HERO, unit)
+
+@register_trigger(Keyword.FORGE, Trigger.TURN_START)
+def forge(match, unit, side, value):
+    """Forge : en début de tour, l'unité gagne +1 en attaque"""
+    if not unit.is_dead: buff_attack(match, unit, 1, unit)
+
+def compile_trigger_effect(data, key):
+    """Effet sans cible d'un Cri de guerre / Râle d'agonie (clé `key` de cards.json)"""
+    specs = data.get(key)
+    if not specs: return None
+    effect = compile_effect({"id": data.get("id"), "effects": specs})
+    if effect is not None and effect.target != TARGET_NONE:
+        print(f"Attention : {key} de {data.get('id')} ne peut pas viser de cible, effet ignoré")
+        return None
+    return effect
@@ -0,0 +1,136 @@
+import hashlib
+
+# Morceaux de l'état qu'une action peut toucher (voir Match.touched_by)
+ZONE_TURN = 0     # (ZONE_TURN,)             camp actif
+ZONE_PLAYER = 1   # (ZONE_PLAYER, camp)      PV, mana, taille du deck
+ZONE_HAND = 2     # (ZONE_HAND, camp)        toute la main
+ZONE_BOARD = 3    # (ZONE_BOARD, camp)       tout le plateau
+
+class Zobrist:
+    """Hachage Zobrist d'une partie.
+
+    Chaque élément (unité à un slot du plateau, carte à un index de la main,
+    compteurs d'un joueur, camp actif) a une clé aléatoire de 64 bits et le
+    hash est le XOR de toutes les clés. Les clés dépendent du slot : deux
+    positions de même hash ont la même disposition, donc les mêmes Actions
+    (indexées) y sont valables. Attaquer avec A puis B ou B puis A ne
+    change pas l'ordre du plateau et donne bien la même position.
+
+    Les clés sont dérivées du contenu par blake2b, donc identiques d'un
+    processus à l'autre. Avec `observer`, la main adverse n'est hachée que
+    par sa taille : c'est l'ensemble d'information de ce camp qui compte.
+    """
+    def __init__(self, observer=None):
+        self.observer = observer
+        self.cache = {}
+
+    def key(self, parts):
+        k = self.cache.get(parts)
+        if k is None:
+            digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).digest()
+            k = self.cache[parts] = int.from_bytes(digest, 'little')
+        return k
+
+    def unit_key(self, side, slot, unit):
+        return self.key((side, slot, unit.template.id, unit.current_attack, unit.current_health, unit.max_health,
+                         int(unit.keywords), unit.can_attack))
+
+    def hand_key(self, side, slot, card):
+        if self.observer is not None and side != self.observer:
+            return self.key((side, slot, 'hidden'))
+        return self.key((side, slot, 'hand', card.template.id))
+
+    def player_key(self, side, player):
+        return self.key((side, player.health, player.mana, player.max_mana, len(player.deck)))
+
+    def turn_key(self, active):
+        return self.key(('turn', active))
+
+    def parts(self, match, touched):
+        """XOR des clés des zones touchées, dans l'état actuel de la partie"""
+        h = 0
+        for zone in touched:
+            kind = zone[0]
+            if kind == ZONE_PLAYER:
+                h ^= self.player_key(zone[1], match.players[zone[1]])
+            elif kind == ZONE_BOARD:
+                side = zone[1]
+                for slot, unit in enumerate(match.players[side].board):
+                    h ^= self.unit_key(side, slot, unit)
+            elif kind == ZONE_HAND:
+                side = zone[1]
+                for slot, card in enumerate(match.players[side].hand):
+                    h ^= self.hand_key(side, slot, card)
+            else:
+                h ^= self.turn_key(match.active)
+        return h
+
+    def full_hash(self, match):
+        touched = [(ZONE_TURN,)]
+        for side in (0, 1):
+            touched += [(ZONE_PLAYER, side), (ZONE_HAND, side), (ZONE_BOARD, side)]
+        return self.parts(match, touched)
+
+class TranspositionTable:
+    """Table de transposition bornée (2^size_log2 cases), indexée par hash.
+
+    Remplacement : une case est écrasée si elle est vide, si elle contient
+    déjà cette position, si elle date d'une recherche précédente
+    (génération plus ancienne) ou si la nouvelle entrée est au moins aussi
+    prioritaire. Sinon l'écriture est refusée.
+    """
+    def __init__(self, size_log2=16):
+        self.mask = (1 << size_log2) - 1
+        self.keys = [None] * (self.mask + 1)
+        self.values = [None] * (self.mask + 1)
+        self.priorities = [0] * (self.mask + 1)
+        self.generations = [0] * (self.mask + 1)
+        self.generation = 0
+
+        # Compteurs
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+        self.rejected = 0
+
+    def new_search(self):
+        """Les entrées existantes deviennent remplaçables en priorité"""
+        self.generation += 1
+
+    def probe(self, key):
+        self.probes += 1
+        i = key & self.mask
+        if self.keys[i] == key:
+            self.hits += 1
+            return self.values[i]
+        return None
+
+    def store(self, key, value, priority=0):
+        i = key & self.mask
+        stored = self.keys[i]
+        if stored is not None and stored != key:
+            if self.generations[i] == self.generation and priority < self.priorities[i]:
+                self.rejected += 1
+                return False
+            self.replacements += 1
+        self.keys[i] = key
+        self.values[i] = value
+        self.priorities[i] = priority
+        self.generations[i] = self.generation
+        self.stores += 1
+        return True
+
+    def clear(self):
+        size = self.mask + 1
+        self.keys = [None] * size
+        self.values = [None] * size
+        self.priorities = [0] * size
+        self.generations = [0] * size
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+    def __len__(self):
+        return sum(1 for k in self.keys if k is not None)
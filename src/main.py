@@ -7,6 +7,7 @@ from menus.options_menu import OptionsMenu
 from menus.collection_menu import CollectionMenu
 from menus.game_scene import GameScene
 from utils.card_manager import CardManager
+from engine.parallel import shutdown_pools
 
 class Game:
     def __init__(self):
@@ -45,6 +46,10 @@ class Game:
         
         pygame.display.set_caption("Shimatori TCG")
         self.clock = pygame.time.Clock()
+        try:
+            self.fps_limit = int(self.config["fps_limit"])
+        except (TypeError, ValueError):
+            self.fps_limit = 60
         self.running = True
         
         # 4. Appliquer le volume sonore immédiatement
@@ -74,7 +79,9 @@ class Game:
         
         default = {
             "music_volume": 70, "sfx_volume": 80, "fullscreen": False,
-            "resolution": "1280x720", "language": "Français", "vsync": True
+            "resolution": "1280x720", "language": "Français", "vsync": True,
+            "ai_mode": "greedy", "ai_budget_ms": 500, "ai_workers": 0, "ai_step_ms": 600,
+            "lethal_hint": False, "particles": True, "fps_limit": 60
         }
         
         try:
@@ -110,8 +117,9 @@ class Game:
                 self.current_state.draw()
 
             pygame.display.flip()
-            self.clock.tick(60) # Limite à 60 FPS pour éviter de surchauffer le CPU
+            self.clock.tick(self.fps_limit) # Limite de FPS (config) pour éviter de surchauffer le CPU
 
+        shutdown_pools()
         pygame.quit()
         sys.exit()
 
@@ -1,10 +1,22 @@
 import pygame
 import math
 import constants.colors as colors
+from utils.fonts import TITLE, TEXT, LazyFont
 from utils.game_state import GameState
 from models.card_types import UnitCard # Nécessaire pour vérifier le type de carte
+from constants.enums import Keyword
 
 class CollectionMenu(GameState):
+    # --- Polices Spécifiques ---
+    # On définit des polices précises pour que tout rentre bien
+    font_title = LazyFont(TITLE, 70, bold=True)
+    font_card_name = LazyFont(TITLE, 22, bold=True)
+    font_card_class = LazyFont(TITLE, 16)
+    font_card_stat = LazyFont(TEXT, 18, bold=True)
+    font_card_label = LazyFont(TEXT, 10, bold=True)
+    # Titre de la vue détail (Plus petit que le menu principal pour ne pas écraser)
+    font_detail_title = LazyFont(TITLE, 50, bold=True)
+
     def __init__(self, game_manager):
         super().__init__(game_manager)
         
@@ -16,23 +28,6 @@ class CollectionMenu(GameState):
         self.card_height = 300
         self.spacing = 25
         
-        # --- Polices Spécifiques ---
-        # On définit des polices précises pour que tout rentre bien
-        try:
-            self.font_card_name = pygame.font.SysFont('cinzel, trajan, georgia', 22, bold=True)
-            self.font_card_class = pygame.font.SysFont('cinzel, trajan, georgia', 16, bold=False)
-            self.font_card_stat = pygame.font.SysFont('arial, sans-serif', 18, bold=True)
-            self.font_card_label = pygame.font.SysFont('arial, sans-serif', 10, bold=True)
-            
-            # Titre de la vue détail (Plus petit que le menu principal pour ne pas écraser)
-            self.font_detail_title = pygame.font.SysFont('cinzel, trajan, georgia', 50, bold=True)
-        except:
-            self.font_card_name = pygame.font.Font(None, 24)
-            self.font_card_class = pygame.font.Font(None, 18)
-            self.font_card_stat = pygame.font.Font(None, 20)
-            self.font_card_label = pygame.font.Font(None, 12)
-            self.font_detail_title = pygame.font.Font(None, 50)
-        
         # Navigation
         self.scroll_y = 0
         self.target_scroll_y = 0
@@ -49,6 +44,7 @@ class CollectionMenu(GameState):
 
     def on_resize(self, width, height):
         super().on_resize(width, height)
+        self.detail_overlay = self.layer(("voile", 200), lambda: self.compose_overlay(200))
         # Calcul responsive des colonnes
         available_width = width - 100
         self.cols = max(1, available_width // (self.card_width + self.spacing))
@@ -131,12 +127,11 @@ class CollectionMenu(GameState):
         super().draw()
         
         # Titre Collection
-        title_font = pygame.font.SysFont('cinzel, trajan, georgia', 70, bold=True)
-        title = title_font.render("COLLECTION", True, colors.SUMI_BLACK)
+        title = self.render_text(self.font_title, "COLLECTION", colors.SUMI_BLACK)
         self.screen.blit(title, title.get_rect(center=(self.width // 2, 60)))
         
         count_text = f"{len(self.cards)} Cartes"
-        count = self.fonts['small'].render(count_text, True, colors.SUMI_GRAY)
+        count = self.render_text(self.fonts['small'], count_text, colors.SUMI_GRAY)
         self.screen.blit(count, count.get_rect(center=(self.width // 2, 100)))
 
         # Grille avec Clipping
@@ -165,13 +160,13 @@ class CollectionMenu(GameState):
         pygame.draw.circle(self.screen, colors.SUMI_BLACK, (x, y), radius, 1)
         
         # Valeur en Blanc
-        val_surf = self.font_card_stat.render(str(value), True, colors.WASHI_COLOR)
+        val_surf = self.render_number(self.font_card_stat, value, colors.WASHI_COLOR)
         val_rect = val_surf.get_rect(center=(x, y))
         self.screen.blit(val_surf, val_rect)
         
         # Label sous la bulle
         if label:
-            lbl_surf = self.font_card_label.render(label, True, color)
+            lbl_surf = self.render_text(self.font_card_label, label, color)
             self.screen.blit(lbl_surf, lbl_surf.get_rect(center=(x, y + radius + 8)))
 
     def draw_mini_card(self, index):
@@ -198,14 +193,14 @@ class CollectionMenu(GameState):
         center_x = x + self.card_width // 2
         
         # 1. Nom
-        name = self.font_card_name.render(card.name, True, colors.SUMI_BLACK)
+        name = self.render_text(self.font_card_name, card.name, colors.SUMI_BLACK)
         if name.get_width() > self.card_width - 14:
             name = pygame.transform.smoothscale(name, (self.card_width - 14, int(name.get_height() * (self.card_width-14)/name.get_width())))
         self.screen.blit(name, name.get_rect(center=(center_x, y + 25)))
         
         # 2. Classe (Faction)
         # On utilise card.faction.value pour avoir le texte propre ("Clan Akaryū")
-        classe = self.font_card_class.render(card.faction.value, True, colors.INDIGO)
+        classe = self.render_text(self.font_card_class, card.faction.value, colors.INDIGO)
         if classe.get_width() > self.card_width - 14:
             classe = pygame.transform.scale(classe, (self.card_width - 14, classe.get_height()))
         self.screen.blit(classe, classe.get_rect(center=(center_x, y + 50)))
@@ -228,9 +223,7 @@ class CollectionMenu(GameState):
             pygame.draw.circle(self.screen, colors.GOLD_LEAF, (star_start_x + i * 12 + 6, y + self.card_height - 25), 4)
 
     def draw_detail_view(self):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.detail_overlay, (0, 0))
         
         card = self.cards[self.selected_index]
         
@@ -247,7 +240,7 @@ class CollectionMenu(GameState):
         col_left_x = x + 30
         
         # Nom (Police de taille 50 au lieu de 90)
-        name = self.font_detail_title.render(card.name, True, colors.SUMI_BLACK)
+        name = self.render_text(self.font_detail_title, card.name, colors.SUMI_BLACK)
         # Réduction si le nom dépasse la moitié du panneau
         if name.get_width() > w/2 - 20:
              name = pygame.transform.smoothscale(name, (int(w/2 - 20), int(name.get_height() * (w/2-20)/name.get_width())))
@@ -255,7 +248,7 @@ class CollectionMenu(GameState):
         
         # Sous-titre (Faction)
         subtitle = f"{card.faction.value}"
-        sub_surf = self.fonts['subtitle'].render(subtitle, True, colors.INDIGO)
+        sub_surf = self.render_text(self.fonts['subtitle'], subtitle, colors.INDIGO)
         self.screen.blit(sub_surf, (col_left_x, y + 90)) # Remonté un peu
         
         img_y = y + 140
@@ -284,13 +277,13 @@ class CollectionMenu(GameState):
         if isinstance(card, UnitCard) and card.keywords:
             self.draw_text_wrapped("Compétences:", self.fonts['subtitle'], colors.SUMI_BLACK, col_right_x, curr_y, text_w)
             curr_y += 35
-            for kw in card.keywords:
-                # kw.value donne le texte propre "Provocation" au lieu de "TAUNT"
-                curr_y = self.draw_text_wrapped(f"• {kw.value}", self.fonts['small'], colors.INDIGO, col_right_x, curr_y, text_w)
+            for kw in Keyword.split(card.keywords):
+                # kw.label donne le texte propre "Provocation" au lieu de "TAUNT"
+                curr_y = self.draw_text_wrapped(f"• {kw.label}", self.fonts['small'], colors.INDIGO, col_right_x, curr_y, text_w)
             curr_y += 20
         
         # Aide (Bas Droite)
-        hint = self.fonts['small'].render("[ECHAP] Retour", True, colors.SUMI_GRAY)
+        hint = self.render_text(self.fonts['small'], "[ECHAP] Retour", colors.SUMI_GRAY)
         self.screen.blit(hint, hint.get_rect(bottomright=(x + w - 20, y + h - 20)))
 
     def draw_text_wrapped(self, text, font, color, x, y, max_width):
@@ -311,7 +304,7 @@ class CollectionMenu(GameState):
         
         line_height = font.get_linesize()
         for i, line in enumerate(lines):
-            surf = font.render(line, True, color)
+            surf = self.render_text(font, line, color)
             self.screen.blit(surf, (x, y + i * line_height))
             
         return y + len(lines) * line_height
\ No newline at end of file
@@ -1,72 +1,43 @@
+import os
 import pygame
-import random
 import constants.colors as colors
+from utils.floating_text import FloatingTextPool
+from utils.fonts import TITLE, TEXT, LazyFont
 from utils.game_state import GameState
-from models.player import Player
+from utils.surface_cache import SurfaceCache
 from models.card_types import UnitCard, SpellCard
 from constants.enums import Keyword
-
-# --- CLASSE POUR LES EFFETS FLOTTANTS ---
-class FloatingText:
-    def __init__(self, x, y, text, color, size=24):
-        self.x = x
-        self.y = y
-        self.text = text
-        self.color = color
-        self.timer = 60 # Durée de vie (1 seconde à 60 FPS)
-        self.opacity = 255
-        
-        try:
-            self.font = pygame.font.SysFont('arial, sans-serif', size, bold=True)
-        except:
-            self.font = pygame.font.Font(None, size)
-
-    def update(self):
-        self.y -= 1.5 # Monte doucement
-        self.timer -= 1
-        if self.timer < 20: # Fade out sur la fin
-            self.opacity -= 12
-            if self.opacity < 0: self.opacity = 0
-
-    def draw(self, screen):
-        surf = self.font.render(self.text, True, self.color)
-        surf.set_alpha(self.opacity)
-        # Contour noir pour lisibilité
-        outline = self.font.render(self.text, True, colors.SUMI_BLACK)
-        outline.set_alpha(self.opacity)
-        
-        rect = surf.get_rect(center=(self.x, self.y))
-        screen.blit(outline, (rect.x+2, rect.y+2))
-        screen.blit(surf, rect)
-
+from engine import actions
+from engine.actions import ActionType
+from engine.ai import create_ai
+from engine.background import BackgroundTurn
+from engine.effects import TARGET_NONE
+from engine.events import EventType
+from engine.journal import open_journal
+from engine.lethal import LethalSolver
+from engine.match import Match
+
+# La dernière partie jouée est journalisée ici (à joindre aux rapports de bug)
+REPLAY_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'replays', 'derniere_partie.shj')
+# Marge autour d'une face en cache, pour les bordures qui débordent de la carte
+CARD_MARGIN = 5
 
 class GameScene(GameState):
+    # Polices chargées au premier usage (utils.fonts)
+    font_mini_name = LazyFont(TITLE, 12, bold=True)
+    font_mini_stat = LazyFont(TEXT, 16, bold=True)
+    font_hero_hp = LazyFont(TEXT, 30, bold=True)
+    font_button = LazyFont(TITLE, 20, bold=True)
+    font_game_over = LazyFont(TITLE, 80, bold=True)
+    font_zoom_name = LazyFont(TITLE, 20, bold=True)
+    font_zoom_desc = LazyFont(TEXT, 15)
+    font_zoom_stat = LazyFont(TEXT, 22, bold=True)
+    font_zoom_kw = LazyFont(TEXT, 15, bold=True)
+    font_deck = LazyFont(TEXT, 24, bold=True)
+
     def __init__(self, game_manager):
         super().__init__(game_manager)
         
-        try:
-            self.font_mini_name = pygame.font.SysFont('cinzel, trajan, georgia', 12, bold=True)
-            self.font_mini_stat = pygame.font.SysFont('arial, sans-serif', 16, bold=True)
-            self.font_hero_hp = pygame.font.SysFont('arial, sans-serif', 30, bold=True)
-            self.font_button = pygame.font.SysFont('cinzel, trajan, georgia', 20, bold=True)
-            self.font_game_over = pygame.font.SysFont('cinzel, trajan, georgia', 80, bold=True)
-            self.font_zoom_name = pygame.font.SysFont('cinzel, trajan, georgia', 20, bold=True)
-            self.font_zoom_desc = pygame.font.SysFont('arial, sans-serif', 15, bold=False)
-            self.font_zoom_stat = pygame.font.SysFont('arial, sans-serif', 22, bold=True)
-            self.font_zoom_kw = pygame.font.SysFont('arial, sans-serif', 15, bold=True)
-            self.font_deck = pygame.font.SysFont('arial, sans-serif', 24, bold=True)
-        except:
-            self.font_mini_name = pygame.font.Font(None, 14)
-            self.font_mini_stat = pygame.font.Font(None, 18)
-            self.font_hero_hp = pygame.font.Font(None, 40)
-            self.font_button = pygame.font.Font(None, 24)
-            self.font_game_over = pygame.font.Font(None, 100)
-            self.font_zoom_name = pygame.font.Font(None, 24)
-            self.font_zoom_desc = pygame.font.Font(None, 18)
-            self.font_zoom_stat = pygame.font.Font(None, 26)
-            self.font_zoom_kw = pygame.font.Font(None, 18)
-            self.font_deck = pygame.font.Font(None, 30)
-            
         self.hand_y = 0
         self.board_y = 0
         self.opp_hand_y = 0
@@ -74,23 +45,49 @@ class GameScene(GameState):
         self.card_visual_width = 120
         self.card_visual_height = 160
         self.end_turn_btn = pygame.Rect(0, 0, 140, 50)
+        # Faces de cartes pré-rendues (une frame = surtout des blits)
+        self.card_faces = SurfaceCache(max_size=128)
         
-        # LISTE DES EFFETS VISUELS
-        self.visual_effects = []
+        # EFFETS VISUELS (textes flottants réutilisés, dessinés en un seul blits)
+        self.visual_effects = FloatingTextPool()
+        self.journal = None
         
         self.reset_game()
         self.on_resize(self.width, self.height)
 
+    # La partie elle-même vit dans le moteur (engine.match)
+    @property
+    def player(self):
+        return self.match.player
+
+    @property
+    def opponent(self):
+        return self.match.opponent
+
+    @property
+    def is_player_turn(self):
+        return self.match.active == 0
+
+    @property
+    def game_over(self):
+        return self.match.game_over
+
     def reset_game(self):
         all_cards = self.game.card_manager.get_all_cards()
-        self.player = Player("Joueur", all_cards, is_ai=False)
-        self.opponent = Player("Adversaire", all_cards, is_ai=True)
-        self.player.draw_card(3)
-        self.opponent.draw_card(3)
-        self.player.max_mana = 1
-        self.player.mana = 1
-        self.is_player_turn = True
-        self.game_over = False
+        self.match = Match(all_cards)
+        self.match.subscribe(self.on_match_event)
+        self.start_journal(all_cards)
+        config = self.game.config
+        # L'IA réfléchit dans un thread (BackgroundTurn) : elle rend le GIL toutes les ms pour garder les FPS
+        self.ai = create_ai(config.get("ai_mode", "greedy"), config.get("ai_budget_ms", 500),
+                            rng=self.match.streams.get("ai:1"), workers=config.get("ai_workers", 0), yield_ms=1)
+        self.ai_step_ms = config.get("ai_step_ms", 600) # Délai entre deux actions rejouées
+        self.ai_turn = None # Tour de l'IA en cours (BackgroundTurn)
+        self.next_ai_step = 0
+        # Aide optionnelle : signale un létal disponible (recalculé à chaque action)
+        self.lethal_solver = LethalSolver(max_nodes=500) if config.get("lethal_hint", False) else None
+        self.lethal_version = -1
+        self.lethal_plan = None
         self.winner_message = ""
         self.win_color = colors.SUMI_BLACK
         self.player_face_rect = None
@@ -100,7 +97,24 @@ class GameScene(GameState):
         self.drag_offset_x = 0
         self.drag_offset_y = 0
         self.attacking_unit = None
-        self.visual_effects = []
+        self.visual_effects.clear()
+
+    def start_journal(self, all_cards):
+        self.close_journal()
+        try:
+            os.makedirs(os.path.dirname(REPLAY_FILE), exist_ok=True)
+            self.journal = open_journal(REPLAY_FILE, [card.id for card in all_cards], snapshot_every=1)
+            self.journal.start(self.match)
+        except OSError as e:
+            print(f"Journal de partie désactivé : {e}")
+            self.journal = None
+
+    def close_journal(self):
+        """Termine le journal (partie incomplète si elle n'est pas finie)"""
+        if self.journal is None: return
+        if self.game_over: self.journal.finish(self.match)
+        self.journal.close()
+        self.journal = None
 
     def on_resize(self, width, height):
         super().on_resize(width, height)
@@ -110,6 +124,8 @@ class GameScene(GameState):
         self.hand_y = int(height * 0.82)
         self.end_turn_btn.x = width - 160
         self.end_turn_btn.y = height // 2 - 25
+        self.board_background = self.layer("plateau", self.compose_board)
+        self.game_over_overlay = self.layer(("voile", 180), lambda: self.compose_overlay(180))
 
     def handle_events(self, events):
         mouse_pos = pygame.mouse.get_pos()
@@ -143,9 +159,9 @@ class GameScene(GameState):
                                 self.drag_offset_y = mouse_pos[1] - card.rect.y
                                 return 
 
-                        for unit in self.player.board:
+                        for i, unit in enumerate(self.player.board):
                             if unit.rect and unit.rect.collidepoint(mouse_pos):
-                                if unit.can_attack:
+                                if self.match.legal_targets(ActionType.ATTACK, i):
                                     self.attacking_unit = unit
                                 return
 
@@ -164,9 +180,15 @@ class GameScene(GameState):
         
         if isinstance(card, UnitCard):
             if mouse_pos[1] < self.hand_y - 50:
-                self.player.play_unit(self.dragging_index)
+                self.match.apply(actions.play_unit(self.dragging_index))
                 
         elif isinstance(card, SpellCard):
+            if card.effect and card.effect.target == TARGET_NONE:
+                # Effet de zone : il suffit de lâcher la carte au-dessus de la main
+                if mouse_pos[1] < self.hand_y - 50:
+                    self.match.apply(actions.play_ritual(self.dragging_index, -1))
+                return
+
             target = None
             for enemy in self.opponent.board:
                 if enemy.rect and enemy.rect.collidepoint(mouse_pos): target = enemy; break
@@ -182,21 +204,8 @@ class GameScene(GameState):
                 target = self.player
 
             if target:
-                if self.player.play_ritual(self.dragging_index, target):
-                    # Effet visuel si c'est un buff sur soi-même ou ses unités
-                    if card.effect_type == "buff_target" or target == self.player:
-                         self.spawn_floating_text(target.rect.centerx if hasattr(target, 'rect') else self.player_face_rect.centerx, 
-                                                  target.rect.centery if hasattr(target, 'rect') else self.player_face_rect.centery, 
-                                                  "Buff!", colors.BAMBOO_GREEN)
-                    # Effet visuel si c'est des dégâts
-                    elif card.effect_type == "damage_target":
-                         self.spawn_floating_text(target.rect.centerx if hasattr(target, 'rect') else self.opponent_face_rect.centerx, 
-                                                  target.rect.centery if hasattr(target, 'rect') else self.opponent_face_rect.centery, 
-                                                  f"-{card.effect_value}", colors.VERMILLION)
-
-                self.clean_dead_units(self.player)
-                self.clean_dead_units(self.opponent)
-                self.check_game_over()
+                side, slot = self.match.target_ref(target)
+                self.match.apply(actions.play_ritual(self.dragging_index, side, slot))
 
     def handle_attack_release(self, mouse_pos):
         target = None
@@ -206,138 +215,76 @@ class GameScene(GameState):
         if not target and self.opponent_face_rect and self.opponent_face_rect.collidepoint(mouse_pos):
             target = self.opponent
 
-        if not target: return
-
-        if isinstance(target, UnitCard) and Keyword.STEALTH in target.keywords:
-            self.spawn_floating_text(target.rect.centerx, target.rect.centery, "Furtif!", colors.SUMI_GRAY)
-            return
-
-        taunt_units = [u for u in self.opponent.board if Keyword.TAUNT in u.keywords and not u.is_dead and Keyword.STEALTH not in u.keywords]
-        
-        if taunt_units:
-            if target in taunt_units:
-                self.resolve_combat(self.attacking_unit, target)
-            else:
-                self.spawn_floating_text(mouse_pos[0], mouse_pos[1], "Provocation!", colors.VERMILLION)
-        else:
-            self.resolve_combat(self.attacking_unit, target)
-
-    def resolve_combat(self, attacker, target):
-        damage_to_target = attacker.current_attack
-        damage_to_attacker = 0
-        
-        if isinstance(target, UnitCard):
-            damage_to_attacker = target.current_attack
-            
-            if Keyword.POISONOUS in attacker.keywords: damage_to_target = 999 
-            if Keyword.POISONOUS in target.keywords: damage_to_attacker = 999
-
-            if Keyword.DIVINE_SHIELD in target.keywords:
-                damage_to_target = 0
-                target.keywords.remove(Keyword.DIVINE_SHIELD)
-                if target.rect: # VÉRIFICATION AJOUTÉE
-                    self.spawn_floating_text(target.rect.centerx, target.rect.centery, "Bloqué!", (255, 215, 0))
-            
-            target.take_damage(damage_to_target)
-            if damage_to_target > 0 and target.rect: # VÉRIFICATION AJOUTÉE
-                self.spawn_floating_text(target.rect.centerx, target.rect.centery, f"-{damage_to_target}", colors.VERMILLION)
-            
-            if Keyword.DIVINE_SHIELD in attacker.keywords:
-                damage_to_attacker = 0
-                attacker.keywords.remove(Keyword.DIVINE_SHIELD)
-                if attacker.rect: # VÉRIFICATION AJOUTÉE
-                    self.spawn_floating_text(attacker.rect.centerx, attacker.rect.centery, "Bloqué!", (255, 215, 0))
-                
-            attacker.take_damage(damage_to_attacker)
-            if damage_to_attacker > 0 and attacker.rect: # VÉRIFICATION AJOUTÉE ICI (C'est là que ça plantait)
-                self.spawn_floating_text(attacker.rect.centerx, attacker.rect.centery, f"-{damage_to_attacker}", colors.VERMILLION)
-            
-            if Keyword.STEALTH in attacker.keywords: attacker.keywords.remove(Keyword.STEALTH)
-
-        elif isinstance(target, Player):
-            target.health -= damage_to_target
-            # Position du texte pour le héros (Toujours défini car initialisé dans on_resize)
-            if target == self.opponent and self.opponent_face_rect:
-                tx, ty = self.opponent_face_rect.centerx, self.opponent_face_rect.centery
-            elif target == self.player and self.player_face_rect:
-                tx, ty = self.player_face_rect.centerx, self.player_face_rect.centery
-            else:
-                tx, ty = self.width//2, self.height//2 # Fallback
-                
-            self.spawn_floating_text(tx, ty, f"-{damage_to_target}", colors.VERMILLION)
-            
-            if Keyword.STEALTH in attacker.keywords: attacker.keywords.remove(Keyword.STEALTH)
-            
-        attacker.can_attack = False
-        self.clean_dead_units(self.player)
-        self.clean_dead_units(self.opponent)
-        self.check_game_over()
+        if not target or self.attacking_unit not in self.player.board: return
+
+        side, slot = self.match.target_ref(target)
+        self.match.apply(actions.attack(self.player.board.index(self.attacking_unit), side, slot))
+
+    def on_match_event(self, event):
+        """Traduit les événements du moteur en effets visuels"""
+        if event.type == EventType.DAMAGE:
+            self.spawn_floating_text_on(event.target, f"-{event.value}", colors.VERMILLION)
+        elif event.type == EventType.SHIELD_BLOCKED:
+            self.spawn_floating_text_on(event.target, "Bloqué!", (255, 215, 0))
+        elif event.type == EventType.STEALTH_BLOCKED:
+            self.spawn_floating_text_on(event.target, "Furtif!", colors.SUMI_GRAY)
+        elif event.type == EventType.TAUNT_BLOCKED:
+            self.spawn_floating_text_on(event.target, "Provocation!", colors.VERMILLION)
+        elif event.type == EventType.BUFF:
+            self.spawn_floating_text_on(event.target, f"+{event.value}", colors.BAMBOO_GREEN)
+        elif event.type == EventType.HEAL:
+            self.spawn_floating_text_on(event.target, f"+{event.value}", colors.BAMBOO_GREEN)
+        elif event.type == EventType.GAME_OVER:
+            self.trigger_game_over(event.value == 0)
+
+    def spawn_floating_text_on(self, target, text, color):
+        """Place le texte sur la carte ou le portrait ciblé (s'il a déjà été dessiné)"""
+        if target is self.player: rect = self.player_face_rect
+        elif target is self.opponent: rect = self.opponent_face_rect
+        else: rect = getattr(target, 'rect', None)
+        if rect:
+            self.spawn_floating_text(rect.centerx, rect.centery, text, color)
 
     def spawn_floating_text(self, x, y, text, color):
-        self.visual_effects.append(FloatingText(x, y, text, color))
-
-    def check_game_over(self):
-        if self.opponent.health <= 0: self.trigger_game_over(True)
-        elif self.player.health <= 0: self.trigger_game_over(False)
+        if not self.game.config.get("particles", True): return
+        self.visual_effects.spawn(x, y, text, color)
 
     def trigger_game_over(self, victory):
-        self.game_over = True
         self.winner_message = "VICTOIRE !" if victory else "DÉFAITE..."
         self.win_color = colors.BAMBOO_GREEN if victory else colors.VERMILLION
-
-    def clean_dead_units(self, player):
-        alive = []
-        for unit in player.board:
-            if not unit.is_dead: alive.append(unit)
-            else: player.graveyard.append(unit)
-        player.board = alive
+        print(f"Partie terminée : {self.winner_message} (graine {self.match.seed})")
 
     def next_turn(self):
         if self.is_player_turn and not self.game_over:
-            self.is_player_turn = False
-            self.opponent.start_turn()
-            
-            for i in range(len(self.opponent.hand) - 1, -1, -1):
-                card = self.opponent.hand[i]
-                if isinstance(card, UnitCard):
-                    self.opponent.play_unit(i)
-                elif isinstance(card, SpellCard) and card.effect_type == "damage_target":
-                    self.opponent.play_ritual(i, self.player)
-                    if self.player_face_rect: # VÉRIFICATION AJOUTÉE
-                        cx, cy = self.player_face_rect.centerx, self.player_face_rect.centery
-                        self.spawn_floating_text(cx, cy, f"-{card.effect_value}", colors.VERMILLION)
-                
-            taunt_targets = [u for u in self.player.board if Keyword.TAUNT in u.keywords]
-            other_targets = [u for u in self.player.board if Keyword.TAUNT not in u.keywords and Keyword.STEALTH not in u.keywords]
-            
-            for unit in self.opponent.board:
-                if unit.can_attack and not self.game_over:
-                    target = None
-                    if taunt_targets: target = random.choice(taunt_targets)
-                    elif other_targets:
-                        target = self.player if random.random() < 0.5 else random.choice(other_targets)
-                    else: target = self.player 
-                    
-                    if target:
-                        self.resolve_combat(unit, target)
-                        # Refresh
-                        taunt_targets = [u for u in self.player.board if Keyword.TAUNT in u.keywords]
-                        other_targets = [u for u in self.player.board if Keyword.TAUNT not in u.keywords and Keyword.STEALTH not in u.keywords]
-
+            self.match.end_turn()
+            # L'IA réfléchit dans un thread, update() rejoue ses actions
             if not self.game_over:
-                self.is_player_turn = True
-                self.player.start_turn()
+                self.ai_turn = BackgroundTurn(self.ai, self.match)
+                self.next_ai_step = pygame.time.get_ticks() + self.ai_step_ms
+
+    def play_ai_step(self):
+        """Rejoue au plus une action de l'IA par pas de temps"""
+        turn = self.ai_turn
+        if turn is None: return
+        now = pygame.time.get_ticks()
+        if now < self.next_ai_step: return
+        action = turn.next_action()
+        if action is None: return
+
+        if action.type != ActionType.END_TURN and self.match.apply(action) and not self.game_over:
+            self.next_ai_step = now + self.ai_step_ms
+            return
+        self.ai_turn = None
+        if not self.game_over:
+            self.match.end_turn()
 
     def update(self):
-        for effect in self.visual_effects[:]:
-            effect.update()
-            if effect.timer <= 0:
-                self.visual_effects.remove(effect)
+        self.play_ai_step()
+        if self.game_over and self.journal: self.close_journal()
+        self.visual_effects.update()
 
     def draw(self):
-        self.screen.fill(colors.WASHI_COLOR)
-        self.draw_tatami_pattern()
-        pygame.draw.line(self.screen, colors.SUMI_GRAY, (0, self.height//2), (self.width, self.height//2), 2)
+        self.screen.blit(self.board_background, (0, 0))
         
         self.draw_deck_pile(self.opponent, 50, self.height//2 - 140)
         self.draw_deck_pile(self.player, self.width - 110, self.height//2 + 50)
@@ -351,6 +298,9 @@ class GameScene(GameState):
         self.draw_hero_stats(self.player, 60, self.height - 100, is_opponent=False)
         self.draw_mana_bar(self.player, self.width - 260, self.height - 60)
         self.draw_end_turn_button()
+        self.draw_lethal_hint()
+
+        self.draw_valid_targets()
 
         if self.dragging_card:
             if isinstance(self.dragging_card, UnitCard):
@@ -368,8 +318,7 @@ class GameScene(GameState):
         if self.attacking_unit:
             self.draw_attack_arrow()
         
-        for effect in self.visual_effects:
-            effect.draw(self.screen)
+        self.visual_effects.draw(self.screen)
 
         if self.game_over:
             self.draw_game_over_screen()
@@ -377,17 +326,27 @@ class GameScene(GameState):
         if not self.dragging_card and not self.game_over:
             self.check_hover_and_draw_zoom()
 
-    def draw_tatami_pattern(self):
-        color = (230, 225, 210)
-        for x in range(0, self.width, 100): pygame.draw.line(self.screen, color, (x, 0), (x, self.height), 1)
-        for y in range(0, self.height, 100): pygame.draw.line(self.screen, color, (0, y), (self.width, y), 1)
+    def compose_board(self):
+        """Fond du plateau : washi, tatami et ligne médiane"""
+        surface = pygame.Surface((self.width, self.height)).convert()
+        surface.fill(colors.WASHI_COLOR)
+        self.draw_tatami_pattern(surface)
+        pygame.draw.line(surface, colors.SUMI_GRAY, (0, self.height//2), (self.width, self.height//2), 2)
+        return surface
 
-    def draw_stat_bubble(self, x, y, value, color):
-        pygame.draw.circle(self.screen, color, (x, y), 16)
-        pygame.draw.circle(self.screen, colors.SUMI_BLACK, (x, y), 16, 2)
-        val_surf = self.font_mini_stat.render(str(value), True, colors.WASHI_COLOR)
+    def draw_tatami_pattern(self, surface=None):
+        surface = surface or self.screen
+        color = (230, 225, 210)
+        for x in range(0, self.width, 100): pygame.draw.line(surface, color, (x, 0), (x, self.height), 1)
+        for y in range(0, self.height, 100): pygame.draw.line(surface, color, (0, y), (self.width, y), 1)
+
+    def draw_stat_bubble(self, x, y, value, color, surface=None):
+        surface = surface or self.screen
+        pygame.draw.circle(surface, color, (x, y), 16)
+        pygame.draw.circle(surface, colors.SUMI_BLACK, (x, y), 16, 2)
+        val_surf = self.render_number(self.font_mini_stat, value, colors.WASHI_COLOR)
         val_rect = val_surf.get_rect(center=(x, y)); val_rect.y+=1
-        self.screen.blit(val_surf, val_rect)
+        surface.blit(val_surf, val_rect)
 
     def draw_deck_pile(self, player, x, y):
         deck_count = len(player.deck)
@@ -403,34 +362,35 @@ class GameScene(GameState):
         pygame.draw.rect(self.screen, colors.INDIGO, top_rect)
         pygame.draw.rect(self.screen, colors.GOLD_LEAF, top_rect, 2)
         pygame.draw.circle(self.screen, colors.GOLD_LEAF, top_rect.center, 15, 1)
-        txt_surf = self.font_deck.render(str(deck_count), True, colors.WASHI_COLOR)
+        txt_surf = self.render_number(self.font_deck, deck_count, colors.WASHI_COLOR)
         txt_bg = txt_surf.get_rect(center=top_rect.center)
         pygame.draw.rect(self.screen, colors.INDIGO, txt_bg.inflate(10, 5))
         self.screen.blit(txt_surf, txt_bg)
 
-    def draw_keyword_icons(self, card, x, y):
+    def draw_keyword_icons(self, card, x, y, surface=None):
         if not isinstance(card, UnitCard): return
+        surface = surface or self.screen
         icon_y = y + 85; start_x = x + 10; spacing = 20
         if Keyword.CHARGE in card.keywords:
             cx, cy = start_x, icon_y
-            pygame.draw.circle(self.screen, colors.GOLD_LEAF, (cx, cy), 8)
-            pygame.draw.circle(self.screen, colors.SUMI_BLACK, (cx, cy), 8, 1)
-            pygame.draw.line(self.screen, colors.SUMI_BLACK, (cx-3, cy-3), (cx+3, cy-3), 2)
-            pygame.draw.line(self.screen, colors.SUMI_BLACK, (cx+3, cy-3), (cx-3, cy+3), 2)
-            pygame.draw.line(self.screen, colors.SUMI_BLACK, (cx-3, cy+3), (cx+3, cy+3), 2)
+            pygame.draw.circle(surface, colors.GOLD_LEAF, (cx, cy), 8)
+            pygame.draw.circle(surface, colors.SUMI_BLACK, (cx, cy), 8, 1)
+            pygame.draw.line(surface, colors.SUMI_BLACK, (cx-3, cy-3), (cx+3, cy-3), 2)
+            pygame.draw.line(surface, colors.SUMI_BLACK, (cx+3, cy-3), (cx-3, cy+3), 2)
+            pygame.draw.line(surface, colors.SUMI_BLACK, (cx-3, cy+3), (cx+3, cy+3), 2)
             start_x += spacing
         if Keyword.STEALTH in card.keywords:
             cx, cy = start_x, icon_y
-            pygame.draw.circle(self.screen, colors.SUMI_GRAY, (cx, cy), 8)
-            pygame.draw.circle(self.screen, colors.SUMI_BLACK, (cx, cy), 8, 1)
-            pygame.draw.line(self.screen, colors.WASHI_COLOR, (cx-4, cy), (cx+4, cy), 2)
+            pygame.draw.circle(surface, colors.SUMI_GRAY, (cx, cy), 8)
+            pygame.draw.circle(surface, colors.SUMI_BLACK, (cx, cy), 8, 1)
+            pygame.draw.line(surface, colors.WASHI_COLOR, (cx-4, cy), (cx+4, cy), 2)
             start_x += spacing
         if Keyword.POISONOUS in card.keywords:
             cx, cy = start_x, icon_y
-            pygame.draw.circle(self.screen, (50, 200, 50), (cx, cy), 8)
-            pygame.draw.circle(self.screen, colors.SUMI_BLACK, (cx, cy), 8, 1)
-            pygame.draw.line(self.screen, colors.SUMI_BLACK, (cx-3, cy-3), (cx+3, cy-3), 2)
-            pygame.draw.line(self.screen, colors.SUMI_BLACK, (cx+3, cy-3), (cx-3, cy+3), 2)
+            pygame.draw.circle(surface, (50, 200, 50), (cx, cy), 8)
+            pygame.draw.circle(surface, colors.SUMI_BLACK, (cx, cy), 8, 1)
+            pygame.draw.line(surface, colors.SUMI_BLACK, (cx-3, cy-3), (cx+3, cy-3), 2)
+            pygame.draw.line(surface, colors.SUMI_BLACK, (cx+3, cy-3), (cx-3, cy+3), 2)
             start_x += spacing
 
     def check_hover_and_draw_zoom(self, *args):
@@ -457,10 +417,10 @@ class GameScene(GameState):
         mana_radius = 22; mana_cx, mana_cy = x + 30, y + 30
         pygame.draw.circle(self.screen, colors.INDIGO, (mana_cx, mana_cy), mana_radius)
         pygame.draw.circle(self.screen, colors.GOLD_LEAF, (mana_cx, mana_cy), mana_radius, 2)
-        cost_surf = self.font_zoom_stat.render(str(card.mana_cost), True, colors.WASHI_COLOR)
+        cost_surf = self.render_number(self.font_zoom_stat, card.mana_cost, colors.WASHI_COLOR)
         self.screen.blit(cost_surf, cost_surf.get_rect(center=(mana_cx, mana_cy)))
         text_start_x = x + 60; available_text_width = (x + zoom_w - 15) - text_start_x
-        name_surf = self.font_zoom_name.render(card.name, True, colors.SUMI_BLACK)
+        name_surf = self.render_text(self.font_zoom_name, card.name, colors.SUMI_BLACK)
         if name_surf.get_width() > available_text_width:
              ratio = available_text_width / name_surf.get_width()
              new_h = int(name_surf.get_height() * ratio)
@@ -474,8 +434,8 @@ class GameScene(GameState):
         desc_y = y + 65 + img_h + 15
         current_y = desc_y
         if isinstance(card, UnitCard) and card.keywords:
-            kw_txt = ", ".join([k.value for k in card.keywords])
-            kw_surf = self.font_zoom_kw.render(kw_txt, True, colors.VERMILLION)
+            kw_txt = ", ".join([k.label for k in Keyword.split(card.keywords)])
+            kw_surf = self.render_text(self.font_zoom_kw, kw_txt, colors.VERMILLION)
             self.screen.blit(kw_surf, (x + 20, current_y)); current_y += 25
         words = card.description.split(' '); lines = []; curr_line = []
         for word in words:
@@ -484,23 +444,36 @@ class GameScene(GameState):
                 curr_line.pop(); lines.append(' '.join(curr_line)); curr_line = [word]
         lines.append(' '.join(curr_line))
         for line in lines:
-            line_surf = self.font_zoom_desc.render(line, True, colors.SUMI_GRAY)
+            line_surf = self.render_text(self.font_zoom_desc, line, colors.SUMI_GRAY)
             self.screen.blit(line_surf, (x + 20, current_y)); current_y += 18
         if isinstance(card, UnitCard):
             stat_y = y + zoom_h - 35
             pygame.draw.circle(self.screen, colors.VERMILLION, (x + 35, stat_y), 20)
             pygame.draw.circle(self.screen, colors.SUMI_BLACK, (x + 35, stat_y), 20, 2)
-            atk_s = self.font_zoom_stat.render(str(card.current_attack), True, colors.WASHI_COLOR)
+            atk_s = self.render_number(self.font_zoom_stat, card.current_attack, colors.WASHI_COLOR)
             self.screen.blit(atk_s, atk_s.get_rect(center=(x + 35, stat_y)))
             pygame.draw.circle(self.screen, colors.BAMBOO_GREEN, (x + zoom_w - 35, stat_y), 20)
             pygame.draw.circle(self.screen, colors.SUMI_BLACK, (x + zoom_w - 35, stat_y), 20, 2)
-            hp_s = self.font_zoom_stat.render(str(card.current_health), True, colors.WASHI_COLOR)
+            hp_s = self.render_number(self.font_zoom_stat, card.current_health, colors.WASHI_COLOR)
             self.screen.blit(hp_s, hp_s.get_rect(center=(x + zoom_w - 35, stat_y)))
 
-    def draw_card_front(self, card, x, y, can_attack=False):
+    def draw_card_front(self, card, x, y, glow=False):
         rect = pygame.Rect(x, y, self.card_visual_width, self.card_visual_height)
         card.rect = rect
-        
+        # Tout ce qui change l'aspect de la carte est dans la clé
+        if isinstance(card, UnitCard):
+            key = (card.id, card.mana_cost, card.current_attack, card.current_health, int(card.keywords), glow)
+        else:
+            key = (card.id, card.mana_cost, glow)
+        face = self.card_faces.get(key, lambda: self.render_card_face(card, glow))
+        self.screen.blit(face, (x - CARD_MARGIN, y - CARD_MARGIN))
+
+    def render_card_face(self, card, glow):
+        """Face complète d'une carte (bordures de Provocation / Bouclier Divin comprises)"""
+        surface = pygame.Surface((self.card_visual_width + 2 * CARD_MARGIN, self.card_visual_height + 2 * CARD_MARGIN), pygame.SRCALPHA)
+        x = y = CARD_MARGIN
+        rect = pygame.Rect(x, y, self.card_visual_width, self.card_visual_height)
+
         has_taunt = False; is_stealth = False
         if isinstance(card, UnitCard):
             if Keyword.TAUNT in card.keywords: has_taunt = True
@@ -508,47 +481,49 @@ class GameScene(GameState):
 
         if has_taunt:
             shield_rect = rect.inflate(6, 6)
-            pygame.draw.rect(self.screen, (100, 100, 100), shield_rect, border_radius=5)
-            pygame.draw.rect(self.screen, colors.SUMI_BLACK, shield_rect, 2, border_radius=5)
+            pygame.draw.rect(surface, (100, 100, 100), shield_rect, border_radius=5)
+            pygame.draw.rect(surface, colors.SUMI_BLACK, shield_rect, 2, border_radius=5)
         
         if isinstance(card, UnitCard) and Keyword.DIVINE_SHIELD in card.keywords:
             ds_rect = rect.inflate(10, 10)
-            pygame.draw.rect(self.screen, (255, 215, 0), ds_rect, 3, border_radius=6)
+            pygame.draw.rect(surface, (255, 215, 0), ds_rect, 3, border_radius=6)
 
-        if can_attack:
+        if glow:
              glow_rect = rect.inflate(8, 8)
-             pygame.draw.rect(self.screen, colors.BAMBOO_GREEN, glow_rect, 3, border_radius=4)
+             pygame.draw.rect(surface, colors.BAMBOO_GREEN, glow_rect, 3, border_radius=4)
         
         bg_color = (200, 200, 200) if is_stealth else colors.WASHI_COLOR
-        pygame.draw.rect(self.screen, bg_color, rect)
-        pygame.draw.rect(self.screen, colors.INDIGO, rect, 2)
+        pygame.draw.rect(surface, bg_color, rect)
+        pygame.draw.rect(surface, colors.INDIGO, rect, 2)
         inner_rect = rect.inflate(-6, -6)
-        pygame.draw.rect(self.screen, colors.GOLD_LEAF, inner_rect, 1)
+        pygame.draw.rect(surface, colors.GOLD_LEAF, inner_rect, 1)
 
         mana_x, mana_y = x + 18, y + 20
-        pygame.draw.circle(self.screen, colors.INDIGO, (mana_x, mana_y), 12)
-        pygame.draw.circle(self.screen, colors.GOLD_LEAF, (mana_x, mana_y), 12, 1)
-        mana = self.font_mini_stat.render(str(card.mana_cost), True, colors.WASHI_COLOR)
-        self.screen.blit(mana, mana.get_rect(center=(mana_x, mana_y + 1)))
+        pygame.draw.circle(surface, colors.INDIGO, (mana_x, mana_y), 12)
+        pygame.draw.circle(surface, colors.GOLD_LEAF, (mana_x, mana_y), 12, 1)
+        mana = self.render_number(self.font_mini_stat, card.mana_cost, colors.WASHI_COLOR)
+        surface.blit(mana, mana.get_rect(center=(mana_x, mana_y + 1)))
 
         text_start = x + 35; text_w = (x + self.card_visual_width - 5) - text_start
-        name = self.font_mini_name.render(card.name, True, colors.SUMI_BLACK)
+        name = self.render_text(self.font_mini_name, card.name, colors.SUMI_BLACK)
         if name.get_width() > text_w:
             name = pygame.transform.smoothscale(name, (int(text_w), int(name.get_height() * text_w/name.get_width())))
-        self.screen.blit(name, name.get_rect(center=(text_start + text_w//2, mana_y)))
+        surface.blit(name, name.get_rect(center=(text_start + text_w//2, mana_y)))
 
         img_rect = pygame.Rect(x+10, y+40, self.card_visual_width-20, 80)
-        bg_col = (*colors.INDIGO, 80) if has_taunt else (*colors.INDIGO, 50)
-        if is_stealth: bg_col = (50, 50, 50, 100)
-        pygame.draw.rect(self.screen, bg_col, img_rect)
-        pygame.draw.rect(self.screen, colors.SUMI_GRAY, img_rect, 1)
+        # L'écran n'a pas de canal alpha : ces couleurs y étaient opaques
+        bg_col = colors.INDIGO
+        if is_stealth: bg_col = (50, 50, 50)
+        pygame.draw.rect(surface, bg_col, img_rect)
+        pygame.draw.rect(surface, colors.SUMI_GRAY, img_rect, 1)
         
-        self.draw_keyword_icons(card, x, y)
+        self.draw_keyword_icons(card, x, y, surface)
 
         if isinstance(card, UnitCard):
             stat_y = y + self.card_visual_height - 20
-            self.draw_stat_bubble(x + 20, stat_y, card.current_attack, colors.VERMILLION)
-            self.draw_stat_bubble(x + self.card_visual_width - 20, stat_y, card.current_health, colors.BAMBOO_GREEN)
+            self.draw_stat_bubble(x + 20, stat_y, card.current_attack, colors.VERMILLION, surface)
+            self.draw_stat_bubble(x + self.card_visual_width - 20, stat_y, card.current_health, colors.BAMBOO_GREEN, surface)
+        return surface
 
     def draw_hand(self, player, y_pos, hidden=False, skip_index=-1):
         num_cards = len(player.hand)
@@ -565,7 +540,9 @@ class GameScene(GameState):
                 pygame.draw.circle(self.screen, colors.GOLD_LEAF, rect.center, 20, 1)
                 pygame.draw.circle(self.screen, colors.INDIGO, rect.center, 15)
             else:
-                self.draw_card_front(card, x, y_pos)
+                # Carte jouable maintenant : même liseré que les unités prêtes
+                playable = player is self.player and self.is_player_turn and self.match.can_play(i)
+                self.draw_card_front(card, x, y_pos, glow=playable)
 
     def draw_board(self, player, y_pos):
         num_units = len(player.board)
@@ -573,8 +550,8 @@ class GameScene(GameState):
         start_x = (self.width - (num_units * (self.card_visual_width + 10))) // 2
         for i, unit in enumerate(player.board):
             x = start_x + i * (self.card_visual_width + 10)
-            can_act = unit.can_attack and self.is_player_turn and player == self.player and not self.game_over
-            self.draw_card_front(unit, x, y_pos, can_attack=can_act)
+            can_act = player is self.player and self.is_player_turn and bool(self.match.legal_targets(ActionType.ATTACK, i))
+            self.draw_card_front(unit, x, y_pos, glow=can_act)
 
     def draw_hero_stats(self, player, x, y, is_opponent=False):
         radius = 35; color = colors.VERMILLION if not player.is_ai else colors.INDIGO
@@ -583,15 +560,15 @@ class GameScene(GameState):
         else: self.player_face_rect = rect
         pygame.draw.circle(self.screen, color, (x, y), radius)
         pygame.draw.circle(self.screen, colors.SUMI_BLACK, (x, y), radius, 3)
-        hp_surf = self.font_hero_hp.render(str(player.health), True, colors.WASHI_COLOR)
+        hp_surf = self.render_number(self.font_hero_hp, player.health, colors.WASHI_COLOR)
         if player.health > 99: hp_surf = pygame.transform.scale(hp_surf, (40, 30))
         self.screen.blit(hp_surf, hp_surf.get_rect(center=(x, y)))
-        name_surf = self.fonts['subtitle'].render(player.name, True, colors.SUMI_BLACK)
+        name_surf = self.render_text(self.fonts['subtitle'], player.name, colors.SUMI_BLACK)
         self.screen.blit(name_surf, (x + radius + 15, y - 15))
 
     def draw_mana_bar(self, player, x, y):
         txt = f"Mana: {player.mana}/{player.max_mana}"
-        surf = self.fonts['small'].render(txt, True, colors.INDIGO)
+        surf = self.render_text(self.fonts['small'], txt, colors.INDIGO)
         self.screen.blit(surf, (x, y - 40))
         for i in range(10): 
             cx = x + i * 23
@@ -600,16 +577,34 @@ class GameScene(GameState):
             elif i < player.max_mana: pygame.draw.circle(self.screen, (150, 150, 200), (cx, y), 5)
     
     def draw_game_over_screen(self):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
-        text = self.font_game_over.render(self.winner_message, True, self.win_color)
+        self.screen.blit(self.game_over_overlay, (0, 0))
+        text = self.render_text(self.font_game_over, self.winner_message, self.win_color)
         rect = text.get_rect(center=(self.width//2, self.height//2 - 50))
-        shadow = self.font_game_over.render(self.winner_message, True, (0,0,0))
+        shadow = self.render_text(self.font_game_over, self.winner_message, (0,0,0))
         self.screen.blit(shadow, (rect.x+4, rect.y+4))
         self.screen.blit(text, rect)
-        sub = self.fonts['subtitle'].render("Cliquez pour retourner au menu", True, colors.WASHI_COLOR)
+        sub = self.render_text(self.fonts['subtitle'], "Cliquez pour retourner au menu", colors.WASHI_COLOR)
         self.screen.blit(sub, sub.get_rect(center=(self.width//2, self.height//2 + 50)))
+        seed = self.render_text(self.fonts['small'], f"Graine : {self.match.seed}", colors.SUMI_GRAY)
+        self.screen.blit(seed, seed.get_rect(center=(self.width//2, self.height//2 + 95)))
+
+    def draw_valid_targets(self):
+        """Entoure les cibles légales du rituel ou de l'unité en cours de visée"""
+        if not self.is_player_turn: return
+        if isinstance(self.dragging_card, SpellCard):
+            targets = self.match.legal_targets(ActionType.PLAY_RITUAL, self.dragging_index)
+        elif self.attacking_unit in self.player.board:
+            targets = self.match.legal_targets(ActionType.ATTACK, self.player.board.index(self.attacking_unit))
+        else: return
+
+        for side, slot in targets:
+            if side < 0: continue  # Rituel sans cible
+            if slot == actions.HERO:
+                rect = self.player_face_rect if side == 0 else self.opponent_face_rect
+                if rect: pygame.draw.circle(self.screen, colors.GOLD_LEAF, rect.center, rect.width // 2 + 6, 3)
+            else:
+                rect = self.match.players[side].board[slot].rect
+                if rect: pygame.draw.rect(self.screen, colors.GOLD_LEAF, rect.inflate(14, 14), 3, border_radius=8)
 
     def draw_attack_arrow(self):
         if not self.attacking_unit or not self.attacking_unit.rect: return
@@ -617,15 +612,57 @@ class GameScene(GameState):
         end = pygame.mouse.get_pos()
         pygame.draw.line(self.screen, colors.VERMILLION, start, end, 5)
         pygame.draw.circle(self.screen, colors.VERMILLION, end, 10)
+        self.draw_attack_preview(end)
+
+    def draw_attack_preview(self, mouse_pos):
+        """PV prévus après le combat, au survol d'une cible (calculés sur un fork de la partie)"""
+        target = None
+        for enemy in self.opponent.board:
+            if enemy.rect and enemy.rect.collidepoint(mouse_pos): target = enemy; break
+        if not target and self.opponent_face_rect and self.opponent_face_rect.collidepoint(mouse_pos):
+            target = self.opponent
+        if not target or self.attacking_unit not in self.player.board: return
+
+        side, slot = self.match.target_ref(target)
+        outcome = self.match.attack_outcome(self.player.board.index(self.attacking_unit), side, slot)
+        if outcome is None: return
+        target_rect = self.opponent_face_rect if target is self.opponent else target.rect
+        for rect, health in zip((self.attacking_unit.rect, target_rect), outcome):
+            text = "Mort" if health <= 0 else f"{health} PV"
+            surf = self.render_text(self.font_mini_stat, text, colors.WASHI_COLOR)
+            bg = surf.get_rect(midbottom=(rect.centerx, rect.top - 4)).inflate(10, 4)
+            pygame.draw.rect(self.screen, colors.VERMILLION if health <= 0 else colors.SUMI_BLACK, bg, border_radius=4)
+            self.screen.blit(surf, surf.get_rect(center=bg.center))
+
+    def find_lethal(self):
+        """Létal du joueur dans la position actuelle (une recherche par version de la partie)"""
+        if not self.lethal_solver or not self.is_player_turn or self.game_over: return None
+        if self.lethal_version != self.match.version:
+            self.lethal_version = self.match.version
+            self.lethal_plan = self.lethal_solver.find(self.match)
+        return self.lethal_plan
+
+    def draw_lethal_hint(self):
+        plan = self.find_lethal()
+        if not plan or self.dragging_card or self.attacking_unit: return
+        r = self.end_turn_btn
+        t = self.render_text(self.font_button, "Létal !", colors.VERMILLION)
+        self.screen.blit(t, t.get_rect(midbottom=(r.centerx, r.top - 8)))
+        # Première action de la suite : la carte à jouer ou l'unité qui attaque
+        action = plan[0]
+        source = self.player.board if action.type == ActionType.ATTACK else self.player.hand
+        rect = getattr(source[action.index], 'rect', None) if action.index < len(source) else None
+        if rect: pygame.draw.rect(self.screen, colors.VERMILLION, rect.inflate(10, 10), 3, border_radius=6)
 
     def draw_end_turn_button(self):
         if self.is_player_turn:
             bg_color = colors.VERMILLION; text_color = colors.WASHI_COLOR; text = "Fin de Tour"
         else:
-            bg_color = colors.SUMI_GRAY; text_color = (200, 200, 200); text = "Tour Adverse"
+            bg_color = colors.SUMI_GRAY; text_color = (200, 200, 200)
+            text = "Réflexion..." if self.ai_turn and self.ai_turn.thinking else "Tour Adverse"
         r = self.end_turn_btn
         pygame.draw.rect(self.screen, (50, 50, 50, 100), (r.x+4, r.y+4, r.w, r.h))
         pygame.draw.rect(self.screen, bg_color, r)
         pygame.draw.rect(self.screen, colors.SUMI_BLACK, r, 2)
-        t = self.font_button.render(text, True, text_color)
+        t = self.render_text(self.font_button, text, text_color)
         self.screen.blit(t, t.get_rect(center=r.center))
\ No newline at end of file
@@ -89,10 +89,10 @@ class MainMenu(GameState):
             # Titre juste en dessous du logo
             # title_y = logo_rect.bottom + 30 
             # (Optionnel si tu veux garder le titre TEXTE en plus du logo)
-            title = self.fonts['title'].render("SHIMATORI", True, colors.SUMI_BLACK)
+            title = self.render_text(self.fonts['title'], "SHIMATORI", colors.SUMI_BLACK)
             self.screen.blit(title, title.get_rect(center=(center_x, logo_y + self.logo.get_height()//2 + 50)))
         else:
-            title = self.fonts['title'].render("SHIMATORI", True, colors.SUMI_BLACK)
+            title = self.render_text(self.fonts['title'], "SHIMATORI", colors.SUMI_BLACK)
             self.screen.blit(title, title.get_rect(center=(center_x, logo_y)))
 
         # 4. Positionnement des Boutons RELATIF
@@ -122,5 +122,5 @@ class MainMenu(GameState):
                 # ... [Code des coins dorés identique à avant] ...
 
             text_color = colors.SUMI_BLACK if is_selected else colors.SUMI_GRAY
-            text_surf = self.fonts['button'].render(button["text"], True, text_color)
+            text_surf = self.render_text(self.fonts['button'], button["text"], text_color)
             self.screen.blit(text_surf, text_surf.get_rect(center=(center_x, y_pos)))
\ No newline at end of file
@@ -4,6 +4,7 @@ import os
 import math
 import constants.colors as colors
 from utils.game_state import GameState
+from engine.ai import AI_MODES
 
 class OptionsMenu(GameState):
     def __init__(self, game_manager):
@@ -22,7 +23,10 @@ class OptionsMenu(GameState):
             {"name": "Plein Écran", "type": "toggle", "key": "fullscreen"},
             {"name": "Résolution", "type": "choice", "key": "resolution", "choices": ["1280x720", "1600x900", "1920x1080"]},
             {"name": "Langue", "type": "choice", "key": "language", "choices": ["Français", "English", "日本語"]},
-            {"name": "Vsync", "type": "toggle", "key": "vsync"}
+            {"name": "Vsync", "type": "toggle", "key": "vsync"},
+            {"name": "IA Adverse", "type": "choice", "key": "ai_mode", "choices": list(AI_MODES)},
+            {"name": "Aide Létal", "type": "toggle", "key": "lethal_hint"},
+            {"name": "Particules", "type": "toggle", "key": "particles"}
         ]
         
         self.selected_index = 0
@@ -40,7 +44,13 @@ class OptionsMenu(GameState):
             "fullscreen": False, # Simple booléen
             "resolution": "1280x720", 
             "language": "Français", 
-            "vsync": True
+            "vsync": True,
+            "ai_mode": "greedy",
+            "ai_budget_ms": 500,
+            "ai_workers": 0,
+            "ai_step_ms": 600,
+            "lethal_hint": False,
+            "particles": True
         }
         try:
             if os.path.exists(self.config_file):
@@ -60,6 +70,9 @@ class OptionsMenu(GameState):
             print(f"Erreur sauvegarde: {e}")
 
     def apply_settings(self, init_phase=False):
+        # 0. Partagé avec le reste du jeu (ex : mode de l'IA lu par la partie)
+        self.game.config.update(self.settings)
+
         # 1. Audio
         try:
             pygame.mixer.music.set_volume(self.settings["music_volume"] / 100)
@@ -103,6 +116,8 @@ class OptionsMenu(GameState):
                 self.game.width = target_w
                 self.game.height = target_h
                 
+                # Nouvel écran : les couches pré-composées sont refaites à sa taille et à son format
+                GameState.layers.clear()
                 # Déclenchement du RESPONSIVE sur tous les menus
                 for state in self.game.states.values():
                     if state:
@@ -179,7 +194,7 @@ class OptionsMenu(GameState):
 
     def draw(self):
         super().draw()
-        title = self.fonts['title'].render("OPTIONS", True, colors.SUMI_BLACK)
+        title = self.render_text(self.fonts['title'], "OPTIONS", colors.SUMI_BLACK)
         self.screen.blit(title, title.get_rect(center=(self.width // 2, 80)))
 
         start_y = 200
@@ -199,7 +214,7 @@ class OptionsMenu(GameState):
                 self.screen.blit(s, opt_rect)
                 pygame.draw.rect(self.screen, colors.VERMILLION, opt_rect, 2, border_radius=5)
             
-            name_surf = self.fonts['subtitle'].render(opt["name"], True, colors.SUMI_BLACK)
+            name_surf = self.render_text(self.fonts['subtitle'], opt["name"], colors.SUMI_BLACK)
             self.screen.blit(name_surf, (opt_rect.x + 20, y_pos - 15))
             
             right_x = opt_rect.right - 20
@@ -213,38 +228,38 @@ class OptionsMenu(GameState):
                 pct = self.settings[opt["key"]] / opt["max"]
                 fill_rect = pygame.Rect(slider_rect.x, slider_rect.y, slider_rect.width * pct, slider_rect.height)
                 pygame.draw.rect(self.screen, colors.VERMILLION, fill_rect, border_radius=5)
-                val_surf = self.fonts['small'].render(f"{self.settings[opt['key']]}%", True, colors.SUMI_GRAY)
+                val_surf = self.render_text(self.fonts['small'], f"{self.settings[opt['key']]}%", colors.SUMI_GRAY)
                 self.screen.blit(val_surf, (right_x - 40, y_pos - 10))
                 
             elif opt["type"] == "toggle":
                 val = self.settings[opt["key"]]
                 text = "ON" if val else "OFF"
                 col = colors.VERMILLION if val else colors.SUMI_GRAY
-                val_surf = self.fonts['subtitle'].render(text, True, col)
+                val_surf = self.render_text(self.fonts['subtitle'], text, col)
                 self.screen.blit(val_surf, val_surf.get_rect(midright=(right_x, y_pos)))
                 
             elif opt["type"] == "choice":
                 val = str(self.settings[opt["key"]])
-                val_surf = self.fonts['small'].render(val, True, colors.SUMI_GRAY)
+                val_surf = self.render_text(self.fonts['small'], val, colors.SUMI_GRAY)
                 val_rect = val_surf.get_rect(midright=(right_x - 20, y_pos))
                 self.screen.blit(val_surf, val_rect)
                 if is_selected:
-                    arrow_l = self.fonts['small'].render("<", True, colors.VERMILLION)
+                    arrow_l = self.render_text(self.fonts['small'], "<", colors.VERMILLION)
                     self.screen.blit(arrow_l, (val_rect.left - 20, val_rect.top))
-                    arrow_r = self.fonts['small'].render(">", True, colors.VERMILLION)
+                    arrow_r = self.render_text(self.fonts['small'], ">", colors.VERMILLION)
                     self.screen.blit(arrow_r, (val_rect.right + 10, val_rect.top))
 
         btn_y = self.height - 80
-        save_surf = self.fonts['button'].render("Sauvegarder", True, colors.SUMI_BLACK)
+        save_surf = self.render_text(self.fonts['button'], "Sauvegarder", colors.SUMI_BLACK)
         self.btn_save_rect = save_surf.get_rect(center=(self.width//2 - 150, btn_y))
         pygame.draw.rect(self.screen, colors.WASHI_COLOR, self.btn_save_rect.inflate(20, 10))
         pygame.draw.rect(self.screen, colors.VERMILLION, self.btn_save_rect.inflate(20, 10), 2)
         self.screen.blit(save_surf, self.btn_save_rect)
         
-        back_surf = self.fonts['button'].render("Retour", True, colors.SUMI_BLACK)
+        back_surf = self.render_text(self.fonts['button'], "Retour", colors.SUMI_BLACK)
         self.btn_back_rect = back_surf.get_rect(center=(self.width//2 + 150, btn_y))
         self.screen.blit(back_surf, self.btn_back_rect)
         
         if self.save_message_timer > 0:
-            msg = self.fonts['small'].render("Paramètres appliqués !", True, colors.VERMILLION)
+            msg = self.render_text(self.fonts['small'], "Paramètres appliqués !", colors.VERMILLION)
             self.screen.blit(msg, msg.get_rect(center=(self.width//2, btn_y - 50)))
\ No newline at end of file
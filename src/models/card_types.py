@@ -1,56 +1,157 @@
-import pygame
 from constants.enums import CardType, Faction, Rarity, Keyword
+from engine.effects import compile_effect
+from engine.triggers import compile_trigger_effect
+
+class CardTemplate:
+    """Données figées d'une carte, chargées une fois et partagées par tous ses exemplaires"""
+    __slots__ = ('id', 'name', 'description', 'mana_cost', 'image_path', 'faction', 'rarity',
+                 'type', 'base_attack', 'base_health', 'keywords', 'effect_type', 'effect_value', 'effect',
+                 'battlecry', 'deathrattle')
 
-class Card:
-    """Classe parente pour toutes les cartes"""
     def __init__(self, data: dict):
-        self.id = data.get("id", "unknown")
-        self.name = data.get("nom", "Inconnu")
-        self.description = data.get("description", "")
-        self.mana_cost = data.get("cout", 0)
-        self.image_path = data.get("image", None)
-        
+        setattr_ = object.__setattr__
+        setattr_(self, 'id', data.get("id", "unknown"))
+        setattr_(self, 'name', data.get("nom", "Inconnu"))
+        setattr_(self, 'description', data.get("description", ""))
+        setattr_(self, 'mana_cost', data.get("cout", 0))
+        setattr_(self, 'image_path', data.get("image", None))
+
         # Mapping Faction
         faction_str = data.get("classe", "Neutre")
-        self.faction = Faction.NEUTRAL
+        faction = Faction.NEUTRAL
         for f in Faction:
             if f.value == faction_str or f.name == faction_str.upper():
-                self.faction = f
+                faction = f
                 break
-            
-        self.rarity = Rarity(data.get("rarete", 1))
+        setattr_(self, 'faction', faction)
+        setattr_(self, 'rarity', Rarity(data.get("rarete", 1)))
+
+        # Détection automatique du type
+        is_unit = "puissance" in data
+        setattr_(self, 'type', CardType.UNIT if is_unit else CardType.SPELL)
+        setattr_(self, 'base_attack', data.get("puissance", 0))
+        setattr_(self, 'base_health', data.get("vitalite", 0))
+
+        keywords = Keyword(0)
+        for k_str in data.get("competences", []):
+            k = Keyword.from_label(k_str)
+            if k is not None:
+                keywords |= k
+        setattr_(self, 'keywords', keywords)
+
+        setattr_(self, 'effect_type', data.get("effect_type", "none"))
+        setattr_(self, 'effect_value', data.get("effect_value", 0))
+        # Effet compilé une fois pour toutes (engine.effects), None si aucun
+        setattr_(self, 'effect', None if is_unit else compile_effect(data))
+        # Charge utile des compétences Cri de guerre / Râle d'agonie (engine.triggers)
+        setattr_(self, 'battlecry', compile_trigger_effect(data, "cri_de_guerre") if is_unit else None)
+        setattr_(self, 'deathrattle', compile_trigger_effect(data, "rale_agonie") if is_unit else None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"CardTemplate est immuable ({self.id}.{name})")
+
+    def __reduce__(self):
+        # Envoi vers un autre processus (IA parallèle) malgré l'immuabilité
+        return (_restore_template, (tuple(getattr(self, slot) for slot in CardTemplate.__slots__),))
+
+    def create(self):
+        """Nouvel exemplaire jouable : seul l'état de la partie est alloué"""
+        if self.type == CardType.UNIT:
+            return UnitCard(self)
+        return SpellCard(self)
+
+    def __repr__(self):
+        return f"<Template {self.name} ({self.faction.value})>"
+
+def _restore_template(values):
+    template = object.__new__(CardTemplate)
+    for slot, value in zip(CardTemplate.__slots__, values):
+        object.__setattr__(template, slot, value)
+    return template
+
+class Card:
+    """Classe parente pour toutes les cartes (un exemplaire d'un CardTemplate)"""
+    # Pas de __dict__ par exemplaire : une partie en mémoire reste compacte.
+    # 'rect' est la position à l'écran, renseignée par les menus au dessin.
+    __slots__ = ('template', 'rect')
+
+    def __init__(self, template: CardTemplate):
+        self.template = template
+        self.rect = None
+
+    # Les données fixes sont lues dans le template partagé
+    @property
+    def id(self): return self.template.id
+
+    @property
+    def name(self): return self.template.name
+
+    @property
+    def description(self): return self.template.description
+
+    @property
+    def mana_cost(self): return self.template.mana_cost
+
+    @property
+    def image_path(self): return self.template.image_path
+
+    @property
+    def faction(self): return self.template.faction
+
+    @property
+    def rarity(self): return self.template.rarity
+
+    @property
+    def type(self): return self.template.type
+
+    def copy(self):
+        """Exemplaire indépendant (le template reste partagé), pour les simulations"""
+        clone = object.__new__(type(self))
+        clone.template = self.template
+        clone.rect = None
+        return clone
 
     def __repr__(self):
         return f"<{self.name} ({self.faction.value})>"
 
 class UnitCard(Card):
     """Une créature / unité sur le plateau"""
-    def __init__(self, data: dict):
-        super().__init__(data)
-        self.type = CardType.UNIT
-        
-        self.base_attack = data.get("puissance", 0)
-        self.base_health = data.get("vitalite", 0)
-        self.current_attack = self.base_attack
-        self.current_health = self.base_health
-        self.max_health = self.base_health
-        
+    __slots__ = ('current_attack', 'current_health', 'max_health', 'is_dead', 'can_attack', 'attacks_left', 'keywords')
+
+    def __init__(self, template: CardTemplate):
+        super().__init__(template)
+
+        self.current_attack = template.base_attack
+        self.current_health = template.base_health
+        self.max_health = template.base_health
+
         self.is_dead = False
-        self.can_attack = False 
+        self.can_attack = False
         self.attacks_left = 0
-        
-        self.keywords = []
-        raw_keywords = data.get("competences", [])
-        for k_str in raw_keywords:
-            for k in Keyword:
-                if k.value == k_str:
-                    self.keywords.append(k)
-                    break
-        
+
+        self.keywords = template.keywords
+
         if Keyword.CHARGE in self.keywords:
             self.can_attack = True
             self.attacks_left = 1
 
+    def copy(self):
+        clone = super().copy()
+        clone.current_attack = self.current_attack
+        clone.current_health = self.current_health
+        clone.max_health = self.max_health
+        clone.is_dead = self.is_dead
+        clone.can_attack = self.can_attack
+        clone.attacks_left = self.attacks_left
+        clone.keywords = self.keywords
+        return clone
+
+    @property
+    def base_attack(self): return self.template.base_attack
+
+    @property
+    def base_health(self): return self.template.base_health
+
     def take_damage(self, amount):
         self.current_health -= amount
         if self.current_health <= 0:
@@ -59,10 +160,13 @@ class UnitCard(Card):
 
 class SpellCard(Card):
     """Un Rituel à effet immédiat"""
-    def __init__(self, data: dict):
-        super().__init__(data)
-        self.type = CardType.SPELL
-        
-        self.effect_type = data.get("effect_type", "none")
+    __slots__ = ()
+
+    @property
+    def effect_type(self): return self.template.effect_type
+
+    @property
+    def effect_value(self): return self.template.effect_value
 
-        self.effect_value = data.get("effect_value", 0)
\ No newline at end of file
+    @property
+    def effect(self): return self.template.effect
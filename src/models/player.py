@@ -1,11 +1,23 @@
 import random
-import copy
 from models.card_types import UnitCard
+from constants.enums import Keyword
+from engine.triggers import Trigger, TRIGGER_MASKS
+
+# Masques en int pour index_unit, appelé à chaque copie de plateau
+TURN_START_KEYWORDS = TRIGGER_MASKS[Trigger.TURN_START]
+STEALTH = int(Keyword.STEALTH)
+TAUNT = int(Keyword.TAUNT)
+
+SHARED_ZONES = ('deck', 'hand', 'board', 'graveyard')
 
 class Player:
-    def __init__(self, name, collection_cards, is_ai=False):
+    def __init__(self, name, collection_cards, is_ai=False, verbose=True, rng=None, deck=None):
         self.name = name
         self.is_ai = is_ai
+        # Les simulations sans affichage coupent les logs console
+        self.verbose = verbose
+        # Flux aléatoire du deck (voir engine.rng), sinon le module random
+        self.rng = rng or random
 
         self.health = 30
         self.max_health = 30
@@ -17,34 +29,151 @@ class Player:
         self.board = []
         self.graveyard = []
 
-        self.build_random_deck(collection_cards)
+        # Index tenus à jour à chaque entrée/sortie du plateau et perte de
+        # compétence (dict = ensemble ordonné, pour rester déterministe) :
+        #   taunt_units   : Provocation ciblable (donc non furtive)
+        #   stealth_units : Furtivité
+        #   turn_start_units : compétence de début de tour (Soins, Forge)
+        self.taunt_units = {}
+        self.stealth_units = {}
+        self.turn_start_units = {}
+
+        # Zones partagées avec un fork (copie à l'écriture, voir fork / own)
+        self.shared = set()
+
+        if deck is None: self.build_random_deck(collection_cards)
+        else: self.use_deck(deck)
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def clone(self):
+        """Copie indépendante et silencieuse, pour les simulations de l'IA"""
+        other = Player.__new__(Player)
+        other.__dict__.update(self.__dict__)
+        other.verbose = False
+        other.deck = list(self.deck)
+        other.hand = [card.copy() for card in self.hand]
+        other.board = [unit.copy() for unit in self.board]
+        other.graveyard = list(self.graveyard)
+        other.shared = set()
+        other.rebuild_indexes()
+        return other
+
+    def fork(self):
+        """Copie silencieuse qui partage deck, main, plateau et cimetière.
+
+        Le fork copie une zone juste avant de la modifier (own) ; l'original
+        garde ses objets et n'a rien à faire. Un fork n'est donc valable que
+        tant que l'original ne bouge pas.
+        """
+        other = Player.__new__(Player)
+        other.__dict__.update(self.__dict__)
+        other.verbose = False
+        other.shared = set(SHARED_ZONES)
+        return other
+
+    def own(self, zone):
+        """Copie la zone si elle est encore partagée, avant de la modifier"""
+        if zone not in self.shared: return
+        self.shared.discard(zone)
+        if zone == 'board':
+            self.board = [unit.copy() for unit in self.board]
+            self.rebuild_indexes()
+        elif zone == 'hand':
+            # Une carte jouée part sur le plateau, où elle change d'état
+            self.hand = [card.copy() for card in self.hand]
+        else:
+            setattr(self, zone, list(getattr(self, zone)))
 
     def build_random_deck(self, collection_cards, deck_size=30):
         """Create a random deck from the player's collection."""
         if not collection_cards:
-            print(f"Error: {self.name} has no cards in their collection to build a deck.")
+            self.log(f"Error: {self.name} has no cards in their collection to build a deck.")
             return
         
-        drafted_cards = random.choices(collection_cards, k=deck_size)
+        drafted_cards = self.rng.choices(collection_cards, k=deck_size)
 
-        self.deck = [copy.deepcopy(card) for card in drafted_cards]
+        # Le deck ne contient que les templates partagés : l'exemplaire
+        # (état de jeu) n'est créé qu'au moment de la pioche
+        self.deck = [card.template for card in drafted_cards]
 
-        print(f"{self.name}'s deck built with {len(self.deck)} cards.")
+        self.log(f"{self.name}'s deck built with {len(self.deck)} cards.")
+
+    def use_deck(self, templates):
+        """Deck imposé (liste de templates), mélangé par le flux du deck"""
+        self.deck = list(templates)
+        self.rng.shuffle(self.deck)
 
     def draw_card(self, amount=1):
         """Draw x cards from the deck to the hand."""
         for _ in range(amount):
             if len(self.deck) > 0:
                 if len(self.hand) < 10:
-                    card = self.deck.pop(0)
+                    card = self.deck.pop(0).create()
                     self.hand.append(card)
                 else:
-                    print(f"{self.name}'s hand is full! Cannot draw more cards.")
+                    self.log(f"{self.name}'s hand is full! Cannot draw more cards.")
                     # Here you could implement discarding the drawn card or other mechanics.
             else:
-                print(f"{self.name}'s deck is empty! Cannot draw more cards.")
+                self.log(f"{self.name}'s deck is empty! Cannot draw more cards.")
                 # Here you could implement fatigue damage or other mechanics.
 
+    # --- Plateau et index Provocation / Furtivité ---
+    def add_to_board(self, unit):
+        self.board.append(unit)
+        self.index_unit(unit)
+
+    def rebuild_indexes(self):
+        """Reconstruit les index à partir du plateau (copie, rechargement)"""
+        self.taunt_units = {}
+        self.stealth_units = {}
+        self.turn_start_units = {}
+        for unit in self.board:
+            self.index_unit(unit)
+
+    def index_unit(self, unit):
+        """Recalcule la place d'une unité dans les index (O(1))"""
+        keywords = int(unit.keywords)
+        if keywords & TURN_START_KEYWORDS:
+            self.turn_start_units[unit] = None
+        elif self.turn_start_units:
+            self.turn_start_units.pop(unit, None)
+        if keywords & STEALTH:
+            self.stealth_units[unit] = None
+            self.taunt_units.pop(unit, None)
+        else:
+            self.stealth_units.pop(unit, None)
+            if keywords & TAUNT:
+                self.taunt_units[unit] = None
+            else:
+                self.taunt_units.pop(unit, None)
+
+    def remove_keyword(self, unit, keyword):
+        unit.keywords &= ~keyword
+        self.index_unit(unit)
+
+    def remove_dead_units(self):
+        """Envoie les unités mortes au cimetière et les renvoie"""
+        dead = [unit for unit in self.board if unit.is_dead]
+        if dead:
+            self.board = [unit for unit in self.board if not unit.is_dead]
+            for unit in dead:
+                self.taunt_units.pop(unit, None)
+                self.stealth_units.pop(unit, None)
+                self.turn_start_units.pop(unit, None)
+                self.graveyard.append(unit)
+        return dead
+
+    def can_be_attacked(self, unit):
+        """Une unité de ce joueur peut-elle être ciblée par une attaque ?"""
+        if unit in self.stealth_units: return False
+        return not self.taunt_units or unit in self.taunt_units
+
+    def hero_can_be_attacked(self):
+        return not self.taunt_units
+
     def start_turn(self):
         """Start of turn logic."""
         if self.max_mana < 10:
@@ -69,52 +198,28 @@ class Player:
                     if len(self.board) < 7:
                         self.mana -= card.mana_cost
                         played_card = self.hand.pop(index)
-                        self.board.append(played_card)
-                        print(f"{self.name} joue {played_card.name}")
+                        self.add_to_board(played_card)
+                        self.log(f"{self.name} joue {played_card.name}")
                         return True
                     else:
-                        print("Plateau plein !")
+                        self.log("Plateau plein !")
                 else:
-                    print("Impossible de jouer un Sort comme une Unité (pour l'instant).")
+                    self.log("Impossible de jouer un Sort comme une Unité (pour l'instant).")
             else:
-                print("Pas assez de mana !")
+                self.log("Pas assez de mana !")
         return False
     
-    def play_ritual(self, index, target):
-        """Joue un Rituel sur une cible spécifique"""
+    def play_ritual(self, index, target_name=None):
+        """Paie et défausse un Rituel ; son effet est appliqué par la partie (engine/effects.py)"""
         if 0 <= index < len(self.hand):
             card = self.hand[index]
-            
-            # 1. Vérif Mana
             if self.mana >= card.mana_cost:
-                
-                # 2. Application de l'effet selon le type
-                effect_applied = False
-                
-                # CAS A : Dégâts (sur Unité ou Joueur)
-                if card.effect_type == "damage_target":
-                    if hasattr(target, 'take_damage'): # C'est une unité
-                        target.take_damage(card.effect_value)
-                        effect_applied = True
-                    elif hasattr(target, 'health'): # C'est un joueur
-                        target.health -= card.effect_value
-                        effect_applied = True
-                        
-                # CAS B : Buff (Uniquement sur Unité)
-                elif card.effect_type == "buff_target":
-                    if hasattr(target, 'current_attack'): # Vérif que c'est une unité
-                        target.current_attack += card.effect_value
-                        effect_applied = True
-                    else:
-                        print("Impossible : Ce rituel cible uniquement les unités !")
-
-                # 3. Si l'effet a marché : On paie et on défausse
-                if effect_applied:
-                    self.mana -= card.mana_cost
-                    played_card = self.hand.pop(index)
-                    self.graveyard.append(played_card)
-                    print(f"{self.name} lance le rituel {played_card.name} sur {getattr(target, 'name', 'Cible')}")
-                    return True
+                self.mana -= card.mana_cost
+                played_card = self.hand.pop(index)
+                self.graveyard.append(played_card)
+                target = f" sur {target_name}" if target_name else ""
+                self.log(f"{self.name} lance le rituel {played_card.name}{target}")
+                return True
             else:
-                print("Pas assez de mana pour ce rituel !")
+                self.log("Pas assez de mana pour ce rituel !")
         return False
\ No newline at end of file
@@ -0,0 +1,245 @@
+"""Optimisation génétique de decks de 30 cartes, faction par faction.
+
+Chaque deck candidat affronte une liste fixe de decks adverses tirés au
+hasard (le "gauntlet"), des deux côtés de la table, en parties IA contre
+IA jouées en parallèle. La fitness est le taux de victoire.
+
+  - les parties d'un tour d'évaluation ont les mêmes graines pour tous
+    les candidats (mêmes tirages, comparaison plus juste) ;
+  - un deck déjà vu n'est jamais réévalué (cache par liste triée) ;
+  - l'évaluation se fait par tours : un candidat dont le taux de victoire,
+    même optimiste, reste sous celui de la dernière élite est abandonné ;
+  - quand le meilleur deck bat presque tout le gauntlet (--promote), il y
+    entre et les fitness sont recalculées : l'adversité suit les progrès.
+
+Un deck de faction ne contient que des cartes de sa faction et des cartes
+neutres. Les meilleures listes sont écrites dans --out à chaque génération.
+
+Exemple : python src/optimize_deck.py --minutes 480 --seed 1
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from constants.enums import Faction
+from utils.card_manager import CardManager
+from engine.ai import GreedyAI, EvalAI
+from engine.rng import derive_seed, new_seed
+from engine.selfplay import play_match
+
+DECK_SIZE = 30
+
+# Chargé une seule fois par processus de travail
+_templates = None
+
+def _init_worker():
+    global _templates
+    _templates = {card.id: card.template for card in CardManager(verbose=False).get_all_cards()}
+
+def _play_round(args):
+    """Victoires d'un deck contre tout le gauntlet, une partie de chaque côté (nulle = 1/2)"""
+    deck_ids, gauntlet, master_seed, round_index, ai, max_turns = args
+    deck = [_templates[card_id] for card_id in deck_ids]
+    wins = 0.0
+    for i, opponent_ids in enumerate(gauntlet):
+        opponent = [_templates[card_id] for card_id in opponent_ids]
+        for seat in (0, 1):
+            seed = derive_seed(master_seed, "round", round_index, i, seat)
+            decks = (deck, opponent) if seat == 0 else (opponent, deck)
+            ais = [EvalAI() if ai == "eval" else GreedyAI(random.Random(derive_seed(seed, "ai", side))) for side in (0, 1)]
+            match = play_match(None, ais=ais, max_turns=max_turns, seed=seed, decks=decks)[0]
+            if match.winner is None: wins += 0.5
+            elif match.winner == seat: wins += 1
+    return wins, 2 * len(gauntlet)
+
+class Candidate:
+    __slots__ = ('key', 'wins', 'games', 'dropped')
+
+    def __init__(self, key):
+        self.key = key       # Ids des cartes, triés (identifie le deck)
+        self.wins = 0.0
+        self.games = 0
+        self.dropped = False # Abandonné avant la fin de l'évaluation
+
+    @property
+    def fitness(self):
+        return self.wins / self.games if self.games else 0.0
+
+    def upper_bound(self, z):
+        """Taux de victoire optimiste (approximation normale)"""
+        if not self.games: return 1.0
+        p = self.fitness
+        return p + z * math.sqrt(max(p * (1 - p), 0.25 / self.games) / self.games)
+
+class DeckOptimizer:
+    """Algorithme génétique sur les decks d'une faction"""
+    def __init__(self, allowed, gauntlet, args, master_seed):
+        self.allowed = sorted(allowed)
+        self.gauntlet = gauntlet
+        self.args = args
+        self.master_seed = master_seed
+        self.rng = random.Random(master_seed)
+        self.cache = {}  # clé -> Candidate
+        self.games = 0
+
+    # --- Decks ---
+    def random_deck(self):
+        counts = Counter()
+        while sum(counts.values()) < DECK_SIZE:
+            card_id = self.rng.choice(self.allowed)
+            if counts[card_id] < self.args.max_copies: counts[card_id] += 1
+        return tuple(sorted(counts.elements()))
+
+    def mutate(self, key):
+        counts = Counter(key)
+        for _ in range(self.rng.randint(1, self.args.mutations)):
+            counts[self.rng.choice(list(counts.elements()))] -= 1
+            while True:
+                card_id = self.rng.choice(self.allowed)
+                if counts[card_id] < self.args.max_copies:
+                    counts[card_id] += 1
+                    break
+        return tuple(sorted(counts.elements()))
+
+    def crossover(self, a, b):
+        """Enfant tiré dans l'union des deux listes, en respectant le maximum d'exemplaires"""
+        parents = list(a) + list(b)
+        self.rng.shuffle(parents)
+        counts = Counter()
+        for card_id in parents:
+            if sum(counts.values()) == DECK_SIZE: break
+            if counts[card_id] < self.args.max_copies: counts[card_id] += 1
+        while sum(counts.values()) < DECK_SIZE:
+            card_id = self.rng.choice(self.allowed)
+            if counts[card_id] < self.args.max_copies: counts[card_id] += 1
+        return tuple(sorted(counts.elements()))
+
+    # --- Évaluation ---
+    def evaluate(self, keys, pool, threshold):
+        """Évalue par tours les decks pas encore vus ; abandonne ceux qui restent sous `threshold`"""
+        alive = []
+        for key in keys:
+            if key not in self.cache:
+                self.cache[key] = Candidate(key)
+                alive.append(self.cache[key])
+        for round_index in range(self.args.rounds):
+            if not alive: break
+            tasks = [(c.key, self.gauntlet, self.master_seed, round_index, self.args.ai, self.args.max_turns) for c in alive]
+            for candidate, (wins, games) in zip(alive, pool.imap(_play_round, tasks)):
+                candidate.wins += wins
+                candidate.games += games
+                self.games += games
+            if round_index == self.args.rounds - 1: break
+            for candidate in alive:
+                if candidate.upper_bound(self.args.z) < threshold: candidate.dropped = True
+            alive = [c for c in alive if not c.dropped]
+
+    def run(self, pool, deadline, report):
+        population = [self.random_deck() for _ in range(self.args.population)]
+        self.evaluate(population, pool, 0.0)
+        best = []
+        for generation in range(self.args.generations):
+            ranked = sorted({key: self.cache[key] for key in population}.values(),
+                            key=lambda c: (not c.dropped, c.fitness), reverse=True)
+            best = [c for c in ranked if not c.dropped][:self.args.elite] or ranked[:1]
+            report(generation, best)
+            if time.perf_counter() > deadline: break
+            if best[0].fitness >= self.args.promote and best[0].key not in self.gauntlet:
+                # Le champion rejoint le gauntlet : les anciennes fitness ne valent plus
+                self.gauntlet = self.gauntlet + [best[0].key]
+                self.cache = {}
+                self.evaluate(population, pool, 0.0)
+                continue
+
+            # Élites conservées, le reste naît par tournoi + croisement + mutation
+            children = []
+            while len(children) < self.args.population - len(best):
+                a, b = self.select(ranked), self.select(ranked)
+                child = self.crossover(a.key, b.key) if self.rng.random() < self.args.crossover else a.key
+                children.append(self.mutate(child))
+            self.evaluate(children, pool, best[-1].fitness)
+            population = [c.key for c in best] + children
+        return best
+
+    def select(self, ranked, size=3):
+        contenders = self.rng.sample(ranked, min(size, len(ranked)))
+        return max(contenders, key=lambda c: (not c.dropped, c.fitness))
+
+def describe(key, templates):
+    """Liste lisible "2x Nom (id)", par coût de mana"""
+    counts = Counter(key)
+    cards = sorted(counts, key=lambda card_id: (templates[card_id].mana_cost, templates[card_id].name))
+    return [f"{counts[card_id]}x {templates[card_id].name} ({card_id}, {templates[card_id].mana_cost} mana)" for card_id in cards]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Optimise des decks par algorithme génétique contre un gauntlet de decks adverses.")
+    parser.add_argument("--factions", nargs="*", default=None, help="Factions à optimiser (défaut : toutes celles du pool)")
+    parser.add_argument("--population", type=int, default=24, help="Decks par génération")
+    parser.add_argument("--elite", type=int, default=4, help="Meilleurs decks conservés d'une génération à l'autre")
+    parser.add_argument("--generations", type=int, default=1000, help="Nombre maximum de générations par faction")
+    parser.add_argument("--minutes", type=float, default=60, help="Temps total, partagé entre les factions")
+    parser.add_argument("--gauntlet", type=int, default=8, help="Nombre de decks adverses (aléatoires)")
+    parser.add_argument("--rounds", type=int, default=4, help="Tours d'évaluation (2 parties par deck adverse chacun)")
+    parser.add_argument("--promote", type=float, default=0.85, help="Fitness à partir de laquelle le meilleur deck rejoint le gauntlet")
+    parser.add_argument("--z", type=float, default=2.0, help="Marge de l'abandon anticipé (en écarts-types)")
+    parser.add_argument("--max-copies", type=int, default=3, help="Exemplaires maximum d'une même carte")
+    parser.add_argument("--mutations", type=int, default=3, help="Cartes remplacées au plus par mutation")
+    parser.add_argument("--crossover", type=float, default=0.7, help="Probabilité de croisement")
+    parser.add_argument("--ai", choices=("greedy", "eval"), default="greedy", help="IA des deux camps")
+    parser.add_argument("--max-turns", type=int, default=200, help="Au-delà, la partie est nulle")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Nombre de processus (défaut : tous les coeurs)")
+    parser.add_argument("--seed", type=int, default=None, help="Graine maître (défaut : aléatoire, affichée)")
+    parser.add_argument("--out", default="decks_optimises.json", help="Fichier des meilleures listes")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    master_seed = new_seed() if args.seed is None else args.seed
+    print(f"Graine maître : {master_seed}")
+
+    pool = CardManager(verbose=False).get_all_cards()
+    templates = {card.id: card.template for card in pool}
+    by_faction = {}
+    for card in pool:
+        by_faction.setdefault(card.template.faction, []).append(card.id)
+    factions = [f for f in Faction if f in by_faction]
+    if args.factions:
+        factions = [f for f in factions if f.name in args.factions or f.value in args.factions]
+
+    # Gauntlet commun à toutes les factions : des decks tirés comme Player.build_random_deck
+    rng = random.Random(derive_seed(master_seed, "gauntlet"))
+    gauntlet = [tuple(rng.choices(sorted(templates), k=DECK_SIZE)) for _ in range(args.gauntlet)]
+
+    results = {}
+    started = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=_init_worker) as workers:
+        for n, faction in enumerate(factions):
+            # Le temps restant est partagé entre les factions restantes
+            remaining = args.minutes * 60 - (time.perf_counter() - started)
+            deadline = time.perf_counter() + remaining / (len(factions) - n)
+            allowed = set(by_faction[faction]) | set(by_faction.get(Faction.NEUTRAL, ()))
+            optimizer = DeckOptimizer(allowed, gauntlet, args, derive_seed(master_seed, faction.name))
+            print(f"\n=== {faction.value} ({len(allowed)} cartes possibles) ===")
+
+            def report(generation, best):
+                top = best[0]
+                print(f"[gén. {generation}] meilleur {top.fitness:.1%} sur {top.games} parties | "
+                      f"gauntlet {len(optimizer.gauntlet)} | "
+                      f"{len(optimizer.cache)} decks vus | {optimizer.games} parties", flush=True)
+                results[faction.value] = {"gauntlet": len(optimizer.gauntlet),
+                                          "best": [{"fitness": c.fitness, "games": c.games, "cards": list(c.key)} for c in best]}
+                with open(args.out, 'w', encoding='utf-8') as f:
+                    json.dump({"seed": master_seed, "decks": results}, f, indent=4, ensure_ascii=False)
+
+            best = optimizer.run(workers, deadline, report)
+            print(f"Meilleure liste {faction.value} ({best[0].fitness:.1%}) :")
+            for line in describe(best[0].key, templates):
+                print(f"  {line}")
+    print(f"\nListes écrites dans {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Lecture des journaux de parties (voir engine/journal.py).
+
+Exemples :
+    python src/replay.py parties.shj                     liste des parties
+    python src/replay.py parties.shj --game 12           rejoue la partie n°12 avec ses logs
+    python src/replay.py parties.shj --game 12 --turn 8  état au début du tour 8
+    python src/replay.py parties.shj --game 12 --scrub   navigation action par action
+"""
+import argparse
+from utils.card_manager import CardManager
+from engine.actions import ActionType, HERO
+from engine.journal import JournalReader, ReplayCursor, replay_match
+
+SCRUB_HELP = "[Entrée/n] action suivante  [p] précédente  [t N] début du tour N  [a N] après N actions  [q] quitter"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Liste, rejoue ou parcourt les parties d'un journal.")
+    parser.add_argument("journal", help="Fichier écrit par simulate.py --journal ou par le jeu")
+    parser.add_argument("--game", type=int, default=None, help="N° de la partie à rejouer")
+    parser.add_argument("--turn", type=int, default=None, help="Affiche l'état au début de ce tour")
+    parser.add_argument("--scrub", action="store_true", help="Parcourt la partie en avant et en arrière")
+    return parser.parse_args()
+
+def result_label(winner):
+    return "nulle" if winner is None else f"J{winner + 1}"
+
+def describe_action(action, card_id):
+    if action.type == ActionType.END_TURN: return "fin de tour"
+    if action.type == ActionType.PLAY_UNIT: return f"pose {card_id}"
+    target = "héros" if action.target_slot == HERO else f"slot {action.target_slot}"
+    verb = "lance" if action.type == ActionType.PLAY_RITUAL else "attaque avec"
+    return f"{verb} {card_id} -> J{action.target_side + 1} {target}"
+
+def describe_state(match):
+    lines = [f"Tour {match.turn_count}" + (" (terminée)" if match.game_over else "")]
+    for side, p in enumerate(match.players):
+        active = "*" if side == match.active else " "
+        lines.append(f"{active}J{side + 1} PV {p.health}  Mana {p.mana}/{p.max_mana}  Main {len(p.hand)}  Deck {len(p.deck)}")
+        board = ", ".join(f"{u.name} {u.current_attack}/{u.current_health}" for u in p.board)
+        lines.append(f"    Plateau : {board or '-'}")
+    return "\n".join(lines)
+
+def show(cursor):
+    actions = cursor.record.actions
+    last = describe_action(*actions[cursor.position - 1]) if cursor.position else "début de partie"
+    print(f"\n[{cursor.position}/{len(cursor)}] {last}")
+    print(describe_state(cursor.match))
+
+def scrub(cursor):
+    print(SCRUB_HELP)
+    show(cursor)
+    while True:
+        try:
+            command = input("> ").strip().split()
+        except EOFError:
+            return
+        if not command or command[0] == "n": cursor.step(1)
+        elif command[0] == "p": cursor.step(-1)
+        elif command[0] in ("t", "a") and len(command) > 1 and command[1].isdigit():
+            if command[0] == "t": cursor.seek_turn(int(command[1]))
+            else: cursor.seek(int(command[1]))
+        elif command[0] == "q": return
+        else:
+            print(SCRUB_HELP)
+            continue
+        show(cursor)
+
+def main():
+    args = parse_args()
+    reader = JournalReader(args.journal)
+    card_pool = CardManager(verbose=False).get_all_cards()
+    reader.check_pool(card_pool)
+
+    if args.game is None:
+        print(f"{'N°':>6}{'Graine':>22}{'Actions':>9}{'Tours':>7}  Résultat")
+        for n, record in enumerate(reader):
+            print(f"{n:>6}{record.seed:>22}{len(record.actions):>9}{record.turns:>7}  {result_label(record.winner) if record.complete else 'inachevée'}")
+        return
+
+    for n, record in enumerate(reader):
+        if n == args.game: break
+    else:
+        print(f"Pas de partie n°{args.game} dans ce journal")
+        return
+
+    if args.turn is not None or args.scrub:
+        cursor = ReplayCursor(record, card_pool)
+        if args.turn is not None: cursor.seek_turn(args.turn)
+        if args.scrub: scrub(cursor)
+        else: show(cursor)
+        return
+
+    match = replay_match(record, card_pool, verbose=True)
+    print(f"\nRejeu terminé (graine {record.seed}) : {result_label(match.winner)} en {match.turn_count} tours")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Simulation en masse de parties IA contre IA (sans pygame).
+
+Exemple : python src/simulate.py --games 100000 --seed 42
+Rejouer une partie avec ses logs : python src/simulate.py --replay <graine>
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import time
+from utils.card_manager import CardManager
+from engine.journal import JournalWriter
+from engine.rng import derive_seed, new_seed
+from engine.selfplay import SelfPlayStats, play_match
+
+# Chargé une seule fois par processus de travail
+_card_pool = None
+
+def _init_worker():
+    global _card_pool
+    _card_pool = CardManager(verbose=False).get_all_cards()
+
+def _play_chunk(args):
+    master_seed, first, games, max_turns, with_journal, snapshot_every = args
+    stats = SelfPlayStats()
+    # Le lot est journalisé en mémoire, le processus principal l'ajoute au fichier
+    journal = None
+    if with_journal:
+        journal = JournalWriter(io.BytesIO(), [card.id for card in _card_pool], header=False, snapshot_every=snapshot_every)
+    # La partie n°i a toujours la même graine, quel que soit le processus qui la joue
+    for i in range(first, first + games):
+        stats.record(*play_match(_card_pool, max_turns=max_turns, seed=derive_seed(master_seed, i), journal=journal))
+    return stats, journal.stream.getvalue() if journal else b''
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Parties IA contre IA en parallèle, avec statistiques par carte.")
+    parser.add_argument("--games", type=int, default=10000, help="Nombre de parties à jouer")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Nombre de processus (défaut : tous les coeurs)")
+    parser.add_argument("--chunk", type=int, default=250, help="Parties par lot envoyé à un processus")
+    parser.add_argument("--max-turns", type=int, default=200, help="Au-delà, la partie est déclarée nulle")
+    parser.add_argument("--seed", type=int, default=None, help="Graine maître (défaut : aléatoire, affichée)")
+    parser.add_argument("--replay", type=int, default=None, help="Rejoue une seule partie de cette graine, avec les logs")
+    parser.add_argument("--journal", default=None, help="Enregistre toutes les parties dans ce fichier (voir replay.py)")
+    parser.add_argument("--snapshots", type=int, default=0, help="Instantané de l'état tous les N tours dans le journal (0 = aucun)")
+    parser.add_argument("--top", type=int, default=0, help="N'afficher que les N meilleures et pires cartes (0 = toutes)")
+    return parser.parse_args()
+
+def print_progress(stats, started):
+    elapsed = time.perf_counter() - started
+    rate = stats.games / elapsed if elapsed > 0 else 0.0
+    print(f"[{stats.games} parties] J1 {stats.win_rate(0):.1%} | J2 {stats.win_rate(1):.1%} | "
+          f"nulles {stats.draws} | durée moy. {stats.average_length():.1f} tours | {rate:.0f} parties/s", flush=True)
+
+def print_card_report(stats, top=0):
+    rows = stats.card_report()
+    if top and len(rows) > 2 * top:
+        rows = rows[:top] + rows[-top:]
+    print(f"\n{'Carte':<16}{'Poses':>9}{'WR jouée':>11}{'WR non jouée':>15}{'Écart':>9}")
+    for card_id, plays, wr_played, wr_idle, delta in rows:
+        print(f"{card_id:<16}{plays:>9}{wr_played:>11.1%}{wr_idle:>15.1%}{delta:>+9.1%}")
+
+def replay(seed, max_turns):
+    match = play_match(CardManager(verbose=False).get_all_cards(), max_turns=max_turns, seed=seed, verbose=True)[0]
+    result = "nulle" if match.winner is None else f"victoire de {match.players[match.winner].name}"
+    print(f"\nFin de partie (graine {seed}) : {result} en {match.turn_count} tours")
+
+def main():
+    args = parse_args()
+    if args.replay is not None:
+        replay(args.replay, args.max_turns)
+        return
+
+    card_ids = [card.id for card in CardManager(verbose=False).get_all_cards()]
+    master_seed = new_seed() if args.seed is None else args.seed
+    print(f"Graine maître : {master_seed}")
+
+    chunks = []
+    first = 0
+    while first < args.games:
+        size = min(args.chunk, args.games - first)
+        chunks.append((master_seed, first, size, args.max_turns, args.journal is not None, args.snapshots))
+        first += size
+
+    total = SelfPlayStats(card_ids)
+    journal = JournalWriter(open(args.journal, 'wb'), card_ids) if args.journal else None
+    started = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+        for partial, records in pool.imap_unordered(_play_chunk, chunks):
+            total.merge(partial)
+            if journal: journal.stream.write(records)
+            print_progress(total, started)
+    if journal: journal.close()
+
+    print_card_report(total, args.top)
+    turns, seed = total.longest
+    if seed is not None:
+        print(f"\nPartie la plus longue : {turns} tours (--replay {seed})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Tournoi entre participants (IA + deck), avec classements Elo et Glicko.
+
+Un participant est une IA de create_ai (la même que l'adversaire de la
+scène de jeu) et un deck : une liste d'ids de cartes, ou null pour un deck
+tiré au hasard à chaque partie. Fichier --entrants (JSON) :
+
+    [{"name": "mcts-200", "ai": "mcts", "budget_ms": 200, "deck": null},
+     {"name": "greedy-hoshi", "ai": "greedy", "deck": ["hoshi_001", ...]}]
+
+Sans fichier : une entrée par mode d'IA (decks aléatoires), plus l'IA
+gloutonne avec chaque meilleure liste de decks_optimises.json s'il existe.
+
+Toutes les parties disponibles sont envoyées au pool de processus et les
+classements bougent à chaque résultat reçu. Chaque résultat est ajouté au
+fichier --results : relancer la même commande reprend là où le tournoi
+s'était arrêté (même graine, mêmes appariements).
+
+Exemple : python src/tournament.py --swiss 7 --games 4
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+from utils.card_manager import CardManager
+from engine.ai import AI_MODES, create_ai
+from engine.ratings import Elo, Glicko
+from engine.rng import derive_seed, new_seed
+from engine.selfplay import play_match
+
+# Chargés une seule fois par processus de travail
+_card_pool = None
+_templates = None
+
+def _init_worker():
+    global _card_pool, _templates
+    _card_pool = CardManager(verbose=False).get_all_cards()
+    _templates = {card.id: card.template for card in _card_pool}
+
+def _play_game(args):
+    """Une partie : `first` joue en premier. Renvoie (clé, score de `first`, tours)"""
+    key, seed, first, second, max_turns = args
+    entrants = (first, second)
+    ais = [create_ai(e["ai"], e.get("budget_ms", 100), rng=random.Random(derive_seed(seed, "ai", side)), workers=1)
+           for side, e in enumerate(entrants)]
+    decks = [[_templates[card_id] for card_id in e["deck"]] if e.get("deck") else None for e in entrants]
+    match = play_match(_card_pool, ais=ais, max_turns=max_turns, seed=seed, decks=decks)[0]
+    score = 0.5 if match.winner is None else 1.0 - match.winner
+    return key, score, match.turn_count
+
+def default_entrants(decks_file):
+    entrants = [{"name": mode, "ai": mode, "deck": None} for mode in AI_MODES]
+    if os.path.exists(decks_file):
+        with open(decks_file, 'r', encoding='utf-8') as f:
+            for faction, result in json.load(f).get("decks", {}).items():
+                entrants.append({"name": f"greedy/{faction}", "ai": "greedy", "deck": result["best"][0]["cards"]})
+    return entrants
+
+class Tournament:
+    """Résultats, classements et reprise depuis le fichier de résultats (JSON par ligne)"""
+    def __init__(self, entrants, path, seed):
+        self.entrants = {e["name"]: e for e in entrants}
+        self.path = path
+        self.seed = seed
+        self.elo = Elo()
+        self.glicko = Glicko()
+        self.done = set()
+        self.rounds = {}  # n° de ronde suisse -> appariements
+        self.stats = {name: [0, 0, 0] for name in self.entrants}  # victoires, défaites, nulles
+        self.file = None
+
+    def load(self):
+        """Relit un tournoi interrompu ; renvoie sa graine (None si rien à reprendre)"""
+        if not os.path.exists(self.path): return None
+        seed = None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip(): continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Ligne tronquée par l'interruption
+                if "seed" in entry: seed = entry["seed"]
+                elif "round" in entry: self.rounds[entry["round"]] = [tuple(pair) for pair in entry["pairs"]]
+                elif entry.get("a") in self.entrants and entry.get("b") in self.entrants:
+                    self.record(entry["key"], entry["a"], entry["b"], entry["score"])
+        if seed is not None: self.seed = seed
+        return seed
+
+    def open(self):
+        fresh = not os.path.exists(self.path)
+        self.file = open(self.path, 'a', encoding='utf-8')
+        if fresh: self.write({"seed": self.seed})
+
+    def write(self, entry):
+        self.file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def record(self, key, a, b, score):
+        self.done.add(key)
+        self.elo.update(a, b, score)
+        self.glicko.update(a, b, score)
+        for name, s in ((a, score), (b, 1 - score)):
+            self.stats[name][0 if s == 1 else 1 if s == 0 else 2] += 1
+
+    # --- Appariements ---
+    def games(self, pairs, prefix, per_pair):
+        """Parties pas encore jouées des paires, camps alternés"""
+        tasks = []
+        for a, b in pairs:
+            for n in range(per_pair):
+                key = f"{prefix}:{a}:{b}:{n}"
+                if key in self.done: continue
+                first, second = (a, b) if n % 2 == 0 else (b, a)
+                tasks.append((key, derive_seed(self.seed, key), self.entrants[first], self.entrants[second], a, b))
+        return tasks
+
+    def swiss_pairs(self, round_index):
+        """Paires de la ronde (enregistrées : une reprise retrouve les mêmes)"""
+        if round_index in self.rounds: return self.rounds[round_index]
+        played = {pair for pairs in self.rounds.values() for pair in pairs}
+        played |= {(b, a) for a, b in played}
+        order = sorted(self.entrants, key=lambda name: -self.elo.rating(name))
+        pairs = []
+        while len(order) > 1:
+            a = order.pop(0)
+            # Le plus proche au classement qu'on n'a pas encore affronté
+            b = next((name for name in order if (a, name) not in played), order[0])
+            order.remove(b)
+            pairs.append((a, b))
+        self.rounds[round_index] = pairs
+        self.write({"round": round_index, "pairs": [list(pair) for pair in pairs]})
+        return pairs
+
+    def play(self, pool, tasks, max_turns, report_every):
+        by_key = {task[0]: task for task in tasks}
+        jobs = [(key, seed, first, second, max_turns) for key, seed, first, second, _, _ in tasks]
+        for n, (key, score, turns) in enumerate(pool.imap_unordered(_play_game, jobs), 1):
+            _, _, first, _, a, b = by_key[key]
+            # Score de `a`, quel que soit le camp où il jouait
+            score_a = score if first["name"] == a else 1 - score
+            self.record(key, a, b, score_a)
+            self.write({"key": key, "a": a, "b": b, "score": score_a, "turns": turns})
+            if report_every and n % report_every == 0: self.print_table(f"{n} / {len(jobs)} parties")
+
+    def print_table(self, title):
+        print(f"\n--- {title} ---")
+        print(f"{'Participant':<24}{'V':>6}{'D':>6}{'N':>5}{'Score':>8}{'Elo':>7}{'Glicko':>14}")
+        rows = sorted(self.entrants, key=lambda name: -self.glicko.rating(name)[0])
+        for name in rows:
+            wins, losses, draws = self.stats[name]
+            games = wins + losses + draws
+            score = (wins + draws / 2) / games if games else 0.0
+            rating, rd = self.glicko.rating(name)
+            print(f"{name:<24}{wins:>6}{losses:>6}{draws:>5}{score:>8.1%}{self.elo.rating(name):>7.0f}{rating:>8.0f} ±{2 * rd:>4.0f}")
+        print(flush=True)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Tournoi toutes rondes ou suisse entre IA et decks, classements Elo/Glicko.")
+    parser.add_argument("--entrants", default=None, help="Fichier JSON des participants (défaut : un par mode d'IA)")
+    parser.add_argument("--decks", default="decks_optimises.json", help="Listes ajoutées aux participants par défaut")
+    parser.add_argument("--swiss", type=int, default=0, help="Nombre de rondes suisses (0 = toutes rondes)")
+    parser.add_argument("--games", type=int, default=10, help="Parties par paire (camps alternés)")
+    parser.add_argument("--max-turns", type=int, default=200, help="Au-delà, la partie est nulle")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Nombre de processus (défaut : tous les coeurs)")
+    parser.add_argument("--seed", type=int, default=None, help="Graine maître (défaut : aléatoire ; reprise : celle du fichier)")
+    parser.add_argument("--results", default="tournoi.jsonl", help="Fichier des résultats (reprise automatique)")
+    parser.add_argument("--report", type=int, default=50, help="Affiche le classement toutes les N parties")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.entrants:
+        with open(args.entrants, 'r', encoding='utf-8') as f:
+            entrants = json.load(f)
+    else:
+        entrants = default_entrants(args.decks)
+    if len({e["name"] for e in entrants}) != len(entrants):
+        print("Erreur : deux participants portent le même nom")
+        return
+
+    tournament = Tournament(entrants, args.results, new_seed() if args.seed is None else args.seed)
+    if tournament.load() is not None:
+        print(f"Reprise de {args.results} : {len(tournament.done)} parties déjà jouées")
+    print(f"Graine maître : {tournament.seed} | {len(entrants)} participants")
+    tournament.open()
+
+    started = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+        if args.swiss:
+            for round_index in range(args.swiss):
+                tasks = tournament.games(tournament.swiss_pairs(round_index), f"s{round_index}", args.games)
+                tournament.play(pool, tasks, args.max_turns, args.report)
+                tournament.print_table(f"Ronde {round_index + 1} / {args.swiss}")
+        else:
+            pairs = list(itertools.combinations(sorted(tournament.entrants), 2))
+            tournament.play(pool, tournament.games(pairs, "rr", args.games), args.max_turns, args.report)
+    tournament.file.close()
+    tournament.print_table(f"Classement final ({time.perf_counter() - started:.0f} s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Règle les poids de l'évaluation (engine.evaluation) sur des parties simulées.
+
+Chaque fin de tour donne un exemple : les caractéristiques de la position
+du point de vue du joueur qui vient de jouer, et s'il a gagné la partie.
+Les poids sont ceux d'une régression logistique (méthode de Newton,
+pénalité L2), écrits dans eval_weights.json.
+
+Exemple : python src/tune_eval.py --games 4000 --seed 1
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import time
+from utils.card_manager import CardManager
+from engine.ai import GreedyAI, EvalAI
+from engine.evaluation import FEATURES, WEIGHTS_FILE, Evaluator, extract, np
+from engine.match import Match
+from engine.rng import derive_seed, new_seed
+
+_card_pool = None
+
+def _init_worker():
+    global _card_pool
+    _card_pool = CardManager(verbose=False).get_all_cards()
+
+def make_ai(mode, rng):
+    return EvalAI() if mode == "eval" else GreedyAI(rng)
+
+def _play_chunk(args):
+    """Exemples (caractéristiques, victoire) des parties first..first+games"""
+    master_seed, first, games, mode, max_turns = args
+    rows, labels = [], []
+    for i in range(first, first + games):
+        match = Match(_card_pool, ai_sides=(True, True), verbose=False, seed=derive_seed(master_seed, i))
+        ais = [make_ai(mode, match.streams.get(f"ai:{side}")) for side in (0, 1)]
+        game_rows = []
+        while not match.game_over and match.turn_count < max_turns:
+            ais[match.active].play_turn(match)
+            if not match.game_over: game_rows.append((extract(match, match.active), match.active))
+            match.end_turn()
+        if match.winner is None: continue  # Partie nulle : rien à apprendre
+        for features, side in game_rows:
+            rows.append(features)
+            labels.append(1.0 if match.winner == side else 0.0)
+    return rows, labels
+
+def fit(rows, labels, l2=1.0, iterations=12):
+    """Poids de la régression logistique sans biais (le score reste antisymétrique)"""
+    d = len(FEATURES)
+    w = [0.0] * d
+    for _ in range(iterations):
+        # Gradient et hessienne de la log-vraisemblance pénalisée
+        grad = [l2 * x for x in w]
+        hess = [[l2 if i == j else 0.0 for j in range(d)] for i in range(d)]
+        if np is not None:
+            X = np.array(rows, dtype=float)
+            p = 1.0 / (1.0 + np.exp(-np.clip(X @ np.array(w), -60, 60)))
+            grad = (np.array(grad) + X.T @ (p - np.array(labels))).tolist()
+            hess = (np.array(hess) + (X * (p * (1 - p))[:, None]).T @ X).tolist()
+        else:
+            for row, y in zip(rows, labels):
+                p = 1.0 / (1.0 + math.exp(-max(-60.0, min(60.0, sum(a * b for a, b in zip(w, row))))))
+                r = p * (1 - p)
+                for i, xi in enumerate(row):
+                    if not xi: continue
+                    grad[i] += (p - y) * xi
+                    hess_i = hess[i]
+                    for j, xj in enumerate(row):
+                        hess_i[j] += r * xi * xj
+        step = solve(hess, grad)
+        w = [a - b for a, b in zip(w, step)]
+        if max(abs(x) for x in step) < 1e-6: break
+    return w
+
+def solve(matrix, vector):
+    """Résout matrix . x = vector (Gauss avec pivot partiel, petites dimensions)"""
+    n = len(vector)
+    a = [row[:] + [vector[i]] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        a[col], a[pivot] = a[pivot], a[col]
+        if abs(a[col][col]) < 1e-12: continue
+        for r in range(col + 1, n):
+            factor = a[r][col] / a[col][col]
+            if factor:
+                for c in range(col, n + 1): a[r][c] -= factor * a[col][c]
+    x = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        if abs(a[r][r]) < 1e-12: continue
+        x[r] = (a[r][n] - sum(a[r][c] * x[c] for c in range(r + 1, n))) / a[r][r]
+    return x
+
+def report(name, evaluator, rows, labels):
+    """Log-loss et précision d'un évaluateur sur des exemples"""
+    loss = hits = 0.0
+    for row, y in zip(rows, labels):
+        p = min(1 - 1e-9, max(1e-9, 1.0 / (1.0 + math.exp(-max(-60.0, min(60.0, evaluator.linear(row)))))))
+        loss -= y * math.log(p) + (1 - y) * math.log(1 - p)
+        hits += (p > 0.5) == (y > 0.5)
+    print(f"{name:<10} log-loss {loss / len(rows):.4f} | précision {hits / len(rows):.1%}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Règle les poids de l'évaluation sur des parties IA contre IA.")
+    parser.add_argument("--games", type=int, default=2000, help="Nombre de parties simulées")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Nombre de processus (défaut : tous les coeurs)")
+    parser.add_argument("--chunk", type=int, default=100, help="Parties par lot envoyé à un processus")
+    parser.add_argument("--ai", choices=("greedy", "eval"), default="greedy", help="IA des deux camps")
+    parser.add_argument("--max-turns", type=int, default=200, help="Au-delà, la partie est nulle (ignorée)")
+    parser.add_argument("--l2", type=float, default=1.0, help="Pénalité L2 des poids")
+    parser.add_argument("--seed", type=int, default=None, help="Graine maître (défaut : aléatoire, affichée)")
+    parser.add_argument("--out", default=WEIGHTS_FILE, help="Fichier de poids écrit")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    master_seed = new_seed() if args.seed is None else args.seed
+    print(f"Graine maître : {master_seed} ({'NumPy' if np is not None else 'Python pur'})")
+
+    chunks = [(master_seed, first, min(args.chunk, args.games - first), args.ai, args.max_turns)
+              for first in range(0, args.games, args.chunk)]
+    rows, labels = [], []
+    started = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+        for chunk_rows, chunk_labels in pool.imap(_play_chunk, chunks):
+            rows += chunk_rows
+            labels += chunk_labels
+    print(f"{len(rows)} positions en {time.perf_counter() - started:.1f} s")
+    if not rows: return
+
+    # Un cinquième des exemples (mélangés avec la graine) sert à vérifier
+    order = list(range(len(rows)))
+    random.Random(master_seed).shuffle(order)
+    cut = len(order) // 5
+    test = [rows[i] for i in order[:cut]], [labels[i] for i in order[:cut]]
+    train = [rows[i] for i in order[cut:]], [labels[i] for i in order[cut:]]
+
+    started = time.perf_counter()
+    tuned = Evaluator(dict(zip(FEATURES, fit(*train, l2=args.l2))))
+    print(f"Régression en {time.perf_counter() - started:.1f} s")
+    report("Actuels", Evaluator.load(args.out), *test)
+    report("Réglés", tuned, *test)
+    for name, weight in zip(FEATURES, tuned.weights):
+        print(f"  {name:<18}{weight:>+9.4f}")
+
+    tuned.save(args.out, info={"games": args.games, "ai": args.ai, "seed": master_seed, "positions": len(rows)})
+    print(f"Poids écrits dans {os.path.normpath(args.out)}")
+
+if __name__ == "__main__":
+    main()
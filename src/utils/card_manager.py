@@ -14,7 +14,7 @@ if src_dir not in sys.path:
 # --- IMPORTS ---
 try:
     # Maintenant Python trouve 'models' car il connait 'src'
-    from models.card_types import UnitCard, SpellCard
+    from models.card_types import CardTemplate
 except ImportError as e:
     print(f"CRITICAL ERROR: Impossible d'importer les modèles. ({e})")
     # On affiche les chemins connus pour aider au debug
@@ -22,8 +22,11 @@ except ImportError as e:
     sys.exit(1)
 
 class CardManager:
-    def __init__(self):
+    def __init__(self, verbose=True):
         self.cards = []
+        self.templates = []
+        self.templates_by_id = {}
+        self.verbose = verbose
         # Chemin vers cards.json (remonte de utils/ vers la racine du projet)
         self.filepath = os.path.join(src_dir, '..', 'cards.json')
         self.load_cards()
@@ -35,18 +38,19 @@ class CardManager:
                     data = json.load(f)
                     raw_list = data.get('cards', [])
                     
-                    self.cards = []
-                    for item in raw_list:
-                        # Détection automatique du type
-                        if "puissance" in item:
-                            self.cards.append(UnitCard(item))
-                        else:
-                            self.cards.append(SpellCard(item))
+                    # Templates immuables construits une seule fois, puis un
+                    # exemplaire de chaque pour la collection
+                    self.templates = [CardTemplate(item) for item in raw_list]
+                    self.templates_by_id = {t.id: t for t in self.templates}
+                    self.cards = [t.create() for t in self.templates]
                             
-                    print(f"Succès : {len(self.cards)} cartes chargées.")
+                    if self.verbose:
+                        print(f"Succès : {len(self.cards)} cartes chargées.")
             except Exception as e:
                 print(f"Erreur lors du chargement JSON : {e}")
                 self.cards = []
+                self.templates = []
+                self.templates_by_id = {}
         else:
             print(f"Attention : Fichier introuvable à {self.filepath}")
             # On cherche à comprendre où il cherche
@@ -54,4 +58,7 @@ class CardManager:
             self.cards = []
 
     def get_all_cards(self):
-        return self.cards
\ No newline at end of file
+        return self.cards
+
+    def get_template(self, card_id):
+        return self.templates_by_id.get(card_id)
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Textes flottants (dégâts, soins, statuts) : pool d'objets réutilisés, dessinés en un seul blits().
+
+Le texte et son contour sont rastérisés une fois dans une même surface ;
+les niveaux de fondu sont des copies en cache (quelques niveaux par texte).
+La durée de vie est en millisecondes, indépendante des FPS.
+"""
+import pygame
+import constants.colors as colors
+from utils.fonts import TEXT, get_font
+from utils.surface_cache import SurfaceCache
+
+LIFETIME_MS = 1000
+FADE_MS = 333        # Fondu sur la fin de vie
+RISE_PX_PER_S = 90   # Montée (1,5 px par frame à 60 FPS)
+FADE_LEVELS = 16
+MAX_TEXTS = 64       # Au-delà, les plus anciens sont recyclés
+
+class FloatingText:
+    __slots__ = ('x', 'y', 'born', 'key', 'surface')
+
+class FloatingTextPool:
+    def __init__(self, size=24):
+        self.font = get_font(TEXT, size, bold=True)
+        self.active = []
+        self.free = []
+        self.surfaces = SurfaceCache(max_size=256)
+        self.batch = []
+
+    def spawn(self, x, y, text, color, now=None):
+        if len(self.active) >= MAX_TEXTS:
+            self.free.append(self.active.pop(0))
+        effect = self.free.pop() if self.free else FloatingText()
+        effect.x = x
+        effect.y = y
+        effect.born = pygame.time.get_ticks() if now is None else now
+        effect.key = (text, tuple(color))
+        effect.surface = self.level(effect.key, FADE_LEVELS)
+        self.active.append(effect)
+
+    def level(self, key, level):
+        """Surface du texte (contour compris) au niveau de fondu `level` (FADE_LEVELS = opaque)"""
+        return self.surfaces.get(key + (level,), lambda: self.render(key, level))
+
+    def render(self, key, level):
+        if level < FADE_LEVELS:
+            surface = self.level(key, FADE_LEVELS).copy()
+            surface.set_alpha(255 * level // FADE_LEVELS)
+            return surface
+        text, color = key
+        # Contour noir décalé pour la lisibilité, puis le texte
+        outline = self.font.render(text, True, colors.SUMI_BLACK)
+        fill = self.font.render(text, True, color)
+        surface = pygame.Surface((fill.get_width() + 2, fill.get_height() + 2), pygame.SRCALPHA)
+        surface.blit(outline, (2, 2))
+        surface.blit(fill, (0, 0))
+        return surface
+
+    def update(self, now=None):
+        now = pygame.time.get_ticks() if now is None else now
+        alive = []
+        for effect in self.active:
+            age = now - effect.born
+            if age >= LIFETIME_MS:
+                self.free.append(effect)
+                continue
+            remaining = LIFETIME_MS - age
+            level = FADE_LEVELS if remaining >= FADE_MS else 1 + remaining * (FADE_LEVELS - 1) // FADE_MS
+            effect.surface = self.level(effect.key, level)
+            alive.append(effect)
+        self.active = alive
+        # Positions préparées ici : draw() n'a plus qu'un blits() à faire.
+        # Centré sur le texte, pas sur le contour (+1 : moitié du décalage)
+        self.batch = [(e.surface, e.surface.get_rect(center=(e.x + 1, e.y + 1 - RISE_PX_PER_S * (now - e.born) / 1000)))
+                      for e in alive]
+
+    def draw(self, screen):
+        if self.batch: screen.blits(self.batch, doreturn=False)
+
+    def clear(self):
+        self.free.extend(self.active)
+        self.active = []
+        self.batch = []
+
+    def __len__(self):
+        return len(self.active)
@@ -0,0 +1,59 @@
+"""Registre des polices : chaque famille système est cherchée une seule fois,
+chaque police (famille, taille, gras) n'est chargée qu'au premier usage.
+
+pygame.font.SysFont refait la recherche (et charge le fichier) à chaque
+appel ; sous Linux, la première recherche énumère toutes les polices
+du système.
+"""
+import pygame
+
+# Familles du jeu (noms séparés par des virgules, comme pour SysFont)
+TITLE = 'cinzel, trajan, georgia'
+TEXT = 'arial, sans-serif'
+
+_files = {}  # (famille, gras) -> (fichier ou None, gras à simuler)
+_fonts = {}  # (famille, taille, gras) -> pygame.font.Font
+
+def resolve(family, bold=False):
+    """Fichier de la famille (None : police par défaut) et s'il faut simuler le gras"""
+    key = (family, bold)
+    if key not in _files:
+        path = pygame.font.match_font(family, bold=bold)
+        # Même règle que SysFont : sans fichier gras, le gras est simulé
+        fake_bold = bold and (path is None or path == pygame.font.match_font(family))
+        _files[key] = (path, fake_bold)
+    return _files[key]
+
+def get_font(family, size, bold=False):
+    """Police partagée (ne pas changer ses réglages : gras, italique...)"""
+    key = (family, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        path, fake_bold = resolve(family, bold)
+        try:
+            font = pygame.font.Font(path, size)
+        except (OSError, pygame.error):
+            font = pygame.font.Font(None, size)
+            fake_bold = bold
+        if fake_bold: font.set_bold(True)
+        _fonts[key] = font
+    return font
+
+class LazyFont:
+    """Attribut de classe : `self.font_x` donne la police, chargée au premier accès"""
+    def __init__(self, family, size, bold=False):
+        self.key = (family, size, bold)
+
+    def __get__(self, obj, owner=None):
+        font = _fonts.get(self.key)
+        return font if font is not None else get_font(*self.key)
+
+class FontTable(dict):
+    """Polices nommées ({'title': (famille, taille, gras)...}), chargées au premier accès"""
+    def __init__(self, specs):
+        super().__init__()
+        self.specs = specs
+
+    def __missing__(self, name):
+        font = self[name] = get_font(*self.specs[name])
+        return font
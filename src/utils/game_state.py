@@ -1,27 +1,59 @@
 import pygame
 import os
 import constants.colors as colors
+from utils.fonts import TITLE, FontTable, get_font
+from utils.surface_cache import SurfaceCache
+
+DIGITS = "0123456789-"
 
 class GameState:
+    # Textes rendus, partagés par tous les états (clé : police, texte, couleur, lissage)
+    text_cache = SurfaceCache(max_bytes=16 * 1024 * 1024)
+    # (police, couleur) -> glyphes des chiffres, pour composer les nombres sans rastérisation
+    digit_strips = {}
+    # Couches plein écran pré-composées (fond, voiles), partagées par les états.
+    # Clé : (nom, largeur, hauteur) ; vidé quand le mode d'affichage change
+    layers = SurfaceCache(max_size=8)
+
     def __init__(self, game_manager):
         self.game = game_manager
         self.screen = game_manager.screen
         self.width = self.screen.get_width()
         self.height = self.screen.get_height()
+        self.background = None  # Composé par on_resize (ou au premier dessin)
         
-        # --- Polices (Fonts) ---
-        self.fonts = {
-            'title': self.get_font(90, bold=True),
-            'subtitle': self.get_font(32),
-            'button': self.get_font(44),
-            'small': self.get_font(24)
-        }
+        # --- Polices (Fonts), chargées au premier usage (utils.fonts) ---
+        self.fonts = FontTable({
+            'title': (TITLE, 90, True),
+            'subtitle': (TITLE, 32, False),
+            'button': (TITLE, 44, False),
+            'small': (TITLE, 24, False)
+        })
 
     def get_font(self, size, bold=False):
-        try:
-            return pygame.font.SysFont('cinzel, trajan, georgia', size, bold=bold)
-        except:
-            return pygame.font.Font(None, size)
+        return get_font(TITLE, size, bold)
+
+    def render_text(self, font, text, color, antialias=True):
+        """font.render en cache : la surface rendue est partagée, ne pas la modifier"""
+        return self.text_cache.get((font, text, tuple(color), antialias), lambda: font.render(text, antialias, color))
+
+    def render_number(self, font, value, color):
+        """Nombre composé à partir des glyphes des chiffres (rendus une fois par police et couleur)"""
+        return self.text_cache.get((font, int(value), tuple(color)), lambda: self.compose_number(font, str(int(value)), color))
+
+    def compose_number(self, font, text, color):
+        key = (font, tuple(color))
+        strip = self.digit_strips.get(key)
+        if strip is None:
+            strip = self.digit_strips[key] = {digit: font.render(digit, True, color) for digit in DIGITS}
+        glyphs = [strip[digit] for digit in text]
+        surface = pygame.Surface((sum(g.get_width() for g in glyphs), max(g.get_height() for g in glyphs)), pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            # Surface vide et glyphes disjoints : MAX recopie les pixels tels quels
+            surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += glyph.get_width()
+        return surface
 
     def load_image(self, filename, width=None):
         """Charge une image depuis assets/images/"""
@@ -38,25 +70,42 @@ class GameState:
             print(f"Erreur chargement image {filename}: {e}")
             return None
 
-    def draw_background(self):
+    def layer(self, name, render):
+        """Couche `name` à la taille de l'écran, composée par render() une seule fois"""
+        return self.layers.get((name, self.width, self.height), render)
+
+    def compose_background(self):
         """Le fond commun Washi + Bordures"""
-        self.screen.fill(colors.WASHI_COLOR)
+        surface = pygame.Surface((self.width, self.height)).convert()
+        surface.fill(colors.WASHI_COLOR)
         
         # Bordures
         border_width = 40
         # Gauche
-        pygame.draw.rect(self.screen, colors.INDIGO, (0, 0, border_width, self.height))
-        pygame.draw.line(self.screen, colors.GOLD_LEAF, (border_width-2, 0), (border_width-2, self.height), 2)
+        pygame.draw.rect(surface, colors.INDIGO, (0, 0, border_width, self.height))
+        pygame.draw.line(surface, colors.GOLD_LEAF, (border_width-2, 0), (border_width-2, self.height), 2)
         # Droite
-        pygame.draw.rect(self.screen, colors.INDIGO, (self.width - border_width, 0, border_width, self.height))
-        pygame.draw.line(self.screen, colors.GOLD_LEAF, (self.width - border_width+2, 0), (self.width - border_width+2, self.height), 2)
+        pygame.draw.rect(surface, colors.INDIGO, (self.width - border_width, 0, border_width, self.height))
+        pygame.draw.line(surface, colors.GOLD_LEAF, (self.width - border_width+2, 0), (self.width - border_width+2, self.height), 2)
         
         # Motif Vagues (Seigaiha) en haut et bas
-        self.draw_waves(0, True)
-        self.draw_waves(self.height - 40, False)
+        self.draw_waves(0, True, surface)
+        self.draw_waves(self.height - 40, False, surface)
+        return surface
+
+    def compose_overlay(self, alpha):
+        """Voile noir plein écran"""
+        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        return overlay
+
+    def draw_background(self):
+        if self.background is None: self.background = self.layer("fond", self.compose_background)
+        self.screen.blit(self.background, (0, 0))
 
-    def draw_waves(self, y, top=True):
+    def draw_waves(self, y, top=True, surface=None):
         """Dessine les petites vagues bleues (optionnel mais joli)"""
+        surface = surface or self.screen
         wave_color = (*colors.INDIGO, 80) # Indigo transparent
         surf = pygame.Surface((self.width, 40), pygame.SRCALPHA)
         for i in range(0, self.width, 40):
@@ -64,7 +113,7 @@ class GameState:
                 pygame.draw.arc(surf, wave_color, (i, -10, 40, 40), 3.14, 6.28, 2)
             else:
                 pygame.draw.arc(surf, wave_color, (i, 10, 40, 40), 0, 3.14, 2)
-        self.screen.blit(surf, (0, y))
+        surface.blit(surf, (0, y))
 
     def handle_events(self, events):
         pass
@@ -80,4 +129,6 @@ class GameState:
         self.width = width
         self.height = height
         # Update the reference to the screen
-        self.screen = self.game.screen
\ No newline at end of file
+        self.screen = self.game.screen
+        # Couches statiques à la nouvelle taille (déjà en cache si un autre état l'a composée)
+        self.background = self.layer("fond", self.compose_background)
\ No newline at end of file
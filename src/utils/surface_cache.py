@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+class SurfaceCache:
+    """Surfaces pré-rendues, indexées par tout ce qui change leur aspect (LRU borné).
+
+    La clé doit contenir tout l'état visible : quand il change, la clé
+    change, et l'ancienne surface finit par être évincée. Borne en nombre
+    de surfaces (max_size) et/ou en octets de pixels (max_bytes).
+    Les surfaces rendues sont partagées : ne jamais les modifier.
+    """
+    def __init__(self, max_size=None, max_bytes=None):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """Surface de `key`, rendue par render() si elle n'est pas en cache"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.surfaces[key] = render()
+        self.bytes += size_of(surface)
+        while len(self.surfaces) > 1 and ((self.max_size and len(self.surfaces) > self.max_size)
+                                          or (self.max_bytes and self.bytes > self.max_bytes)):
+            self.bytes -= size_of(self.surfaces.popitem(last=False)[1])
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def __repr__(self):
+        return f"<SurfaceCache {len(self)} surfaces, {self.bytes // 1024} Ko, succès {self.hit_rate:.1%}>"
+
+def size_of(surface):
+    """Octets de pixels d'une surface"""
+    return surface.get_pitch() * surface.get_height()
@@ -0,0 +1,80 @@
+"""LethalSolver comparé à une recherche exhaustive (python -m pytest tests)."""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.card_manager import CardManager
+from constants.enums import Keyword
+from engine.actions import ActionType
+from engine.ai import GreedyAI
+from engine.lethal import LethalSolver
+from engine.match import Match
+
+CARD_POOL = CardManager(verbose=False).get_all_cards()
+TEMPLATES = {card.id: card.template for card in CARD_POOL}
+
+def position(mine, theirs, foe_health, hand=(), mana=0):
+    """Plateaux imposés ([(attaque, PV, compétences)]) et main du camp actif (ids)"""
+    match = Match(CARD_POOL, ai_sides=(True, True), verbose=False, seed=0)
+    me, foe = match.current, match.players[1 - match.active]
+    foe.health = foe_health
+    me.mana = mana
+    for player, units, ready in ((me, mine, True), (foe, theirs, False)):
+        player.hand = [TEMPLATES[card_id].create() for card_id in hand] if ready else []
+        player.board = []
+        for attack, health, keywords in units:
+            unit = TEMPLATES["card_006"].create()  # Sans compétence ni effet
+            unit.current_attack = attack
+            unit.current_health = unit.max_health = health
+            unit.keywords = Keyword(keywords)
+            unit.can_attack = ready
+            unit.attacks_left = int(ready)
+            player.add_to_board(unit)
+        player.rebuild_indexes()
+    match.touch()
+    return match
+
+def brute_force(match, side):
+    """Existe-t-il une suite d'actions du tour qui gagne ? (toutes les actions légales)"""
+    if match.game_over: return match.winner == side
+    for action in match.legal_actions():
+        if action.type == ActionType.END_TURN: continue
+        state = match.clone()
+        if state.apply(action) and brute_force(state, side): return True
+    return False
+
+def wins(match, actions):
+    state = match.clone()
+    return all(state.apply(action) for action in actions) and state.game_over and state.winner == match.active
+
+class LethalSolverTest(unittest.TestCase):
+    def test_taunts_paired_in_order(self):
+        # Provocations 3 et 7 PV, attaquants 5 et 7 : 5 -> 3 PV et 7 -> 7 PV perdent 12
+        # d'attaque (14 en croisant). Le 1, monté à 5 par deux Affûtage Katana, finit au visage
+        taunt = int(Keyword.TAUNT)
+        match = position([(1, 9, 0), (5, 9, 0), (7, 9, 0)], [(1, 3, taunt), (1, 7, taunt)], foe_health=5,
+                         hand=("rituel_002", "rituel_002"), mana=2)
+        self.assertTrue(brute_force(match.clone(), match.active))
+        actions = LethalSolver(max_nodes=10**6).find(match)
+        self.assertIsNotNone(actions)
+        self.assertTrue(wins(match, actions))
+
+    def test_matches_brute_force(self):
+        for seed in range(30):
+            match = Match(CARD_POOL, ai_sides=(True, True), verbose=False, seed=seed)
+            ais = (GreedyAI(match.streams.get("ai:0")), GreedyAI(match.streams.get("ai:1")))
+            while not match.game_over and match.turn_count < 60:
+                # Recherche exhaustive limitée aux petites positions
+                if len(match.legal_actions()) <= 10:
+                    actions = LethalSolver(max_nodes=10**6).find(match)
+                    if actions is None:
+                        self.assertFalse(brute_force(match.clone(), match.active), f"graine {seed}, tour {match.turn_count}")
+                    else:
+                        self.assertTrue(wins(match, actions), f"graine {seed}, tour {match.turn_count}")
+                ais[match.active].play_turn(match)
+                match.end_turn()
+
+if __name__ == "__main__":
+    unittest.main()